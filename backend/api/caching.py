@@ -0,0 +1,122 @@
+# exam-sync-v2/backend/api/caching.py
+
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from rest_framework.response import Response
+
+# ============================================================
+# TABLE VERSIONS
+# ============================================================
+# Every cached payload is keyed by the version of each table it was built
+# from. Writes bump the version (see api/signals.py), so stale entries are
+# simply never looked up again and can live for hours instead of minutes.
+
+VERSION_KEY_PREFIX = 'table_version'
+
+
+def _version_key(table):
+    return f"{VERSION_KEY_PREFIX}:{table}"
+
+
+def _new_version():
+    # Time-based seed so a version key that was evicted from the shared cache
+    # never comes back with a value an older payload was stored under.
+    return int(time.time() * 1000)
+
+
+def get_table_versions(tables):
+    """
+    Return the current version of each table, in the order given.
+    Versions live in the shared default cache so every worker sees the same value.
+    """
+    keys = [_version_key(table) for table in tables]
+    found = cache.get_many(keys)
+
+    versions = []
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            cache.add(key, _new_version(), timeout=None)
+            version = cache.get(key)
+        versions.append(version)
+    return tuple(versions)
+
+
+def bump_table_version(table):
+    """
+    Invalidate every cached payload built from `table`.
+    Call this after writes that bypass model signals (queryset.update, bulk_create).
+    """
+    key = _version_key(table)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _new_version(), timeout=None)
+
+
+# ============================================================
+# REFERENCE LIST CACHE
+# ============================================================
+
+def reference_cache():
+    return caches['reference']
+
+
+def versioned_cache_key(name, tables, request=None):
+    versions = '.'.join(str(v) for v in get_table_versions(tables))
+    key = f"{name}:{versions}"
+    if request is not None and request.GET:
+        query = '&'.join(
+            f"{param}={','.join(values)}" for param, values in sorted(request.GET.lists())
+        )
+        key = f"{key}:{query}"
+    return key
+
+
+def cached_reference_list(*tables):
+    """
+    Cache the GET response data of a reference-data list view until one of
+    `tables` is written to. Must sit below @api_view / @permission_classes so
+    it receives the DRF request and can cache `response.data`.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+
+            store = reference_cache()
+            cache_key = versioned_cache_key(view_func.__name__, tables, request)
+            data = store.get(cache_key)
+            if data is not None:
+                return Response(data)
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                store.set(cache_key, response.data, timeout=settings.REFERENCE_CACHE_TIMEOUT)
+            return response
+
+        return wrapper
+    return decorator
+
+
+# ============================================================
+# PER-USER ROLES
+# ============================================================
+# A user's roles embed role, college and department names, so cached entries
+# are keyed by those tables' versions as well. TblUserRole writes drop the
+# affected user's entry directly (see api/signals.py).
+
+USER_ROLE_NAME_TABLES = ('tbl_roles', 'tbl_college', 'tbl_department')
+
+
+def user_roles_cache_keys(user_ids):
+    versions = '.'.join(str(v) for v in get_table_versions(USER_ROLE_NAME_TABLES))
+    return {user_id: f"user_roles:{user_id}:{versions}" for user_id in user_ids}
+
+
+def invalidate_user_roles(user_id):
+    cache.delete_many(list(user_roles_cache_keys([user_id]).values()))
@@ -0,0 +1,319 @@
+# exam-sync-v2/backend/api/exports.py
+
+import csv
+import hashlib
+import io
+import posixpath
+import tempfile
+from itertools import groupby
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+
+from .caching import get_table_versions
+from .models import TblCollege, TblExamdetails, TblScheduleapproval, TblScheduleFooter, TblUsers
+
+# ============================================================
+# SCHEDULE EXPORTS
+# ============================================================
+# A college's approved schedule rendered to CSV, XLSX or PDF on the server.
+# Exam rows are streamed from the database into a spooled temp file and the
+# result is saved to the default storage under a name derived from the
+# approval and the versions of every table the document reads:
+#
+#   exports/<college>/<version>.pdf
+#
+# Every dean and chair downloading the same approved schedule gets that one
+# stored file; any write to the schedule, footer or names bumps a table
+# version, so the next download renders a new file and prunes the old one.
+
+EXPORT_TABLES = (
+    'tbl_scheduleapproval', 'tbl_examdetails', 'tbl_schedule_footer',
+    'tbl_users', 'tbl_college',
+)
+
+# format -> (content type, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+    'pdf': ('application/pdf', 'pdf'),
+}
+
+COLUMNS = ['Date', 'Start', 'End', 'Course', 'Sections', 'Program', 'Building', 'Room', 'Instructors', 'Proctors']
+
+ROW_CHUNK_SIZE = 500
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+EXPORT_ATTEMPTS = 3
+
+
+class ExportUnavailable(Exception):
+    """The library for the requested format isn't installed."""
+
+
+def approved_schedule(college_name):
+    """
+    The college's latest TblScheduleapproval, picked as the schedule viewer
+    picks it, when that one is approved; None otherwise. A newer pending or
+    rejected submission means the schedule changed after the last approval.
+    """
+    latest = TblScheduleapproval.objects.filter(
+        college_name=college_name,
+    ).order_by('-submitted_at').first()
+    if latest is None or (latest.status or '').lower() != 'approved':
+        return None
+    return latest
+
+
+def schedule_footer(college_name):
+    """The college's TblScheduleFooter, the shared one, or the model defaults."""
+    college_ids = TblCollege.objects.filter(
+        Q(college_id=college_name) | Q(college_name=college_name)
+    ).values('college_id')
+    return (
+        TblScheduleFooter.objects.filter(college_id__in=college_ids).first()
+        or TblScheduleFooter.objects.filter(college__isnull=True).first()
+        or TblScheduleFooter()
+    )
+
+
+def _exams(approval):
+    """The approval's exams; schedule_data narrows them to one period when it names one."""
+    exams = TblExamdetails.objects.filter(college_name=approval.college_name)
+    data = approval.schedule_data if isinstance(approval.schedule_data, dict) else {}
+    for field in ('exam_period', 'semester', 'academic_year'):
+        if data.get(field):
+            exams = exams.filter(**{f'{field}__iexact': str(data[field]).strip()})
+    return exams.order_by('exam_date', 'exam_start_time', 'room_id')
+
+
+def _format_time(value):
+    if value is None:
+        return ''
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.strftime('%I:%M %p')
+
+
+def schedule_rows(approval):
+    """Yield one list per exam, in COLUMNS order, without loading the schedule at once."""
+    names = {
+        user_id: f"{first} {last}"
+        for user_id, first, last in TblUsers.objects.values_list('user_id', 'first_name', 'last_name')
+    }
+
+    def people(ids, fallback=None):
+        ids = ids or ([fallback] if fallback else [])
+        return ', '.join(names.get(user_id, str(user_id)) for user_id in ids)
+
+    exams = _exams(approval).values_list(
+        'exam_date', 'exam_start_time', 'exam_end_time', 'course_id', 'sections', 'section_name',
+        'program_id', 'building_name', 'room_id', 'instructors', 'instructor_id', 'proctors', 'proctor_id',
+    )
+    for (exam_date, start, end, course_id, sections, section_name, program_id, building, room_id,
+         instructors, instructor_id, proctors, proctor_id) in exams.iterator(chunk_size=ROW_CHUNK_SIZE):
+        yield [
+            exam_date or '',
+            _format_time(start),
+            _format_time(end),
+            course_id,
+            ', '.join(sections or ([section_name] if section_name else [])),
+            program_id,
+            building or '',
+            room_id,
+            people(instructors, instructor_id),
+            people(proctors, proctor_id),
+        ]
+
+
+def _title_lines(approval):
+    data = approval.schedule_data if isinstance(approval.schedule_data, dict) else {}
+    period = ' '.join(str(data[f]) for f in ('exam_period', 'semester') if data.get(f))
+    year = f"A.Y. {data['academic_year']}" if data.get('academic_year') else ''
+    return [f"{approval.college_name} Examination Schedule", ' | '.join(p for p in (period, year) if p)]
+
+
+def _footer_lines(footer):
+    return [
+        ['Prepared by:', footer.prepared_by_name or '', footer.prepared_by_title or ''],
+        ['Approved by:', footer.approved_by_name or '', footer.approved_by_title or ''],
+        [footer.address_line or ''],
+        [footer.contact_line or ''],
+    ]
+
+
+# Writers
+# ------------------------------
+def write_csv(out, approval, footer):
+    text = io.TextIOWrapper(out, encoding='utf-8-sig', newline='')
+    writer = csv.writer(text)
+    for line in _title_lines(approval):
+        writer.writerow([line])
+    writer.writerow(COLUMNS)
+    writer.writerows(schedule_rows(approval))
+    writer.writerow([])
+    writer.writerows(_footer_lines(footer))
+    text.flush()
+    text.detach()
+
+
+def write_xlsx(out, approval, footer):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise ExportUnavailable('XLSX export needs openpyxl installed on the server')
+
+    # write_only streams rows to disk instead of keeping every cell object
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Schedule')
+    for line in _title_lines(approval):
+        sheet.append([line])
+    sheet.append(COLUMNS)
+    for row in schedule_rows(approval):
+        sheet.append(row)
+    sheet.append([])
+    for line in _footer_lines(footer):
+        sheet.append(line)
+    workbook.save(out)
+
+
+def _logo_reader(footer):
+    """ImageReader for a footer logo kept in our media storage, or None."""
+    from reportlab.lib.utils import ImageReader
+
+    path = urlparse(footer.logo_url or '').path
+    if not path.startswith(settings.MEDIA_URL):
+        return None
+    try:
+        with default_storage.open(path[len(settings.MEDIA_URL):]) as logo:
+            return ImageReader(io.BytesIO(logo.read()))
+    except Exception:
+        return None
+
+
+def write_pdf(out, approval, footer):
+    try:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.lib.units import mm
+        from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    except ImportError:
+        raise ExportUnavailable('PDF export needs reportlab installed on the server')
+
+    page_w, page_h = landscape(A4)
+    styles = getSampleStyleSheet()
+    cell = styles['BodyText'].clone('cell', fontSize=7.5, leading=9)
+    logo = _logo_reader(footer)
+
+    def decorate(canvas, doc):
+        canvas.saveState()
+        # Same watermark the browser export stamps on approved schedules
+        canvas.setFont('Helvetica-Bold', 90)
+        canvas.setFillColor(colors.Color(0.7, 0.7, 0.7, alpha=0.18))
+        canvas.translate(page_w / 2, page_h / 2)
+        canvas.rotate(45)
+        canvas.drawCentredString(0, -30, 'APPROVED')
+        canvas.restoreState()
+
+        canvas.saveState()
+        canvas.setFont('Helvetica', 8)
+        y = 22 * mm
+        canvas.drawString(12 * mm, y, f"Prepared by: {footer.prepared_by_name or ''}")
+        canvas.drawString(12 * mm, y - 10, footer.prepared_by_title or '')
+        canvas.drawRightString(page_w - 12 * mm, y, f"Approved by: {footer.approved_by_name or ''}")
+        canvas.drawRightString(page_w - 12 * mm, y - 10, footer.approved_by_title or '')
+        canvas.setFont('Helvetica', 7)
+        canvas.drawCentredString(page_w / 2, 10 * mm, footer.address_line or '')
+        canvas.drawCentredString(page_w / 2, 7 * mm, footer.contact_line or '')
+        if logo is not None:
+            canvas.drawImage(logo, page_w / 2 - 8 * mm, 14 * mm, 16 * mm, 10 * mm,
+                             preserveAspectRatio=True, mask='auto')
+        canvas.drawRightString(page_w - 12 * mm, 7 * mm, f"Page {doc.page}")
+        canvas.restoreState()
+
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#092C4C')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 7.5),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F3F6FA')]),
+    ])
+    col_widths = [w * mm for w in (20, 17, 17, 22, 34, 18, 28, 20, 51, 46)]
+
+    title, subtitle = _title_lines(approval)
+    story = []
+    # One section per exam date, like the viewer's one card per day
+    for index, (exam_date, rows) in enumerate(groupby(schedule_rows(approval), key=lambda row: row[0])):
+        if index:
+            story.append(PageBreak())
+        story.append(Paragraph(title, styles['Title']))
+        story.append(Paragraph(f"{subtitle} — {exam_date}" if subtitle else str(exam_date), styles['Heading3']))
+        story.append(Spacer(1, 3 * mm))
+        data = [COLUMNS] + [[Paragraph(str(value), cell) for value in row] for row in rows]
+        story.append(Table(data, colWidths=col_widths, repeatRows=1, style=table_style))
+    if not story:
+        story = [Paragraph(title, styles['Title']), Paragraph('No exams scheduled.', styles['BodyText'])]
+
+    doc = SimpleDocTemplate(
+        out, pagesize=(page_w, page_h), title=title,
+        leftMargin=10 * mm, rightMargin=10 * mm, topMargin=10 * mm, bottomMargin=32 * mm,
+    )
+    doc.build(story, onFirstPage=decorate, onLaterPages=decorate)
+
+
+WRITERS = {'csv': write_csv, 'xlsx': write_xlsx, 'pdf': write_pdf}
+
+
+# Storage
+# ------------------------------
+def export_version(approval):
+    versions = '.'.join(str(v) for v in get_table_versions(EXPORT_TABLES))
+    return hashlib.sha256(f"{approval.request_id}:{versions}".encode()).hexdigest()[:16]
+
+
+def render_export(approval, fmt, name):
+    """Render `fmt` for the approval, store it as `name` and prune older versions."""
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as out:
+        WRITERS[fmt](out, approval, footer=schedule_footer(approval.college_name))
+        out.seek(0)
+        saved = default_storage.save(name, File(out))
+    if saved != name:
+        # Another request rendered the same version meanwhile; keep one copy
+        default_storage.delete(saved)
+
+    # Drop this format's files for older versions
+    directory, filename = posixpath.split(name)
+    _, ext = posixpath.splitext(filename)
+    _, files = default_storage.listdir(directory)
+    for other in files:
+        if other.endswith(ext) and other != filename:
+            default_storage.delete(posixpath.join(directory, other))
+
+
+def export_file(approval, fmt):
+    """
+    Return (open file, version) of `fmt` for the approval, rendering and
+    storing it first if this version hasn't been exported yet.
+
+    A request rendering another version prunes this one, possibly between
+    our render and open; a file that vanishes like that is rendered again.
+    """
+    _, ext = EXPORT_FORMATS[fmt]
+    directory = f"exports/{get_valid_filename(approval.college_name)}"
+    for attempt in range(EXPORT_ATTEMPTS):
+        version = export_version(approval)
+        name = posixpath.join(directory, f"{version}.{ext}")
+        if not default_storage.exists(name):
+            render_export(approval, fmt, name)
+        try:
+            return default_storage.open(name), version
+        except FileNotFoundError:
+            if attempt == EXPORT_ATTEMPTS - 1:
+                raise
@@ -0,0 +1,165 @@
+# exam-sync-v2/backend/api/fieldsets.py
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+# ============================================================
+# SPARSE FIELDSETS
+# ============================================================
+# List views accept `?fields=a,b,c` to return only those keys, and
+# `?expand=room,user` to also include nested objects. Without `fields` the
+# response is unchanged, so existing screens keep working as they are.
+
+
+def _split(value):
+    return [part.strip() for part in value.split(',') if part.strip()] if value else []
+
+
+def parse_fieldset(request):
+    """
+    Return (fields, expand) from the query string.
+    `fields` is None when the client did not ask for a sparse response.
+    """
+    fields = _split(request.GET.get('fields')) or None
+    expand = _split(request.GET.get('expand'))
+    return fields, expand
+
+
+def wanted_fields(fields, expand):
+    """Names to keep for a given fieldset, or None to keep everything."""
+    if fields is None:
+        return None
+    return set(fields) | set(expand or ())
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin that drops fields not named in `fields` / `expand`.
+    Unrequested SerializerMethodFields are dropped too, so their getters never run.
+
+    Method fields read model attributes DRF can't see, so serializers list
+    them in Meta.sparse_sources for sparse_queryset():
+        sparse_sources = {'full_name': ('first_name', 'last_name')}
+    """
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        keep = wanted_fields(fields, expand)
+        if keep is not None:
+            for name in list(self.fields):
+                if name not in keep:
+                    self.fields.pop(name)
+
+
+def _model_path(model, path):
+    """Check `path` resolves to a concrete column (or FK) of `model`."""
+    opts = model._meta
+    parts = path.split('__')
+    for index, part in enumerate(parts):
+        try:
+            field = opts.get_field(part)
+        except FieldDoesNotExist:
+            return False
+        if not field.concrete:
+            return False
+        if index < len(parts) - 1:
+            if not field.is_relation:
+                return False
+            opts = field.related_model._meta
+    return True
+
+
+def _all_columns(model, relation):
+    """Every concrete column of the model at the end of `relation`."""
+    opts = model._meta
+    for part in relation.split('__'):
+        opts = opts.get_field(part).related_model._meta
+    return [f"{relation}__{field.name}" for field in opts.concrete_fields]
+
+
+def _serializer_paths(serializer, prefix=''):
+    """
+    Yield (path, kind) for everything a serializer reads, where kind is
+    'column', 'object' (a nested ModelSerializer, walked so its own relations
+    are joined too) or 'opaque' (a custom serializer that needs the whole row).
+    """
+    sparse_sources = getattr(getattr(serializer, 'Meta', None), 'sparse_sources', {})
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+
+        if isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+            if name not in sparse_sources:
+                raise LookupError(name)
+            for source in sparse_sources[name]:
+                yield f"{prefix}{source}", 'column'
+            continue
+
+        path = f"{prefix}{'__'.join(field.source_attrs)}"
+        if isinstance(field, serializers.ModelSerializer):
+            yield path, 'object'
+            yield from _serializer_paths(field, f"{path}__")
+        elif isinstance(field, serializers.BaseSerializer):
+            yield path, 'opaque'
+        else:
+            yield path, 'column'
+
+
+def _select_related_paths(queryset):
+    """Flatten the queryset's select_related() tree into lookup paths."""
+    def walk(tree, prefix):
+        for name, subtree in tree.items():
+            yield f"{prefix}{name}"
+            yield from walk(subtree, f"{prefix}{name}__")
+
+    tree = queryset.query.select_related
+    return list(walk(tree, '')) if isinstance(tree, dict) else []
+
+
+def sparse_queryset(queryset, serializer_class, fields, expand=None):
+    """
+    Restrict `queryset` to the columns `serializer_class` needs for this
+    fieldset: select_related only the relations still read, and only() the
+    columns behind the remaining fields. Returns the queryset untouched when
+    no fieldset was requested or a field can't be traced back to a column.
+    """
+    if fields is None:
+        return queryset
+
+    model = queryset.model
+    serializer = serializer_class(fields=fields, expand=expand)
+
+    try:
+        paths = list(_serializer_paths(serializer))
+    except LookupError:
+        return queryset
+
+    joined = _select_related_paths(queryset)
+    columns = {model._meta.pk.name}
+    related = set()
+    for path, kind in paths:
+        if not _model_path(model, path):
+            return queryset
+        parts = path.split('__')
+        # Every relation crossed on the way to the column must be joined.
+        for depth in range(1, len(parts)):
+            related.add('__'.join(parts[:depth]))
+        if kind == 'column':
+            columns.add(path)
+        else:
+            related.add(path)
+        if kind == 'opaque':
+            # Custom serializers (e.g. CourseSerializer) read whatever they like
+            # off the related object, so load it whole along with the joins
+            # the view already asked for beneath it.
+            for relation in [path] + [j for j in joined if j.startswith(f"{path}__")]:
+                related.add(relation)
+                columns.update(_all_columns(model, relation))
+
+    # only() can't defer a relation that is also select_related.
+    columns |= related
+
+    queryset = queryset.select_related(None)
+    if related:
+        queryset = queryset.select_related(*sorted(related))
+    return queryset.only(*sorted(columns))
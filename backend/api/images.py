@@ -0,0 +1,256 @@
+# exam-sync-v2/backend/api/images.py
+
+import hashlib
+import logging
+import posixpath
+import re
+import threading
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage, default_storage
+from django.db import connections
+from django.urls import reverse
+from django.utils.text import get_valid_filename
+
+from . import workers
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# IMAGE STORE
+# ============================================================
+# Avatars and footer logos are written to the default storage (MEDIA_ROOT
+# locally, any STORAGES["default"] backend such as S3 in production) and only
+# the URL of the main variant is kept in the database. File names carry the
+# hash of the uploaded file, so a URL never changes meaning and can be cached
+# for a year.
+#
+#   avatars/<user_id>/<hash>-original.png  <- the upload, saved before responding
+#   avatars/<user_id>/<hash>-400.jpg       <- stored in TblUsers.avatar_url
+#   avatars/<user_id>/<hash>-400.webp
+#   avatars/<user_id>/<hash>-128.jpg / .webp
+#   avatars/<user_id>/<hash>-48.jpg / .webp
+#
+# Variants are rendered in the "images" process pool (api/workers.py) after
+# the upload has returned. Until they exist, the media view answers variant
+# URLs with the original (see original_for_variant), which is why stored URLs
+# always point at the media view, even when it only redirects to object
+# storage. Thumbnails sit next to the main file, so clients swap the size
+# suffix or extension instead of the server storing one URL per size.
+
+ALLOWED_IMAGE_TYPES = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+# kind -> (output format, extension, sizes); the first size is the main variant
+IMAGE_KINDS = {
+    'avatars': ('JPEG', 'jpg', (400, 128, 48)),
+    'logos': ('PNG', 'png', (400, 120)),
+}
+WEBP_QUALITY = 80
+
+VARIANT_NAME_RE = re.compile(r'^(?P<digest>[0-9a-f]{16})-\d+\.(?:jpg|png|webp)$')
+ORIGINAL_EXTENSIONS = {'JPEG': 'jpg', 'PNG': 'png', 'GIF': 'gif', 'WEBP': 'webp'}
+
+
+def validate_image_upload(upload):
+    """Return an error message for an unacceptable upload, or None."""
+    if upload.content_type not in ALLOWED_IMAGE_TYPES:
+        return 'Invalid file type. Allowed: JPEG, PNG, GIF, WEBP'
+    if upload.size > MAX_IMAGE_BYTES:
+        return 'File too large. Maximum size is 5MB'
+    return None
+
+
+def _flatten(img):
+    """Drop transparency onto a white background, as the old data URLs did."""
+    from PIL import Image
+
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def render_variants(data, kind):
+    """
+    Decode `data` and return {file suffix: encoded bytes}, e.g. {'400.jpg': ...,
+    '400.webp': ...}, for every size of `kind`. Pure Pillow, no Django, so it
+    runs in the pool's child processes.
+    """
+    from PIL import Image
+
+    fmt, ext, sizes = IMAGE_KINDS[kind]
+    img = _flatten(Image.open(BytesIO(data)))
+
+    variants = {}
+    for size in sizes:
+        resized = img.copy()
+        resized.thumbnail((size, size), Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        if fmt == 'JPEG':
+            resized.save(buffer, format=fmt, quality=85, optimize=True)
+        else:
+            resized.save(buffer, format=fmt, optimize=True)
+        variants[f"{size}.{ext}"] = buffer.getvalue()
+
+        buffer = BytesIO()
+        resized.save(buffer, format='WEBP', quality=WEBP_QUALITY, method=4)
+        variants[f"{size}.webp"] = buffer.getvalue()
+    return variants
+
+
+def _directory(kind, owner_id):
+    return f"{kind}/{get_valid_filename(str(owner_id))}"
+
+
+def _main_name(kind, owner_id, digest):
+    _, ext, sizes = IMAGE_KINDS[kind]
+    return posixpath.join(_directory(kind, owner_id), f"{digest}-{sizes[0]}.{ext}")
+
+
+def save_original(kind, owner_id, data):
+    """
+    Persist the upload as-is and return its digest.
+    Raises ValueError when the bytes aren't an image Pillow can read.
+    """
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        # Header-only parse; the pixels are decoded later in the pool
+        fmt = Image.open(BytesIO(data)).format
+    except UnidentifiedImageError:
+        raise ValueError('File is not a readable image')
+
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    ext = ORIGINAL_EXTENSIONS.get(fmt, 'img')
+    name = posixpath.join(_directory(kind, owner_id), f"{digest}-original.{ext}")
+    if not default_storage.exists(name):
+        default_storage.save(name, ContentFile(data))
+    return digest
+
+
+def save_variants(kind, owner_id, digest, variants):
+    """Write rendered variants next to the original and return the main variant's URL."""
+    directory = _directory(kind, owner_id)
+    for suffix, content in variants.items():
+        name = posixpath.join(directory, f"{digest}-{suffix}")
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(content))
+    return media_url(_main_name(kind, owner_id, digest))
+
+
+def _delete_files(kind, owner_id, matches):
+    directory = _directory(kind, owner_id)
+    try:
+        _, files = default_storage.listdir(directory)
+    except FileNotFoundError:
+        return
+    for filename in files:
+        if matches(filename):
+            default_storage.delete(posixpath.join(directory, filename))
+
+
+def delete_images(kind, owner_id, keep_digest=None):
+    """Remove every stored file for an owner, except those of `keep_digest`."""
+    _delete_files(
+        kind, owner_id,
+        lambda filename: not (keep_digest and filename.startswith(f"{keep_digest}-")),
+    )
+
+
+def original_for_variant(path):
+    """
+    Storage name of the original behind a variant path whose files haven't
+    been rendered yet, or None.
+    """
+    directory, filename = posixpath.split(path)
+    match = VARIANT_NAME_RE.match(filename)
+    if not match:
+        return None
+    try:
+        _, files = default_storage.listdir(directory)
+    except FileNotFoundError:
+        return None
+    prefix = f"{match['digest']}-original."
+    for name in files:
+        if name.startswith(prefix):
+            return posixpath.join(directory, name)
+    return None
+
+
+def is_local_storage():
+    return isinstance(default_storage, FileSystemStorage)
+
+
+def media_url(name):
+    """
+    URL of a stored image: under MEDIA_URL with local storage, else the media
+    view, which redirects to the storage's own URL.
+    """
+    url = default_storage.url(name) if is_local_storage() else reverse('media_file', kwargs={'path': name})
+    return absolute_url(url)
+
+
+def absolute_url(url):
+    """
+    Relative URLs are prefixed with MEDIA_BASE_URL: the frontend lives on
+    another host, and stored URLs mustn't depend on the host a request used.
+    """
+    if url.startswith(('http://', 'https://')):
+        return url
+    return f"{settings.MEDIA_BASE_URL.rstrip('/')}{url}"
+
+
+def _finish(kind, owner_id, digest, variants, is_current):
+    """
+    Save rendered variants. With `is_current`, the owner's other images are
+    pruned when this upload is still the one in use, and this upload's own
+    files are dropped when a newer one (or a delete) has replaced it.
+    """
+    if is_current is not None and not is_current(digest):
+        _delete_files(kind, owner_id, lambda filename: filename.startswith(f"{digest}-"))
+        return
+    save_variants(kind, owner_id, digest, variants)
+    if is_current is not None:
+        delete_images(kind, owner_id, keep_digest=digest)
+
+
+def store_original(kind, owner_id, data):
+    """
+    Save the upload and return (digest, URL of the main variant).
+    The URL is final straight away: until queue_variants() has rendered the
+    variants, the media view serves the original under it.
+    """
+    digest = save_original(kind, owner_id, data)
+    return digest, media_url(_main_name(kind, owner_id, digest))
+
+
+def queue_variants(kind, owner_id, digest, data, is_current=None):
+    """
+    Render the variants of a stored original in the "images" pool.
+    `is_current(digest)` is called once they're ready to decide whether the
+    owner's older files can be pruned. If the pool is saturated the variants
+    are rendered in this request instead.
+    """
+    caller = threading.get_ident()
+
+    def done(future):
+        try:
+            _finish(kind, owner_id, digest, future.result(), is_current)
+        except Exception:
+            logger.exception("Rendering %s for %s failed", kind, owner_id)
+        finally:
+            # Normally runs on the pool's management thread, which opened its own connection
+            if threading.get_ident() != caller:
+                connections.close_all()
+
+    if workers.submit('images', render_variants, data, kind, callback=done) is None:
+        _finish(kind, owner_id, digest, render_variants(data, kind), is_current)
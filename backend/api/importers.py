@@ -0,0 +1,537 @@
+# exam-sync-v2/backend/api/importers.py
+
+import csv
+import io
+import re
+from datetime import date, datetime, timedelta
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import bump_table_version, invalidate_user_roles
+from .passwords import default_password, hash_passwords
+from .models import (
+    TblBuildings, TblCollege, TblCourse, TblCourseUsers, TblDepartment, TblProgram, TblRoles,
+    TblRooms, TblSectioncourse, TblTerm, TblUserRole, TblUsers,
+)
+
+try:
+    import openpyxl
+except ImportError:  # pragma: no cover - only needed for .xlsx uploads
+    openpyxl = None
+
+try:
+    import xlrd
+except ImportError:  # pragma: no cover - only needed for legacy .xls uploads
+    xlrd = None
+
+# ============================================================
+# SPREADSHEET IMPORT
+# ============================================================
+# Admin screens upload the same templates they used to parse in the browser
+# (A_Rooms, A_Courses, A_SectionCourses, A_UserManagement). Rows are read
+# lazily, validated CHUNK_SIZE at a time against foreign keys preloaded into
+# dicts, and written with bulk_create / bulk_update. Invalid rows are reported
+# with their spreadsheet row number and skipped; the rest are saved in one
+# transaction. bulk_* skips model signals, so each importer bumps the cache
+# version of the tables it wrote.
+
+CHUNK_SIZE = 500
+
+
+class ImportFileError(ValueError):
+    """The upload itself can't be read (wrong type, no header, missing columns)."""
+
+
+def _header_key(value):
+    # "Room ID", "room_id" and " Room  Id " all become "room_id"
+    return re.sub(r'[\s_]+', '_', str(value or '').strip().lower())
+
+
+def _clean(value):
+    """Cell text with stray non-breaking spaces / tabs squashed, as the old client did."""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return re.sub(r'\s+', ' ', str(value).replace('\u00a0', ' ')).strip()
+
+
+def _name_key(value):
+    return _clean(value).lower()
+
+
+def _xls_rows(upload):
+    # xlrd has no streaming mode, but legacy .xls files are small (65k rows at most)
+    try:
+        book = xlrd.open_workbook(file_contents=upload.read())
+    except xlrd.XLRDError as e:
+        raise ImportFileError(f'Could not read the .xls file: {e}')
+    sheet = book.sheet_by_index(0)
+    for index in range(sheet.nrows):
+        yield [
+            xlrd.xldate_as_datetime(cell.value, book.datemode) if cell.ctype == xlrd.XL_CELL_DATE else cell.value
+            for cell in sheet.row(index)
+        ]
+
+
+def read_rows(upload):
+    """
+    Yield (row number, {header key: value}) for every non-empty data row of a
+    CSV, XLSX or XLS upload. Row numbers match the spreadsheet (header is row 1).
+    """
+    name = (upload.name or '').lower()
+    if name.endswith('.xlsx'):
+        if openpyxl is None:
+            raise ImportFileError('XLSX import needs openpyxl installed; upload a CSV instead')
+        workbook = openpyxl.load_workbook(upload, read_only=True, data_only=True)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+    elif name.endswith('.xls'):
+        if xlrd is None:
+            raise ImportFileError('XLS import needs xlrd installed; save the file as .xlsx or CSV instead')
+        rows = _xls_rows(upload)
+    elif name.endswith('.csv'):
+        rows = csv.reader(io.TextIOWrapper(upload, encoding='utf-8-sig', newline=''))
+    else:
+        raise ImportFileError('Upload a .csv, .xlsx or .xls file')
+
+    header = next(rows, None)
+    if not header:
+        raise ImportFileError('The file is empty')
+    keys = [_header_key(cell) for cell in header]
+
+    for number, values in enumerate(rows, start=2):
+        if not any(_clean(value) for value in values):
+            continue
+        yield number, dict(zip(keys, values))
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _parse_date(value):
+    """Dates arrive as datetimes (XLSX, XLS), Excel serials or YYYY-MM-DD text."""
+    if value in (None, ''):
+        return None
+    if isinstance(value, datetime):
+        result = value
+    elif isinstance(value, date):
+        result = datetime(value.year, value.month, value.day)
+    elif isinstance(value, (int, float)) or _clean(value).isdigit():
+        result = datetime(1899, 12, 30) + timedelta(days=int(float(value)))
+    else:
+        try:
+            result = datetime.strptime(_clean(value), '%Y-%m-%d')
+        except ValueError:
+            raise ValueError(f'Invalid date "{_clean(value)}" (use YYYY-MM-DD)')
+    return timezone.make_aware(result) if timezone.is_naive(result) else result
+
+
+def _parse_int(value, column):
+    try:
+        return int(float(_clean(value)))
+    except ValueError:
+        raise ValueError(f'{column} must be a number')
+
+
+def _split(value, separator):
+    return [part.strip() for part in _clean(value).split(separator)]
+
+
+def _user_name_index(users):
+    """
+    Map lower-cased "First Middle Last", "First M. Last" (the serializers'
+    full_name) and "First Last" to user_id.
+    """
+    index = {}
+    for user in users:
+        first, middle, last = user['first_name'], user.get('middle_name'), user['last_name']
+        names = [f"{first} {last}"]
+        if middle:
+            names[:0] = [f"{first} {middle} {last}", f"{first} {middle[0]}. {last}"]
+        for name in names:
+            index.setdefault(_name_key(name), user['user_id'])
+    return index
+
+
+class Importer:
+    """
+    Base importer. Subclasses list their required header keys, load lookup
+    dicts in preload() and turn one chunk of rows into database writes in
+    write_chunk(), reporting bad rows through self.error().
+    """
+    required = ()
+    tables = ()
+
+    def __init__(self):
+        self.created = 0
+        self.updated = 0
+        self.skipped = 0
+        self.errors = []
+        self.warnings = []
+
+    def error(self, number, message):
+        self.errors.append({'row': number, 'error': message})
+
+    def warning(self, number, message):
+        self.warnings.append({'row': number, 'warning': message})
+
+    def check_columns(self, row):
+        missing = [key for key in self.required if key not in row]
+        if missing:
+            raise ImportFileError(f"Missing column(s): {', '.join(missing)}")
+
+    def missing_values(self, number, row):
+        blank = [key for key in self.required if not _clean(row.get(key))]
+        if blank:
+            self.error(number, f"Missing {', '.join(blank)}")
+        return bool(blank)
+
+    def preload(self):
+        pass
+
+    def write_chunk(self, chunk):
+        raise NotImplementedError
+
+    def finish(self):
+        for table in self.tables:
+            bump_table_version(table)
+
+    def run(self, rows, dry_run=False):
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            raise ImportFileError('The file has no data rows')
+        self.check_columns(first[1])
+        self.preload()
+
+        with transaction.atomic():
+            for chunk in _chunks(_prepend(first, rows), CHUNK_SIZE):
+                self.write_chunk(chunk)
+            if dry_run:
+                transaction.set_rollback(True)
+        if not dry_run:
+            self.finish()
+
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'dry_run': dry_run,
+        }
+
+
+def _prepend(first, rest):
+    yield first
+    yield from rest
+
+
+class RoomImporter(Importer):
+    """Rooms template: Room ID, Room Name, Room Type, Room Capacity, Building ID."""
+    required = ('room_id', 'room_name', 'room_type', 'room_capacity', 'building_id')
+    tables = (TblRooms._meta.db_table,)
+
+    def preload(self):
+        self.buildings = set(TblBuildings.objects.values_list('building_id', flat=True))
+        self.seen = set(TblRooms.objects.values_list('room_id', flat=True))
+
+    def write_chunk(self, chunk):
+        rooms = []
+        for number, row in chunk:
+            if self.missing_values(number, row):
+                continue
+            room_id = _clean(row['room_id'])
+            building_id = _clean(row['building_id'])
+            try:
+                capacity = _parse_int(row['room_capacity'], 'Room Capacity')
+            except ValueError as e:
+                self.error(number, str(e))
+                continue
+            if building_id not in self.buildings:
+                self.error(number, f'Building "{building_id}" not found')
+                continue
+            if room_id in self.seen:
+                self.warning(number, f'Room "{room_id}" already exists - skipped')
+                self.skipped += 1
+                continue
+            self.seen.add(room_id)
+            rooms.append(TblRooms(
+                room_id=room_id,
+                room_name=_clean(row['room_name']),
+                room_type=_clean(row['room_type']),
+                room_capacity=capacity,
+                building_id=building_id,
+            ))
+        self.created += len(TblRooms.objects.bulk_create(rooms))
+
+
+class CourseImporter(Importer):
+    """
+    Courses template: Course ID, Course Name, Term Name, Instructor Full Names.
+    Existing courses are updated and their instructor list replaced, like
+    saving the course form.
+    """
+    required = ('course_id', 'course_name', 'term_name')
+    tables = (TblCourse._meta.db_table, TblCourseUsers._meta.db_table)
+
+    def preload(self):
+        self.terms = {_name_key(name): term_id for term_id, name in TblTerm.objects.values_list('term_id', 'term_name')}
+        self.users = _user_name_index(TblUsers.objects.values('user_id', 'first_name', 'middle_name', 'last_name'))
+        self.existing = set(TblCourse.objects.values_list('course_id', flat=True))
+        self.seen = set()
+
+    def write_chunk(self, chunk):
+        courses = {}
+        instructors = {}
+        for number, row in chunk:
+            if self.missing_values(number, row):
+                continue
+            course_id = _clean(row['course_id'])
+            term_id = self.terms.get(_name_key(row['term_name']))
+            if term_id is None:
+                self.error(number, f'Term "{_clean(row["term_name"])}" not found')
+                continue
+            if course_id in self.seen:
+                self.error(number, f'Course "{course_id}" appears more than once in the file')
+                continue
+            self.seen.add(course_id)
+
+            user_ids = []
+            for name in filter(None, _split(row.get('instructor_full_names'), ',')):
+                user_id = self.users.get(_name_key(name))
+                if user_id is None:
+                    self.warning(number, f'Instructor "{name}" not found - left out')
+                elif user_id not in user_ids:
+                    user_ids.append(user_id)
+
+            courses[course_id] = TblCourse(course_id=course_id, course_name=_clean(row['course_name']), term_id=term_id)
+            instructors[course_id] = user_ids
+
+        new = [course for course_id, course in courses.items() if course_id not in self.existing]
+        old = [course for course_id, course in courses.items() if course_id in self.existing]
+        TblCourse.objects.bulk_create(new)
+        TblCourse.objects.bulk_update(old, ['course_name', 'term'])
+        self.created += len(new)
+        self.updated += len(old)
+
+        if old:
+            TblCourseUsers.objects.filter(course_id__in=[course.course_id for course in old]).delete()
+        TblCourseUsers.objects.bulk_create([
+            TblCourseUsers(course_id=course_id, user_id=user_id, course_name=courses[course_id].course_name, is_bayanihan_leader=False)
+            for course_id, user_ids in instructors.items()
+            for user_id in user_ids
+        ])
+
+
+class SectionCourseImporter(Importer):
+    """
+    Section courses template: Section Name, Number of Students, Year Level,
+    Night Class, Term Name, Course ID, Program ID, Instructor Name. One row is
+    created per listed instructor, who must already teach the course.
+    """
+    required = ('section_name', 'number_of_students', 'year_level', 'term_name', 'course_id', 'program_id', 'instructor_name')
+    tables = (TblSectioncourse._meta.db_table,)
+
+    def preload(self):
+        self.terms = {_name_key(name): term_id for term_id, name in TblTerm.objects.values_list('term_id', 'term_name')}
+        self.courses = set(TblCourse.objects.values_list('course_id', flat=True))
+        self.programs = set(TblProgram.objects.values_list('program_id', flat=True))
+
+        self.instructors = {}
+        course_users = TblCourseUsers.objects.values(
+            'course_id', 'user_id', 'user__first_name', 'user__middle_name', 'user__last_name',
+        )
+        for row in course_users:
+            index = self.instructors.setdefault(row['course_id'], {})
+            index.update(_user_name_index([{
+                'user_id': row['user_id'],
+                'first_name': row['user__first_name'],
+                'middle_name': row['user__middle_name'],
+                'last_name': row['user__last_name'],
+            }]))
+
+        # A section that already exists is skipped whoever teaches it, as the old client did
+        self.existing = set(TblSectioncourse.objects.values_list('course_id', 'program_id', 'section_name', 'term_id'))
+        self.seen = set()
+
+    def write_chunk(self, chunk):
+        sections = []
+        for number, row in chunk:
+            if self.missing_values(number, row):
+                continue
+            course_id = _clean(row['course_id'])
+            program_id = _clean(row['program_id'])
+            section_name = _clean(row['section_name'])
+            term_id = self.terms.get(_name_key(row['term_name']))
+            try:
+                students = _parse_int(row['number_of_students'], 'Number of Students')
+            except ValueError as e:
+                self.error(number, str(e))
+                continue
+            if course_id not in self.courses:
+                self.error(number, f'Course ID "{course_id}" not found')
+                continue
+            if program_id not in self.programs:
+                self.error(number, f'Program ID "{program_id}" not found')
+                continue
+            if term_id is None:
+                self.error(number, f'Term "{_clean(row["term_name"])}" not found')
+                continue
+
+            if (course_id, program_id, section_name, term_id) in self.existing:
+                self.warning(number, f'Section "{section_name}" already exists - skipped')
+                self.skipped += 1
+                continue
+
+            course_instructors = self.instructors.get(course_id, {})
+            for name in filter(None, _split(row['instructor_name'], ',')):
+                user_id = course_instructors.get(_name_key(name))
+                if user_id is None:
+                    self.error(number, f'Instructor "{name}" not found for course "{course_id}"')
+                    continue
+                key = (course_id, program_id, section_name, term_id, user_id)
+                if key in self.seen:
+                    self.warning(number, f'Section "{section_name}" for "{name}" is repeated in the file - skipped')
+                    self.skipped += 1
+                    continue
+                self.seen.add(key)
+                sections.append(TblSectioncourse(
+                    course_id=course_id,
+                    program_id=program_id,
+                    section_name=section_name,
+                    number_of_students=students,
+                    year_level=_clean(row['year_level']),
+                    term_id=term_id,
+                    user_id=user_id,
+                    is_night_class='YES' if _clean(row.get('night_class')).upper() == 'YES' else '',
+                ))
+        self.created += len(TblSectioncourse.objects.bulk_create(sections))
+
+
+class UserImporter(Importer):
+    """
+    Accounts template: user_id, first_name, last_name, middle_name,
+    email_address, contact_number, status, and optionally roles, colleges,
+    departments, date_starts, date_endeds (";"-separated, one entry per role).
+    Existing accounts are updated; new ones get the LastName@user_id password.
+    """
+    required = ('user_id', 'first_name', 'last_name', 'email_address', 'contact_number')
+    tables = (TblUsers._meta.db_table, TblUserRole._meta.db_table)
+    profile_fields = ['first_name', 'last_name', 'middle_name', 'email_address', 'contact_number', 'status']
+
+    def preload(self):
+        self.existing = set(TblUsers.objects.values_list('user_id', flat=True))
+        self.emails = {email.lower(): user_id for user_id, email in TblUsers.objects.values_list('user_id', 'email_address')}
+        self.roles = set(TblUserRole.objects.values_list('user_id', 'role_id', 'college_id', 'department_id'))
+        self.role_ids = set(TblRoles.objects.values_list('role_id', flat=True))
+        self.colleges = set(TblCollege.objects.values_list('college_id', flat=True))
+        self.departments = set(TblDepartment.objects.values_list('department_id', flat=True))
+        self.seen = set()
+        self.role_users = set()
+
+    def _roles(self, number, user_id, row):
+        role_ids = [part for part in _split(row.get('roles'), ';') if part]
+        colleges = _split(row.get('colleges'), ';')
+        departments = _split(row.get('departments'), ';')
+        starts = _split(row.get('date_starts'), ';')
+        ends = _split(row.get('date_endeds'), ';')
+
+        def nth(values, index):
+            return values[index] if index < len(values) and values[index] else None
+
+        roles = []
+        for index, role_id in enumerate(role_ids):
+            try:
+                role_id = _parse_int(role_id, 'roles')
+                date_start = _parse_date(nth(starts, index))
+                date_ended = _parse_date(nth(ends, index))
+            except ValueError as e:
+                self.error(number, f'Role {index + 1}: {e}')
+                continue
+            key = (user_id, role_id, nth(colleges, index), nth(departments, index))
+            if role_id not in self.role_ids:
+                self.error(number, f'Role {role_id} not found')
+                continue
+            if key[2] and key[2] not in self.colleges:
+                self.error(number, f'College "{key[2]}" not found')
+                continue
+            if key[3] and key[3] not in self.departments:
+                self.error(number, f'Department "{key[3]}" not found')
+                continue
+            if key in self.roles:
+                continue
+            self.roles.add(key)
+            roles.append(TblUserRole(
+                user_id=user_id, role_id=role_id, college_id=key[2], department_id=key[3],
+                date_start=date_start, date_ended=date_ended, status='Active', created_at=timezone.now(),
+            ))
+        return roles
+
+    def write_chunk(self, chunk):
+        new, old, roles, passwords = [], [], [], []
+        for number, row in chunk:
+            if self.missing_values(number, row):
+                continue
+            try:
+                user_id = _parse_int(row['user_id'], 'user_id')
+            except ValueError as e:
+                self.error(number, str(e))
+                continue
+            email = _clean(row['email_address'])
+            owner = self.emails.get(email.lower())
+            if owner is not None and owner != user_id:
+                self.error(number, f'Email "{email}" is already used by user {owner}')
+                continue
+            if user_id in self.seen:
+                self.error(number, f'User {user_id} appears more than once in the file')
+                continue
+            self.seen.add(user_id)
+            self.emails[email.lower()] = user_id
+
+            user = TblUsers(
+                user_id=user_id,
+                first_name=_clean(row['first_name']),
+                last_name=_clean(row['last_name']),
+                middle_name=_clean(row.get('middle_name')) or None,
+                email_address=email,
+                contact_number=_clean(row['contact_number']),
+                status=_clean(row.get('status')) or 'Active',
+            )
+            if user_id in self.existing:
+                old.append(user)
+            else:
+                new.append(user)
+                passwords.append(default_password(user.last_name, user_id))
+
+            user_roles = self._roles(number, user_id, row)
+            if user_roles:
+                roles.extend(user_roles)
+                self.role_users.add(user_id)
+
+        for user, hashed in zip(new, hash_passwords(passwords)):
+            user.password = hashed
+        TblUsers.objects.bulk_create(new)
+        TblUsers.objects.bulk_update(old, self.profile_fields)
+        TblUserRole.objects.bulk_create(roles)
+        self.existing.update(user.user_id for user in new)
+        self.created += len(new)
+        self.updated += len(old)
+
+    def finish(self):
+        super().finish()
+        for user_id in self.role_users:
+            invalidate_user_roles(user_id)
+
+
+IMPORTERS = {
+    'rooms': RoomImporter,
+    'courses': CourseImporter,
+    'section_courses': SectionCourseImporter,
+    'users': UserImporter,
+}
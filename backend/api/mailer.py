@@ -0,0 +1,136 @@
+# exam-sync-v2/backend/api/mailer.py
+
+import asyncio
+import logging
+import threading
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# ASYNC MAIL DELIVERY (Resend)
+# ============================================================
+# Talks to Resend's HTTP API with httpx.AsyncClient so the async views can
+# wait on delivery without holding a worker thread. Many messages go out
+# through /emails/batch (up to 100 per call): Resend's default rate limit is
+# a couple of requests per second, so one request per proctor would mostly
+# be waiting on 429s. Batches run MAIL_CONCURRENCY at a time and a 429 is
+# retried after the Retry-After the API asks for. Resend validates a batch
+# as a whole, so one bad address gets a 422 for all of it; that batch is
+# then sent again one message at a time to fail only the bad ones.
+
+BATCH_LIMIT = 100
+
+# send_later() tasks, referenced until done so they aren't garbage collected
+_background = set()
+
+
+class MailError(Exception):
+    """Resend rejected a request (with its HTTP status) or could not be reached."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def make_client():
+    return httpx.AsyncClient(
+        base_url=settings.RESEND_API_URL,
+        headers={'Authorization': f'Bearer {settings.RESEND_API_KEY}'},
+        timeout=settings.MAIL_TIMEOUT,
+    )
+
+
+def message(to, subject, text):
+    """Resend payload for a plain-text email from DEFAULT_FROM_EMAIL."""
+    return {
+        'from': settings.DEFAULT_FROM_EMAIL,
+        'to': [to],
+        'subject': subject,
+        'text': text,
+    }
+
+
+async def _post(client, path, payload):
+    for attempt in range(settings.MAIL_RETRIES + 1):
+        try:
+            response = await client.post(path, json=payload)
+        except httpx.HTTPError as e:
+            raise MailError(f'Mail service unreachable: {e}') from e
+        if response.status_code != 429 or attempt == settings.MAIL_RETRIES:
+            break
+        await asyncio.sleep(float(response.headers.get('Retry-After') or 1))
+
+    if response.is_error:
+        try:
+            detail = response.json().get('message') or response.text
+        except ValueError:
+            detail = response.text
+        raise MailError(f'Mail service returned {response.status_code}: {detail}', response.status_code)
+    return response.json()
+
+
+async def send(payload):
+    """Send one message; returns its Resend id."""
+    async with make_client() as client:
+        return (await _post(client, '/emails', payload)).get('id')
+
+
+async def _send_logged(payload):
+    try:
+        await send(payload)
+    except MailError as e:
+        logger.warning("Mail to %s failed: %s", ', '.join(payload['to']), e)
+
+
+def send_later(payload):
+    """
+    Send one message after the response instead of before it; a failure is
+    only logged. Returns the task (asgi) or thread (wsgi) sending it.
+    """
+    if settings.SERVER_MODE == 'asgi':
+        task = asyncio.get_running_loop().create_task(_send_logged(payload))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+        return task
+    # Under WSGI the view's event loop closes with the request
+    thread = threading.Thread(target=asyncio.run, args=(_send_logged(payload),))
+    thread.start()
+    return thread
+
+
+async def send_many(payloads):
+    """
+    Send messages in batches. Returns one result per payload, in order:
+    None when it was accepted, otherwise the reason it failed. A batch that
+    fails validation is retried per message; any other failure fails every
+    message in it.
+    """
+    size = max(1, min(settings.MAIL_BATCH_SIZE, BATCH_LIMIT))
+    batches = [payloads[i:i + size] for i in range(0, len(payloads), size)]
+    limit = asyncio.Semaphore(settings.MAIL_CONCURRENCY)
+
+    async def deliver_one(client, payload):
+        try:
+            await _post(client, '/emails', payload)
+        except MailError as e:
+            logger.warning("Mail to %s failed: %s", ', '.join(payload['to']), e)
+            return str(e)
+        return None
+
+    async def deliver(client, batch):
+        async with limit:
+            try:
+                await _post(client, '/emails/batch', batch)
+            except MailError as e:
+                if e.status == 422 and len(batch) > 1:
+                    return [await deliver_one(client, payload) for payload in batch]
+                logger.warning("Mail batch of %d failed: %s", len(batch), e)
+                return [str(e)] * len(batch)
+            return [None] * len(batch)
+
+    async with make_client() as client:
+        results = await asyncio.gather(*(deliver(client, batch) for batch in batches))
+    return [reason for batch in results for reason in batch]
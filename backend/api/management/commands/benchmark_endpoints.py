@@ -0,0 +1,271 @@
+# exam-sync-v2/backend/api/management/commands/benchmark_endpoints.py
+
+import io
+import json
+import math
+import platform
+import statistics
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from api.management.commands.seed_university import SEED_PREFIX
+from api.models import TblExamdetails, TblExamOtp, TblNotification, TblProctorAttendance
+
+# ============================================================
+# ENDPOINT BENCHMARKS
+# ============================================================
+# Times the hot endpoints through the full middleware stack against data
+# from seed_university, at one or more sizes, and compares each run with a
+# stored JSON baseline:
+#
+#   python manage.py benchmark_endpoints --sizes small medium --save
+#   python manage.py benchmark_endpoints --sizes small medium
+#
+# Every request runs in a transaction that is rolled back, so POSTs and the
+# monitoring dashboard's archiving leave the seeded data as it was and each
+# iteration sees the same rows. Caches are cleared before each request
+# unless --warm is given, so the default numbers are for the cold path.
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'endpoints.json'
+
+# seed_university options per size; 'medium' is that command's defaults
+SIZES = {
+    'small': dict(colleges=2, departments=2, programs=2, courses=4, sections=3, faculty=8, buildings=4, rooms=20),
+    'medium': dict(),
+    'large': dict(colleges=10, departments=5, programs=4, courses=8, sections=5, faculty=20, buildings=20, rooms=40),
+}
+# Query counts must not grow at all; times may vary by this much, and by at
+# least MIN_DELTA_MS, before a run is flagged
+DEFAULT_THRESHOLD = 0.25
+MIN_DELTA_MS = 2.0
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of an unsorted list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the hot API endpoints against seed_university data and "
+        "compare latency percentiles and query counts with a JSON baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', nargs='+', choices=[*SIZES, 'current'], default=['small'],
+            help="Data sizes to reseed and run; 'current' benchmarks the database as it is",
+        )
+        parser.add_argument('--iterations', type=int, default=30, help='Timed requests per endpoint')
+        parser.add_argument('--warmup', type=int, default=3, help='Untimed requests per endpoint first')
+        parser.add_argument('--only', nargs='+', metavar='ENDPOINT', help='Run only these endpoints')
+        parser.add_argument('--warm', action='store_true', help='Keep caches between requests')
+        parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help=f'Default {DEFAULT_BASELINE}')
+        parser.add_argument('--save', action='store_true', help='Write this run as the new baseline')
+        parser.add_argument(
+            '--threshold', type=float, default=DEFAULT_THRESHOLD,
+            help=f'Allowed p50/p95 slowdown as a fraction (default {DEFAULT_THRESHOLD})',
+        )
+        parser.add_argument('--fail', action='store_true', help='Exit with an error when a regression is found')
+        parser.add_argument('--keep', action='store_true', help='Leave the last seeded dataset in place')
+
+    # Fixtures
+    # ------------------------------
+    def _targets(self):
+        """Pick the rows each endpoint is called with from the current data."""
+        now = timezone.now()
+        exams = TblExamdetails.objects.filter(college_name__startswith=SEED_PREFIX)
+        if not exams.exists():
+            exams = TblExamdetails.objects.all()
+        exam = (
+            exams.filter(exam_start_time__lte=now + timedelta(minutes=30), exam_end_time__gte=now).first()
+            or exams.filter(exam_date=timezone.localdate().isoformat()).first()
+            or exams.order_by('examdetails_id').first()
+        )
+        if exam is None or exam.proctor_id is None:
+            raise CommandError('No exams with a proctor to benchmark; run seed_university first')
+
+        otp = TblExamOtp.objects.filter(examdetails=exam).first()
+        if otp is None:
+            raise CommandError(f"Exam {exam.examdetails_id} has no OTP; run seed_university first")
+        attended = TblProctorAttendance.objects.filter(examdetails=exam, proctor_id=exam.proctor_id).exists()
+
+        # The proctor with the most assigned exams makes proctor_assigned_exams work hardest
+        busiest = (
+            exams.exclude(proctor__isnull=True).values('proctor_id')
+            .annotate(total=Count('examdetails_id')).order_by('-total').first()
+        )
+        notified = (
+            TblNotification.objects.values('user_id')
+            .annotate(total=Count('notification_id')).order_by('-total').first()
+        )
+        return {
+            'college': exam.college_name,
+            'proctor': busiest['proctor_id'],
+            'notified': notified['user_id'] if notified else exam.proctor_id,
+            'otp': otp.otp_code,
+            'exam_proctor': exam.proctor_id,
+            'attended': attended,
+        }
+
+    def _endpoints(self, t):
+        # name -> (method, path, params or JSON body)
+        return {
+            'tbl_examdetails_list': ('get', '/api/tbl_examdetails', {'college_name': t['college']}),
+            'proctor_monitoring_dashboard': ('get', '/api/proctor-monitoring/', {'college_name': t['college']}),
+            'proctor_assigned_exams': ('get', f"/api/proctor-assigned-exams/{t['proctor']}/", {}),
+            'verify_otp': ('post', '/api/verify-otp/', {'otp_code': t['otp'], 'user_id': t['exam_proctor']}),
+            'submit_proctor_attendance': (
+                'post', '/api/submit-proctor-attendance/',
+                {'otp_code': t['otp'], 'user_id': t['exam_proctor'], 'role': 'assigned'},
+            ),
+            'tbl_sectioncourse_page_data': ('get', '/api/tbl_sectioncourse/page-data/', {}),
+            'notification_list': ('get', f"/api/notifications/{t['notified']}/", {}),
+        }
+
+    # Measurement
+    # ------------------------------
+    def _request(self, client, method, path, data, warm):
+        if not warm:
+            cache.clear()
+            caches['reference'].clear()
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                if method == 'get':
+                    response = client.get(path, data)
+                else:
+                    response = client.post(path, data, content_type='application/json')
+                elapsed = (time.perf_counter() - started) * 1000
+            transaction.set_rollback(True)
+        return response.status_code, elapsed, len(queries)
+
+    def _run_size(self, size, options):
+        if size != 'current':
+            self.stdout.write(f"Seeding '{size}' dataset...")
+            call_command('seed_university', reset=True, stdout=io.StringIO(), **SIZES[size])
+
+        targets = self._targets()
+        if targets['attended']:
+            self.stderr.write('Benchmarked proctor already has attendance; submit_proctor_attendance measures the rejection path')
+        endpoints = self._endpoints(targets)
+        if options['only']:
+            unknown = set(options['only']) - set(endpoints)
+            if unknown:
+                raise CommandError(f"Unknown endpoint(s): {', '.join(sorted(unknown))}")
+            endpoints = {name: endpoints[name] for name in options['only']}
+
+        client = Client(HTTP_HOST='localhost')
+        results = {}
+        for name, (method, path, data) in endpoints.items():
+            for _ in range(options['warmup']):
+                self._request(client, method, path, data, options['warm'])
+            timings, query_counts, statuses = [], [], set()
+            for _ in range(options['iterations']):
+                status_code, elapsed, queries = self._request(client, method, path, data, options['warm'])
+                timings.append(elapsed)
+                query_counts.append(queries)
+                statuses.add(status_code)
+            results[name] = {
+                'status': sorted(statuses),
+                'queries': max(query_counts),
+                'mean_ms': round(statistics.fmean(timings), 2),
+                'p50_ms': round(_percentile(timings, 0.50), 2),
+                'p95_ms': round(_percentile(timings, 0.95), 2),
+                'p99_ms': round(_percentile(timings, 0.99), 2),
+            }
+        return results
+
+    # Comparison
+    # ------------------------------
+    def _regressions(self, current, base, threshold):
+        """Reasons `current` is worse than `base`, if any."""
+        if base is None:
+            return []
+        reasons = []
+        if current['queries'] > base['queries']:
+            reasons.append(f"queries {base['queries']} -> {current['queries']}")
+        for key in ('p50_ms', 'p95_ms'):
+            before, after = base[key], current[key]
+            if after - before > max(before * threshold, MIN_DELTA_MS):
+                reasons.append(f"{key[:3]} {before:.1f} -> {after:.1f}ms")
+        return reasons
+
+    def _print(self, size, results, baseline, threshold):
+        self.stdout.write(f"\n[{size}]")
+        header = f"{'endpoint':<30}{'status':>8}{'queries':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'vs base':>10}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        regressions = []
+        for name, result in results.items():
+            base = baseline.get(name)
+            change = f"{(result['p50_ms'] / base['p50_ms'] - 1) * 100:+.0f}%" if base and base['p50_ms'] else '-'
+            self.stdout.write(
+                f"{name:<30}{'/'.join(map(str, result['status'])):>8}{result['queries']:>9}"
+                f"{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}{result['p99_ms']:>9.1f}{change:>10}"
+            )
+            for reason in self._regressions(result, base, threshold):
+                regressions.append(f"{size}/{name}: {reason}")
+        return regressions
+
+    # ------------------------------
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1')
+
+        path = options['baseline']
+        stored = json.loads(path.read_text()) if path.exists() else {}
+        run = {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'iterations': options['iterations'],
+            'warm': options['warm'],
+            'sizes': {},
+        }
+
+        regressions = []
+        try:
+            for size in options['sizes']:
+                results = self._run_size(size, options)
+                run['sizes'][size] = results
+                regressions += self._print(
+                    size, results, stored.get('sizes', {}).get(size, {}), options['threshold'],
+                )
+        finally:
+            if not options['keep'] and any(size != 'current' for size in options['sizes']):
+                call_command('seed_university', delete=True, stdout=io.StringIO())
+
+        if stored and stored.get('warm') != options['warm']:
+            self.stderr.write('Baseline was recorded with a different --warm setting; times are not comparable')
+
+        if options['save']:
+            # Sizes not run this time keep their previous baseline
+            merged = {**stored.get('sizes', {}), **run['sizes']}
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({**run, 'sizes': merged}, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f"\nBaseline written to {path}"))
+
+        if not stored:
+            self.stdout.write('\nNo baseline to compare with; run again with --save to record one')
+        elif regressions:
+            self.stdout.write(self.style.ERROR(f"\n{len(regressions)} regression(s):"))
+            for line in regressions:
+                self.stdout.write(f"  {line}")
+            if options['fail']:
+                raise CommandError('Endpoint benchmarks regressed')
+        else:
+            self.stdout.write(self.style.SUCCESS('\nNo regressions against the baseline'))
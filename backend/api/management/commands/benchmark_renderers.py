@@ -0,0 +1,68 @@
+# exam-sync-v2/backend/api/management/commands/benchmark_renderers.py
+
+import gzip
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from api import views
+from api.renderers import ORJSONRenderer
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# The largest list payloads the frontend loads
+ENDPOINTS = [
+    ('exams', '/api/tbl_examdetails', views.tbl_examdetails_list),
+    ('users', '/api/users/', views.users_list),
+    ('approvals', '/api/tbl_scheduleapproval/', views.tbl_scheduleapproval_list),
+    ('modalities', '/api/tbl_modality/', views.tbl_modality_list),
+]
+
+
+class Command(BaseCommand):
+    help = "Compare JSONRenderer vs ORJSONRenderer render time and gzip/brotli sizes on the big list payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Renders per endpoint and renderer')
+        parser.add_argument(
+            '--scale', type=int, default=1,
+            help='Repeat each payload N times to approximate a larger database',
+        )
+
+    def _time_render(self, renderer, data, iterations):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            body = renderer.render(data)
+        return (time.perf_counter() - start) / iterations * 1000, body
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        factory = RequestFactory()
+
+        header = f"{'endpoint':<12}{'rows':>8}{'bytes':>12}{'json ms':>10}{'orjson ms':>11}{'speedup':>9}{'gzip':>11}{'br':>11}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+
+        for name, path, view in ENDPOINTS:
+            response = view(factory.get(path))
+            if response.status_code != 200:
+                self.stderr.write(f"{name}: {path} returned {response.status_code}, skipped")
+                continue
+            data = list(response.data) * options['scale']
+
+            json_ms, body = self._time_render(JSONRenderer(), data, iterations)
+            orjson_ms, _ = self._time_render(ORJSONRenderer(), data, iterations)
+
+            gzip_size = len(gzip.compress(body, compresslevel=6))
+            br_size = len(brotli.compress(body, quality=5)) if brotli is not None else None
+
+            self.stdout.write(
+                f"{name:<12}{len(data):>8}{len(body):>12}{json_ms:>10.2f}{orjson_ms:>11.2f}"
+                f"{json_ms / orjson_ms if orjson_ms else 0:>8.1f}x{gzip_size:>11}"
+                f"{br_size if br_size is not None else '-':>11}"
+            )
@@ -0,0 +1,83 @@
+# exam-sync-v2/backend/api/management/commands/move_images_to_storage.py
+
+import base64
+import binascii
+
+from django.core.management.base import BaseCommand
+
+from api.images import render_variants, save_original, save_variants
+from api.models import TblUsers, TblScheduleFooter
+
+
+def _decode_data_url(value):
+    """Return the bytes of a base64 `data:` URL, or None if it isn't one."""
+    if not value or not value.startswith('data:'):
+        return None
+    header, _, payload = value.partition(',')
+    if not header.endswith(';base64'):
+        return None
+    try:
+        return base64.b64decode(payload)
+    except (binascii.Error, ValueError):
+        return None
+
+
+class Command(BaseCommand):
+    help = "Move base64 data-URL avatars and schedule logos out of the database into media storage."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--base-url', default='',
+            help='Prefix for relative media URLs when MEDIA_BASE_URL is unset, e.g. https://examsync-backend.onrender.com',
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report what would move without writing')
+
+    def _move(self, kind, owner_id, value, base_url, dry_run):
+        data = _decode_data_url(value)
+        if data is None:
+            return None
+        if dry_run:
+            return ''
+        # Rendered here rather than in the pool: nothing is waiting on this process
+        digest = save_original(kind, owner_id, data)
+        url = save_variants(kind, owner_id, digest, render_variants(data, kind))
+        return url if url.startswith(('http://', 'https://')) else f"{base_url.rstrip('/')}{url}"
+
+    def handle(self, *args, **options):
+        base_url = options['base_url']
+        dry_run = options['dry_run']
+        moved = failed = 0
+
+        # iterator() keeps only one multi-hundred-KB avatar in memory at a time
+        users = TblUsers.objects.filter(avatar_url__startswith='data:').only('user_id', 'avatar_url')
+        for user in users.iterator(chunk_size=50):
+            try:
+                url = self._move('avatars', user.user_id, user.avatar_url, base_url, dry_run)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"user {user.user_id}: {e}")
+                continue
+            if url is None:
+                continue
+            if not dry_run:
+                user.avatar_url = url
+                user.save(update_fields=['avatar_url'])
+            moved += 1
+
+        footers = TblScheduleFooter.objects.filter(logo_url__startswith='data:').only('footer_id', 'college_id', 'logo_url')
+        for footer in footers.iterator(chunk_size=50):
+            try:
+                url = self._move('logos', footer.college_id or 'shared', footer.logo_url, base_url, dry_run)
+            except Exception as e:
+                failed += 1
+                self.stderr.write(f"footer {footer.footer_id}: {e}")
+                continue
+            if url is None:
+                continue
+            if not dry_run:
+                footer.logo_url = url
+                footer.save(update_fields=['logo_url'])
+            moved += 1
+
+        verb = 'Would move' if dry_run else 'Moved'
+        self.stdout.write(self.style.SUCCESS(f"{verb} {moved} image(s); {failed} failed"))
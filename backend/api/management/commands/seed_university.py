@@ -0,0 +1,593 @@
+# exam-sync-v2/backend/api/management/commands/seed_university.py
+
+import random
+import string
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from datetime import time as clock
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from api.caching import bump_table_version
+from api.models import (
+    TblAvailability, TblBuildings, TblCollege, TblCourse, TblCourseUsers, TblDepartment,
+    TblExamdetails, TblExamOtp, TblExamperiod, TblModality, TblNotification,
+    TblProctorAttendance, TblProctorAttendanceHistory, TblProctorSubstitution, TblProgram,
+    TblRoles, TblRooms, TblScheduleapproval, TblSectioncourse, TblTerm, TblUserRole, TblUsers,
+)
+
+# ============================================================
+# SYNTHETIC UNIVERSITY
+# ============================================================
+# Fills the database with an exam week at a chosen scale so the scheduler and
+# dashboards can be measured on a laptop. Every choice comes from one
+# random.Random(seed), so the same options and --start produce the same rows.
+# Seeded keys carry SEED_PREFIX and user ids start at USER_ID_BASE, which lets
+# --reset remove exactly what an earlier run inserted.
+
+SEED_PREFIX = 'SEED-'
+USER_ID_BASE = 900_000_000
+USER_ID_LIMIT = USER_ID_BASE + 10_000_000
+
+ROLE_NAMES = {1: 'Dean', 2: 'Admin', 3: 'Scheduler', 4: 'Bayanihan Leader', 5: 'Proctor'}
+
+COLLEGE_FIELDS = [
+    'Engineering', 'Information Technology', 'Science', 'Education', 'Business',
+    'Nursing', 'Architecture', 'Arts', 'Agriculture', 'Medicine',
+]
+FIRST_NAMES = [
+    'Maria', 'Jose', 'Ana', 'Juan', 'Rosa', 'Carlo', 'Liza', 'Mark', 'Grace', 'Paolo',
+    'Joy', 'Ramon', 'Clarisse', 'Miguel', 'Andrea', 'Rafael', 'Kristine', 'Noel', 'Bea', 'Arnel',
+]
+LAST_NAMES = [
+    'Santos', 'Reyes', 'Cruz', 'Bautista', 'Garcia', 'Mendoza', 'Torres', 'Flores', 'Ramos', 'Aquino',
+    'Villanueva', 'Castillo', 'Navarro', 'Dela Cruz', 'Gonzales', 'Lim', 'Tan', 'Pascual', 'Salazar', 'Ocampo',
+]
+
+# modality type -> room type, as in B_BayanihanModality
+MODALITY_ROOM_TYPES = {
+    'Written (Lecture)': 'Lecture',
+    'Written (Laboratory)': 'Laboratory',
+    'Hands-on (Laboratory)': 'Laboratory',
+}
+TIME_SLOTS = ['7 AM - 1 PM (Morning)', '1 PM - 6 PM (Afternoon)', '6 PM - 9 PM (Evening)']
+EXAM_STARTS = [clock(7, 30), clock(9, 0), clock(10, 30), clock(13, 0), clock(14, 30), clock(16, 0)]
+EXAM_DURATION = timedelta(hours=1, minutes=30)
+POSSIBLE_ROOMS = 6
+
+
+def _aware(day, at):
+    return timezone.make_aware(datetime.combine(day, at))
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic university with a full exam week (colleges, rooms, sections, "
+        "modalities, proctors, exams, OTPs and attendance) for local load testing."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=2026, help='Random seed (default 2026)')
+        parser.add_argument('--colleges', type=int, default=5)
+        parser.add_argument('--departments', type=int, default=4, help='Departments per college')
+        parser.add_argument('--programs', type=int, default=3, help='Programs per department')
+        parser.add_argument('--courses', type=int, default=8, help='Courses per program')
+        parser.add_argument('--sections', type=int, default=4, help='Sections per course')
+        parser.add_argument('--faculty', type=int, default=15, help='Instructors/proctors per department')
+        parser.add_argument('--buildings', type=int, default=10)
+        parser.add_argument('--rooms', type=int, default=30, help='Rooms per building')
+        parser.add_argument('--exam-days', type=int, default=5)
+        parser.add_argument(
+            '--start', type=date.fromisoformat, default=None,
+            help='First exam day, YYYY-MM-DD (default: yesterday, so the week has a finished day)',
+        )
+        parser.add_argument('--term', default='1st Semester', help='Term to schedule under, created if missing')
+        parser.add_argument('--academic-year', default='2025-2026')
+        parser.add_argument('--exam-category', default='Midterm')
+        parser.add_argument('--password', default='examsync', help='Password shared by every seeded account')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Rows per bulk_create statement')
+        parser.add_argument('--reset', action='store_true', help='Delete previously seeded rows first')
+        parser.add_argument('--delete', action='store_true', help='Only delete previously seeded rows')
+
+    # Output
+    # ------------------------------
+    def _count(self, table, rows):
+        self.counts.append((table, rows))
+
+    def _report(self, timings):
+        self.stdout.write(f"{'table':<32}{'rows':>10}")
+        self.stdout.write('-' * 42)
+        for table, rows in self.counts:
+            self.stdout.write(f"{table:<32}{rows:>10}")
+        self.stdout.write('')
+        for phase, seconds in timings:
+            self.stdout.write(f"{phase:<32}{seconds:>9.2f}s")
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {sum(rows for _, rows in self.counts)} rows in "
+            f"{sum(seconds for _, seconds in timings):.1f}s (seed {self.seed})"
+        ))
+
+    def _bulk(self, model, objs):
+        return model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+    # Reset
+    # ------------------------------
+    def _reset(self):
+        """Raw deletes, children first: the ORM would load every row to send delete signals."""
+        prefix = f"{SEED_PREFIX}%"
+        users = (USER_ID_BASE, USER_ID_LIMIT)
+        seeded_exams = "SELECT examdetails_id FROM tbl_examdetails WHERE college_name LIKE %s"
+        statements = [
+            (TblProctorAttendanceHistory, "proctor_id >= %s AND proctor_id < %s", users),
+            (TblProctorAttendance, f"examdetails_id IN ({seeded_exams}) OR (proctor_id >= %s AND proctor_id < %s)", (prefix, *users)),
+            (TblProctorSubstitution, f"examdetails_id IN ({seeded_exams})", (prefix,)),
+            (TblExamOtp, f"examdetails_id IN ({seeded_exams})", (prefix,)),
+            (TblExamdetails, "college_name LIKE %s", (prefix,)),
+            (TblScheduleapproval, "college_name LIKE %s", (prefix,)),
+            (TblNotification, "user_id >= %s AND user_id < %s", users),
+            (TblAvailability, "user_id >= %s AND user_id < %s", users),
+            (TblModality, "course_id LIKE %s", (prefix,)),
+            (TblSectioncourse, "course_id LIKE %s", (prefix,)),
+            (TblCourseUsers, "course_id LIKE %s", (prefix,)),
+            (TblCourse, "course_id LIKE %s", (prefix,)),
+            (TblExamperiod, "college_id LIKE %s", (prefix,)),
+            (TblUserRole, "user_id >= %s AND user_id < %s", users),
+            (TblUsers, "user_id >= %s AND user_id < %s", users),
+            (TblRooms, "building_id LIKE %s", (prefix,)),
+            (TblBuildings, "building_id LIKE %s", (prefix,)),
+            (TblProgram, "program_id LIKE %s", (prefix,)),
+            (TblDepartment, "department_id LIKE %s", (prefix,)),
+            (TblCollege, "college_id LIKE %s", (prefix,)),
+        ]
+        deleted = 0
+        with connection.cursor() as cursor:
+            for model, where, params in statements:
+                cursor.execute(f"DELETE FROM {model._meta.db_table} WHERE {where}", params)
+                deleted += cursor.rowcount
+        self.stdout.write(f"Deleted {deleted} previously seeded rows")
+
+    # Structure
+    # ------------------------------
+    def _seed_structure(self, options):
+        for role_id, role_name in ROLE_NAMES.items():
+            TblRoles.objects.get_or_create(role_id=role_id, defaults={'role_name': role_name})
+        self.term = (
+            TblTerm.objects.filter(term_name=options['term']).order_by('term_id').first()
+            or TblTerm.objects.create(term_name=options['term'])
+        )
+
+        colleges, departments, programs = [], [], []
+        for c in range(options['colleges']):
+            field = COLLEGE_FIELDS[c % len(COLLEGE_FIELDS)]
+            if c >= len(COLLEGE_FIELDS):
+                field = f"{field} {c // len(COLLEGE_FIELDS) + 1}"
+            college = TblCollege(college_id=f"{SEED_PREFIX}C{c + 1:02d}", college_name=f"College of {field}"[:50])
+            colleges.append(college)
+            for d in range(options['departments']):
+                department = TblDepartment(
+                    department_id=f"{college.college_id}-D{d + 1}",
+                    department_name=f"Department of {field} {d + 1}",
+                    college=college,
+                )
+                departments.append(department)
+                for p in range(options['programs']):
+                    programs.append(TblProgram(
+                        program_id=f"{department.department_id}-P{p + 1}",
+                        program_name=f"BS {field} {d + 1}.{p + 1}",
+                        department=department,
+                    ))
+        self._bulk(TblCollege, colleges)
+        self._bulk(TblDepartment, departments)
+        self._bulk(TblProgram, programs)
+        self._count('tbl_college', len(colleges))
+        self._count('tbl_department', len(departments))
+        self._count('tbl_program', len(programs))
+
+        buildings, rooms = [], []
+        for b in range(options['buildings']):
+            building = TblBuildings(building_id=f"{SEED_PREFIX}B{b + 1:02d}", building_name=f"Building {b + 1}")
+            buildings.append(building)
+            for r in range(options['rooms']):
+                floor, number = divmod(r, 10)
+                rooms.append(TblRooms(
+                    room_id=f"{building.building_id}-{(floor + 1) * 100 + number + 1}",
+                    room_name=f"Room {(floor + 1) * 100 + number + 1}",
+                    room_type='Laboratory' if self.rng.random() < 0.3 else 'Lecture',
+                    room_capacity=self.rng.choice([30, 40, 45, 50, 60]),
+                    building=building,
+                ))
+        self._bulk(TblBuildings, buildings)
+        self._bulk(TblRooms, rooms)
+        self._count('tbl_buildings', len(buildings))
+        self._count('tbl_rooms', len(rooms))
+
+        self.colleges, self.departments, self.programs = colleges, departments, programs
+        self.rooms_by_type = {}
+        for room in rooms:
+            self.rooms_by_type.setdefault(room.room_type, []).append(room)
+        self.rooms_by_type.setdefault('Laboratory', rooms)
+        self.rooms_by_type.setdefault('Lecture', rooms)
+
+    # People
+    # ------------------------------
+    def _seed_people(self, options):
+        password = make_password(options['password'])
+        now = timezone.now()
+        users, roles = [], []
+
+        def new_user():
+            n = len(users) + 1
+            user = TblUsers(
+                user_id=USER_ID_BASE + n,
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                email_address=f"seed{n}@examsync.test",
+                contact_number=f"0917{n:07d}",
+                status='Active',
+                password=password,
+                employment_type='full-time' if self.rng.random() < 0.7 else 'part-time',
+            )
+            users.append(user)
+            return user
+
+        def grant(user, role_id, college, department=None):
+            roles.append(TblUserRole(
+                user=user, role_id=role_id, college=college, department=department,
+                status='Active', created_at=now, date_start=now,
+            ))
+
+        self.deans, self.schedulers = {}, {}
+        self.faculty = {}  # department_id -> [TblUsers]
+        for college in self.colleges:
+            self.deans[college.college_id] = dean = new_user()
+            grant(dean, 1, college)
+            self.schedulers[college.college_id] = scheduler = new_user()
+            grant(scheduler, 3, college)
+        for department in self.departments:
+            members = self.faculty[department.department_id] = []
+            for _ in range(options['faculty']):
+                member = new_user()
+                grant(member, 5, department.college, department)
+                members.append(member)
+        self._bulk(TblUsers, users)
+        self._count('tbl_users', len(users))
+        # Bayanihan leaders are granted while courses are built; roles are inserted there
+        self.users = users
+        self.grant = grant
+        self.roles = roles
+
+    # Courses and sections
+    # ------------------------------
+    def _seed_courses(self, options):
+        courses, course_users, sections, modalities = [], [], [], []
+        leaders = set()
+        now = timezone.now()
+        letters = string.ascii_uppercase
+
+        for program in self.programs:
+            department = program.department
+            faculty = self.faculty[department.department_id]
+            for k in range(options['courses']):
+                year_level = k % 4 + 1
+                course = TblCourse(
+                    course_id=f"{program.program_id}-{year_level}{k + 1:02d}",
+                    course_name=f"{program.program_name} Course {year_level}{k + 1:02d}",
+                    term=self.term,
+                )
+                courses.append(course)
+                teachers = self.rng.sample(faculty, k=min(len(faculty), 2))
+                for index, teacher in enumerate(teachers):
+                    course_users.append(TblCourseUsers(
+                        course=course, user=teacher, course_name=course.course_name,
+                        is_bayanihan_leader=index == 0,
+                    ))
+                if teachers and teachers[0].user_id not in leaders:
+                    leaders.add(teachers[0].user_id)
+                    self.grant(teachers[0], 4, department.college, department)
+
+                modality_type = self.rng.choices(list(MODALITY_ROOM_TYPES), weights=[6, 2, 2])[0]
+                room_type = MODALITY_ROOM_TYPES[modality_type]
+                for s in range(options['sections']):
+                    section = TblSectioncourse(
+                        course=course,
+                        program=program,
+                        section_name=f"{year_level}{letters[s % 26]}{s // 26 or ''}",
+                        number_of_students=self.rng.randint(25, 50),
+                        year_level=str(year_level),
+                        term=self.term,
+                        user=teachers[s % len(teachers)] if teachers else None,
+                        is_night_class='YES' if self.rng.random() < 0.05 else '',
+                    )
+                    sections.append(section)
+                    candidates = self.rooms_by_type[room_type]
+                    modalities.append(TblModality(
+                        modality_type=modality_type,
+                        room_type=room_type,
+                        course=course,
+                        program_id=program.program_id,
+                        user=teachers[0] if teachers else self.schedulers[department.college_id],
+                        created_at=now,
+                        sections=[section.section_name],
+                        total_students=section.number_of_students,
+                        possible_rooms=[
+                            room.room_id for room in self.rng.sample(candidates, k=min(len(candidates), POSSIBLE_ROOMS))
+                        ],
+                    ))
+
+        self._bulk(TblUserRole, self.roles)
+        self._bulk(TblCourse, courses)
+        self._bulk(TblCourseUsers, course_users)
+        self._bulk(TblSectioncourse, sections)
+        self._bulk(TblModality, modalities)
+        self._count('tbl_user_role', len(self.roles))
+        self._count('tbl_course', len(courses))
+        self._count('tbl_course_users', len(course_users))
+        self._count('tbl_sectioncourse', len(sections))
+        self._count('tbl_modality', len(modalities))
+
+        self.sections = sections
+        self.modalities = modalities
+
+    # Exam week
+    # ------------------------------
+    def _seed_exam_week(self, options):
+        days = [self.start + timedelta(days=i) for i in range(options['exam_days'])]
+        category, academic_year = options['exam_category'], options['academic_year']
+
+        periods = {}
+        for college in self.colleges:
+            for day in days:
+                periods[(college.college_id, day)] = TblExamperiod(
+                    start_date=_aware(day, clock(12, 0)),
+                    end_date=_aware(day, clock(12, 0)),
+                    academic_year=academic_year,
+                    exam_category=category,
+                    term=self.term,
+                    college=college,
+                )
+        self._bulk(TblExamperiod, list(periods.values()))
+        self._count('tbl_examperiod', len(periods))
+
+        rooms = {room.room_id: room for rooms in self.rooms_by_type.values() for room in rooms}
+        program_college = {program.program_id: program.department.college_id for program in self.programs}
+        section_teacher = {
+            (section.course_id, section.section_name): section.user_id for section in self.sections
+        }
+        college_faculty = {}
+        for department in self.departments:
+            college_faculty.setdefault(department.college_id, []).extend(self.faculty[department.department_id])
+
+        slots = [(day, at) for day in days for at in EXAM_STARTS]
+        busy_rooms, busy_sections = set(), set()
+        free_proctors = {}
+        exams, unplaced = [], 0
+
+        for modality in self.modalities:
+            college_id = program_college[modality.program_id]
+            section_name = modality.sections[0]
+            placed = False
+            for day, at in self.rng.sample(slots, k=len(slots)):
+                if (modality.program_id, section_name, day, at) in busy_sections:
+                    continue
+                room_id = next((r for r in modality.possible_rooms if (r, day, at) not in busy_rooms), None)
+                if room_id is None:
+                    continue
+                key = (college_id, day, at)
+                if key not in free_proctors:
+                    free_proctors[key] = self.rng.sample(college_faculty[college_id], k=len(college_faculty[college_id]))
+                if not free_proctors[key]:
+                    continue
+                proctor = free_proctors[key].pop()
+                busy_rooms.add((room_id, day, at))
+                busy_sections.add((modality.program_id, section_name, day, at))
+                start = _aware(day, at)
+                instructor_id = section_teacher.get((modality.course_id, section_name))
+                exams.append(TblExamdetails(
+                    course_id=modality.course_id,
+                    program_id=modality.program_id,
+                    room=rooms[room_id],
+                    modality=modality,
+                    proctor=proctor,
+                    examperiod=periods[(college_id, day)],
+                    exam_duration=EXAM_DURATION,
+                    exam_start_time=start,
+                    exam_end_time=start + EXAM_DURATION,
+                    sections=[section_name],
+                    instructors=[instructor_id] if instructor_id else [],
+                    proctors=[proctor.user_id],
+                    academic_year=academic_year,
+                    semester=self.term.term_name,
+                    exam_category=category,
+                    exam_period=category,
+                    exam_date=day.isoformat(),
+                    college_name=college_id,
+                    building_name=rooms[room_id].building.building_name,
+                ))
+                placed = True
+                break
+            unplaced += not placed
+
+        self._bulk(TblExamdetails, exams)
+        self._count('tbl_examdetails', len(exams))
+        if unplaced:
+            self.stderr.write(f"{unplaced} modalities found no free room/proctor/slot and have no exam")
+
+        approvals = []
+        for college in self.colleges:
+            approvals.append(TblScheduleapproval(
+                request_id=uuid.UUID(int=self.rng.getrandbits(128), version=4),
+                dean_user_id=self.deans[college.college_id].user_id,
+                submitted_by=self.schedulers[college.college_id],
+                submitted_at=timezone.now(),
+                status='approved',
+                created_at=timezone.now(),
+                college_name=college.college_id,
+                schedule_data={
+                    'college_name': college.college_id,
+                    'exam_period': category,
+                    'semester': self.term.term_name,
+                    'academic_year': academic_year,
+                },
+            ))
+        self._bulk(TblScheduleapproval, approvals)
+        self._count('tbl_scheduleapproval', len(approvals))
+
+        self.days = days
+        self.exams = exams
+        self.college_faculty = college_faculty
+
+    # Proctoring
+    # ------------------------------
+    def _seed_proctoring(self, options):
+        alphabet = string.ascii_uppercase + string.digits
+        codes = set(TblExamOtp.objects.values_list('otp_code', flat=True))
+        otps = {}
+        for exam in self.exams:
+            code = ''.join(self.rng.choices(alphabet, k=6))
+            while code in codes:
+                code = ''.join(self.rng.choices(alphabet, k=6))
+            codes.add(code)
+            otps[exam.examdetails_id] = TblExamOtp(examdetails=exam, otp_code=code, expires_at=exam.exam_end_time)
+        self._bulk(TblExamOtp, list(otps.values()))
+        self._count('tbl_exam_otp', len(otps))
+
+        # Past days are already archived to history (as the monitoring
+        # dashboard would have done); exams under way today have attendance.
+        # Those history rows never had an attendance row, so they get negative
+        # attendance ids: archive_completed_attendances() skips attendance
+        # whose id is already in history, and a seeded id equal to a real one
+        # would make it delete that attendance without archiving it.
+        now = timezone.now()
+        today = timezone.localdate()
+        names = {user.user_id: f"{user.first_name} {user.last_name}" for user in self.users}
+        attendances, substitutions, history = [], [], []
+        for exam in self.exams:
+            exam_day = date.fromisoformat(exam.exam_date)
+            if exam_day > today or exam.exam_start_time > now:
+                continue
+            proctor_id = exam.proctor_id
+            roll = self.rng.random()
+            substitute = None
+            if roll < 0.05:
+                pool = self.college_faculty[exam.college_name]
+                substitute = self.rng.choice([user for user in pool if user.user_id != proctor_id] or pool)
+            attendee_id = substitute.user_id if substitute else proctor_id
+            minutes = self.rng.randint(8, 30) if 0.05 <= roll < 0.15 else -self.rng.randint(0, 15)
+            time_in = exam.exam_start_time + timedelta(minutes=minutes)
+
+            if exam_day < today:
+                history.append(TblProctorAttendanceHistory(
+                    attendance_id=-exam.examdetails_id,
+                    examdetails_id=exam.examdetails_id,
+                    proctor_id=attendee_id,
+                    proctor_name=names[attendee_id],
+                    course_id=exam.course_id,
+                    section_name=', '.join(exam.sections),
+                    exam_date=exam.exam_date,
+                    exam_start_time=exam.exam_start_time,
+                    exam_end_time=exam.exam_end_time,
+                    building_name=exam.building_name,
+                    room_id=exam.room_id,
+                    instructor_name=', '.join(names[i] for i in exam.instructors if i in names) or None,
+                    is_substitute=substitute is not None,
+                    remarks='Seeded substitute' if substitute else None,
+                    time_in=time_in,
+                    time_out=exam.exam_end_time,
+                    otp_used=otps[exam.examdetails_id].otp_code,
+                    status='substitute' if substitute else ('late' if minutes > 7 else 'confirmed'),
+                    substituted_for_id=proctor_id if substitute else None,
+                    substituted_for_name=names.get(proctor_id) if substitute else None,
+                ))
+            else:
+                attendances.append(TblProctorAttendance(
+                    examdetails=exam,
+                    proctor_id=attendee_id,
+                    is_substitute=substitute is not None,
+                    remarks='Seeded substitute' if substitute else None,
+                    otp_used=otps[exam.examdetails_id].otp_code,
+                ))
+                if substitute:
+                    substitutions.append(TblProctorSubstitution(
+                        examdetails=exam,
+                        original_proctor_id=proctor_id,
+                        substitute_proctor=substitute,
+                        justification='Seeded substitution',
+                    ))
+        self._bulk(TblProctorAttendanceHistory, history)
+        self._bulk(TblProctorAttendance, attendances)
+        self._bulk(TblProctorSubstitution, substitutions)
+        self._count('tbl_proctor_attendance', len(attendances))
+        self._count('tbl_proctor_substitution', len(substitutions))
+        self._count('tbl_proctor_attendance_history', len(history))
+
+        availability = []
+        for faculty in self.college_faculty.values():
+            for user in faculty:
+                unavailable = self.rng.random() < 0.1
+                availability.append(TblAvailability(
+                    user=user,
+                    days=self.days,
+                    time_slots=self.rng.sample(TIME_SLOTS, k=self.rng.randint(1, len(TIME_SLOTS))),
+                    status='unavailable' if unavailable else 'available',
+                    remarks='Seeded leave' if unavailable else None,
+                    type='availability',
+                ))
+        self._bulk(TblAvailability, availability)
+        self._count('tbl_availability', len(availability))
+
+        notifications = []
+        for exam in self.exams:
+            notifications.append(TblNotification(
+                user_id=exam.proctor_id,
+                sender=self.schedulers[exam.college_name],
+                title='Exam assignment',
+                message=f"You are assigned to proctor {exam.course_id} on {exam.exam_date} in {exam.room_id}.",
+                type='proctor_assignment',
+                is_seen=exam.exam_date == self.days[0].isoformat(),
+            ))
+        self._bulk(TblNotification, notifications)
+        self._count('tbl_notification', len(notifications))
+
+    # ------------------------------
+    def handle(self, *args, **options):
+        self.seed = options['seed']
+        self.rng = random.Random(self.seed)
+        self.batch_size = options['batch_size']
+        self.start = options['start'] or timezone.localdate() - timedelta(days=1)
+        self.counts = []
+
+        if min(options['colleges'], options['departments'], options['programs'], options['courses'],
+               options['sections'], options['faculty'], options['buildings'], options['rooms'],
+               options['exam_days']) < 1:
+            raise CommandError('Every volume option must be at least 1')
+
+        timings = []
+        with transaction.atomic():
+            if options['reset'] or options['delete']:
+                self._reset()
+            elif TblCollege.objects.filter(college_id__startswith=SEED_PREFIX).exists():
+                raise CommandError('Seeded data already exists; pass --reset to replace it')
+            if not options['delete']:
+                for phase in (self._seed_structure, self._seed_people, self._seed_courses,
+                              self._seed_exam_week, self._seed_proctoring):
+                    started = time.perf_counter()
+                    phase(options)
+                    timings.append((phase.__name__.replace('_seed_', ''), time.perf_counter() - started))
+
+        # After commit, so no reader caches the old rows under the new versions
+        self._bump_versions()
+        if timings:
+            self._report(timings)
+
+    def _bump_versions(self):
+        # bulk_create and raw deletes skip the signals that version these tables
+        for model in (
+            TblCollege, TblDepartment, TblProgram, TblBuildings, TblRooms, TblRoles, TblTerm,
+            TblUsers, TblUserRole, TblCourse, TblCourseUsers, TblSectioncourse, TblModality,
+            TblExamperiod, TblExamdetails, TblScheduleapproval,
+        ):
+            bump_table_version(model._meta.db_table)
@@ -0,0 +1,283 @@
+# exam-sync-v2/backend/api/management/commands/simulate_checkin.py
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from datetime import timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from api.caching import bump_table_version
+from api.management.commands.benchmark_endpoints import _percentile
+from api.management.commands.seed_university import SEED_PREFIX
+from api.models import TblExamdetails, TblExamOtp, TblProctorAttendance, TblProctorSubstitution
+
+# ============================================================
+# CHECK-IN SURGE SIMULATOR
+# ============================================================
+# Replays the exam-day peak against a running server: each virtual proctor
+# arrives somewhere in the --ramp window, verifies the exam's OTP, waits a
+# moment and submits attendance, while --pollers schedulers keep reloading
+# the monitoring dashboard until the last proctor is done.
+#
+#   python manage.py seed_university
+#   python manage.py simulate_checkin --prepare --proctors 300 --ramp 60
+#
+# The OTPs and proctor ids are read from this database, so point it at the
+# same database the server uses. --prepare moves the chosen seeded exams so
+# they are under way now and clears their attendance, which makes a run
+# repeatable at any time of day.
+#
+# All proctors share one client address by default, like phones on the
+# campus network behind one NAT, so DRF's anon throttle applies to all of
+# them together. --distinct-ips sends a different X-Forwarded-For per proctor.
+
+ENDPOINTS = ('verify_otp', 'submit_proctor_attendance', 'proctor_monitoring')
+
+
+class Stats:
+    def __init__(self):
+        self.latency_ms = {name: [] for name in ENDPOINTS}
+        self.statuses = {name: Counter() for name in ENDPOINTS}
+        self.errors = {name: Counter() for name in ENDPOINTS}
+        self.outcomes = Counter()
+
+    def add(self, name, started, status_code=None, error=None):
+        self.latency_ms[name].append((time.perf_counter() - started) * 1000)
+        if error is not None:
+            self.errors[name][error] += 1
+        else:
+            self.statuses[name][status_code] += 1
+
+    def endpoint(self, name, elapsed):
+        latencies = self.latency_ms[name]
+        statuses = self.statuses[name]
+        total = len(latencies)
+        failed = sum(n for code, n in statuses.items() if code >= 500) + sum(self.errors[name].values())
+        return {
+            'requests': total,
+            'per_second': round(total / elapsed, 1) if elapsed else 0,
+            'statuses': {str(code): n for code, n in sorted(statuses.items())},
+            'throttled': statuses.get(429, 0),
+            'errors': dict(self.errors[name]),
+            'error_rate': round(failed / total, 4) if total else 0,
+            'p50_ms': round(_percentile(latencies, 0.50), 1) if latencies else None,
+            'p95_ms': round(_percentile(latencies, 0.95), 1) if latencies else None,
+            'p99_ms': round(_percentile(latencies, 0.99), 1) if latencies else None,
+            'max_ms': round(max(latencies), 1) if latencies else None,
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate the exam-day check-in surge (verify OTP, submit attendance, dashboard polling) "
+        "against a running server and report throughput, latency percentiles and error rates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000', help='Server to load')
+        parser.add_argument('--proctors', type=int, default=200, help='Virtual proctors checking in')
+        parser.add_argument('--ramp', type=float, default=60, help='Seconds over which proctors arrive')
+        parser.add_argument('--think', type=float, default=2.0, help='Mean seconds between verify and submit')
+        parser.add_argument('--pollers', type=int, default=5, help='Schedulers polling proctor-monitoring')
+        parser.add_argument('--poll-interval', type=float, default=5, help='Seconds between dashboard reloads')
+        parser.add_argument('--concurrency', type=int, default=100, help='Maximum open connections')
+        parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds')
+        parser.add_argument('--substitute-rate', type=float, default=0.05, help='Share of check-ins by a substitute')
+        parser.add_argument('--college', help='Only use exams of this college (college_name)')
+        parser.add_argument('--prepare', action='store_true', help='Shift the chosen seeded exams to now and clear their attendance')
+        parser.add_argument('--distinct-ips', action='store_true', help='Give each proctor its own X-Forwarded-For')
+        parser.add_argument('--seed', type=int, default=2026)
+        parser.add_argument('--json', type=Path, help='Also write the report to this file')
+
+    # Targets
+    # ------------------------------
+    def _check_ins(self, options):
+        """(otp_code, assigned proctor id, college) for up to --proctors exams, one proctor each."""
+        exams = TblExamdetails.objects.exclude(proctor__isnull=True).filter(otp_record__isnull=False)
+        if options['prepare']:
+            exams = exams.filter(college_name__startswith=SEED_PREFIX)
+        if options['college']:
+            exams = exams.filter(college_name=options['college'])
+
+        now = timezone.now()
+        if not options['prepare']:
+            # Prefer exams whose check-in window is open, as on the real morning
+            exams = exams.filter(exam_start_time__lte=now + timedelta(minutes=30), exam_end_time__gte=now)
+
+        chosen, seen = [], set()
+        for exam_id, proctor_id, college in exams.order_by('examdetails_id').values_list(
+            'examdetails_id', 'proctor_id', 'college_name',
+        ).iterator():
+            if proctor_id in seen:
+                continue
+            seen.add(proctor_id)
+            chosen.append((exam_id, proctor_id, college))
+            if len(chosen) == options['proctors']:
+                break
+        if not chosen:
+            hint = 'run seed_university first' if options['prepare'] else 'use --prepare with seeded data'
+            raise CommandError(f"No exams with an open check-in window and an OTP; {hint}")
+
+        exam_ids = [exam_id for exam_id, _, _ in chosen]
+        if options['prepare']:
+            start = now - timedelta(minutes=10)
+            with transaction.atomic():
+                TblExamdetails.objects.filter(examdetails_id__in=exam_ids).update(
+                    exam_start_time=start,
+                    exam_end_time=start + timedelta(hours=1, minutes=30),
+                    exam_date=timezone.localdate().isoformat(),
+                )
+                TblExamOtp.objects.filter(examdetails_id__in=exam_ids).update(expires_at=start + timedelta(hours=2))
+                TblProctorAttendance.objects.filter(examdetails_id__in=exam_ids).delete()
+                TblProctorSubstitution.objects.filter(examdetails_id__in=exam_ids).delete()
+            bump_table_version('tbl_examdetails')
+
+        codes = dict(TblExamOtp.objects.filter(examdetails_id__in=exam_ids).values_list('examdetails_id', 'otp_code'))
+        return [(codes[exam_id], proctor_id, college) for exam_id, proctor_id, college in chosen]
+
+    # Load
+    # ------------------------------
+    async def _call(self, client, stats, name, method, path, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, **kwargs)
+        except Exception as e:
+            stats.add(name, started, error=type(e).__name__)
+            return None
+        stats.add(name, started, status_code=response.status_code)
+        return response
+
+    async def _proctor(self, client, stats, rng, index, check_in, proctor_ids, options):
+        otp_code, proctor_id, _ = check_in
+        await asyncio.sleep(rng.uniform(0, options['ramp']))
+
+        # A substitute is another proctor of the run standing in for this one
+        substitute = len(proctor_ids) > 1 and rng.random() < options['substitute_rate']
+        user_id = proctor_id
+        while substitute and user_id == proctor_id:
+            user_id = rng.choice(proctor_ids)
+        headers = {'X-Forwarded-For': f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"} \
+            if options['distinct_ips'] else {}
+
+        verify = await self._call(
+            client, stats, 'verify_otp', 'POST', '/api/verify-otp/',
+            json={'otp_code': otp_code, 'user_id': user_id}, headers=headers,
+        )
+        if verify is None or verify.status_code != 200:
+            stats.outcomes['verify failed'] += 1
+            return
+        if not verify.json().get('valid'):
+            stats.outcomes['otp rejected'] += 1
+            return
+
+        await asyncio.sleep(rng.expovariate(1 / options['think']) if options['think'] > 0 else 0)
+        body = {'otp_code': otp_code, 'user_id': user_id, 'role': 'assigned'}
+        if substitute:
+            body.update(role='sub', remarks='Load test substitution')
+        submit = await self._call(
+            client, stats, 'submit_proctor_attendance', 'POST', '/api/submit-proctor-attendance/',
+            json=body, headers=headers,
+        )
+        if submit is not None and submit.status_code == 201:
+            stats.outcomes['checked in as substitute' if substitute else 'checked in'] += 1
+        else:
+            stats.outcomes['submit failed'] += 1
+
+    async def _poller(self, client, stats, college, done, options):
+        while not done.is_set():
+            await self._call(
+                client, stats, 'proctor_monitoring', 'GET', '/api/proctor-monitoring/',
+                params={'college_name': college},
+            )
+            try:
+                await asyncio.wait_for(done.wait(), timeout=options['poll_interval'])
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run(self, check_ins, options):
+        import httpx
+
+        stats = Stats()
+        rng = random.Random(options['seed'])
+        proctor_ids = [proctor_id for _, proctor_id, _ in check_ins]
+        colleges = sorted({college for _, _, college in check_ins})
+        limits = httpx.Limits(
+            max_connections=options['concurrency'], max_keepalive_connections=options['concurrency'],
+        )
+        done = asyncio.Event()
+
+        async with httpx.AsyncClient(base_url=options['base_url'], limits=limits, timeout=options['timeout']) as client:
+            started = time.perf_counter()
+            pollers = [
+                asyncio.create_task(self._poller(client, stats, colleges[i % len(colleges)], done, options))
+                for i in range(options['pollers'])
+            ]
+            await asyncio.gather(*(
+                self._proctor(client, stats, rng, index, check_in, proctor_ids, options)
+                for index, check_in in enumerate(check_ins)
+            ))
+            done.set()
+            await asyncio.gather(*pollers)
+            elapsed = time.perf_counter() - started
+        return stats, elapsed
+
+    # ------------------------------
+    def _print(self, report):
+        header = f"{'endpoint':<28}{'reqs':>7}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'429':>6}{'err %':>7}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for name, row in report['endpoints'].items():
+            if not row['requests']:
+                continue
+            self.stdout.write(
+                f"{name:<28}{row['requests']:>7}{row['per_second']:>8.1f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+                f"{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}{row['throttled']:>6}{row['error_rate'] * 100:>6.1f}%"
+            )
+            other = {code: n for code, n in row['statuses'].items() if code not in ('200', '201')}
+            if other or row['errors']:
+                self.stdout.write(f"{'':<4}statuses {other} errors {row['errors']}")
+        self.stdout.write('')
+        for outcome, n in sorted(report['outcomes'].items()):
+            self.stdout.write(f"{outcome:<28}{n:>7}")
+        self.stdout.write(
+            f"\n{report['requests']} requests in {report['seconds']:.1f}s "
+            f"({report['requests'] / report['seconds']:.1f} req/s)" if report['seconds'] else ''
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            raise CommandError('simulate_checkin needs httpx installed (pip install httpx)')
+        if options['proctors'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--proctors and --concurrency must be at least 1')
+
+        check_ins = self._check_ins(options)
+        self.stdout.write(
+            f"{len(check_ins)} proctors over {options['ramp']:.0f}s, {options['pollers']} dashboard pollers, "
+            f"{options['concurrency']} connections -> {options['base_url']}"
+        )
+        stats, elapsed = asyncio.run(self._run(check_ins, options))
+
+        endpoints = {name: stats.endpoint(name, elapsed) for name in ENDPOINTS}
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'options': {key: options[key] for key in (
+                'base_url', 'proctors', 'ramp', 'think', 'pollers', 'poll_interval',
+                'concurrency', 'substitute_rate', 'distinct_ips', 'seed',
+            )},
+            'seconds': round(elapsed, 2),
+            'requests': sum(row['requests'] for row in endpoints.values()),
+            'endpoints': endpoints,
+            'outcomes': dict(stats.outcomes),
+        }
+        self._print(report)
+        if options['json']:
+            options['json'].write_text(json.dumps(report, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['json']}"))
@@ -0,0 +1,160 @@
+# exam-sync-v2/backend/api/metrics.py
+
+import os
+import secrets
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+from django.db import connections
+
+# ============================================================
+# REQUEST METRICS
+# ============================================================
+# RequestMetricsMiddleware (api/middleware.py) records every request here,
+# keyed by the resolved URL name, and /debug/metrics reads it back. Values
+# live in the memory of one web process: each gunicorn worker keeps its own
+# counts, and they start from zero on every restart. That is enough to compare
+# an endpoint before and after a fix, without running a metrics server.
+
+# Upper bounds of the histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SQL_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class Histogram:
+    __slots__ = ('bounds', 'counts', 'total', 'count', 'max')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+        self.count = 0
+        self.max = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction (max for the open bucket)."""
+        if not self.count:
+            return None
+        wanted = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= wanted:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self):
+        labels = [f"le_{bound}" for bound in self.bounds] + ['inf']
+        return {
+            'count': self.count,
+            'avg': round(self.total / self.count, 2) if self.count else None,
+            'max': round(self.max, 2),
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'p99': self.percentile(0.99),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class RouteMetrics:
+    __slots__ = ('latency_ms', 'queries', 'sql_ms', 'statuses')
+
+    def __init__(self):
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.queries = Histogram(QUERY_BUCKETS)
+        self.sql_ms = Histogram(SQL_BUCKETS_MS)
+        self.statuses = {}
+
+    def as_dict(self):
+        return {
+            'requests': self.latency_ms.count,
+            'statuses': dict(sorted(self.statuses.items())),
+            'latency_ms': self.latency_ms.as_dict(),
+            'queries': self.queries.as_dict(),
+            'sql_ms': self.sql_ms.as_dict(),
+        }
+
+
+_routes = {}
+_lock = threading.Lock()
+_started = time.time()
+
+
+def debug_allowed(request):
+    """METRICS_TOKEN in the X-Metrics-Token header or ?token=; DEBUG alone when none is set."""
+    token = settings.METRICS_TOKEN
+    if not token:
+        return settings.DEBUG
+    given = request.headers.get('X-Metrics-Token') or request.GET.get('token') or ''
+    return secrets.compare_digest(given, token)
+
+
+def record(route, status_code, latency_ms, queries, sql_ms):
+    with _lock:
+        metrics = _routes.get(route)
+        if metrics is None:
+            metrics = _routes[route] = RouteMetrics()
+        metrics.latency_ms.observe(latency_ms)
+        metrics.queries.observe(queries)
+        metrics.sql_ms.observe(sql_ms)
+        metrics.statuses[status_code] = metrics.statuses.get(status_code, 0) + 1
+
+
+def pool_stats(reset=False):
+    """
+    Counters of each database alias's psycopg pool in this process (none
+    without DB_POOL). Wait figures cover requests that found no idle
+    connection; `timeouts` gave up after DB_POOL_TIMEOUT.
+    """
+    pools = {}
+    for connection in connections.all():
+        pool = connection.pool
+        if pool is None:
+            continue
+        raw = pool.pop_stats() if reset else pool.get_stats()
+        queued = raw.get('requests_queued', 0)
+        wait_ms = raw.get('requests_wait_ms', 0)
+        pools[connection.alias] = {
+            'size': raw.get('pool_size', 0),
+            'available': raw.get('pool_available', 0),
+            'min': raw.get('pool_min'),
+            'max': raw.get('pool_max'),
+            'waiting_now': raw.get('requests_waiting', 0),
+            'requests': raw.get('requests_num', 0),
+            'queued': queued,
+            'wait_ms_total': wait_ms,
+            'wait_ms_avg': round(wait_ms / queued, 2) if queued else 0,
+            'timeouts': raw.get('requests_errors', 0),
+            'connections_opened': raw.get('connections_num', 0),
+            'connect_ms_total': raw.get('connections_ms', 0),
+            'connections_lost': raw.get('connections_lost', 0),
+        }
+    return pools
+
+
+def snapshot(reset=False):
+    """Every route's histograms, slowest total time first."""
+    global _started
+    with _lock:
+        routes = sorted(
+            _routes.items(), key=lambda item: item[1].latency_ms.total, reverse=True,
+        )
+        data = {
+            'pid': os.getpid(),
+            'since': _started,
+            'routes': {route: metrics.as_dict() for route, metrics in routes},
+            'db_pools': pool_stats(reset=reset),
+        }
+        if reset:
+            _routes.clear()
+            _started = time.time()
+    return data
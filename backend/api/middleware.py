@@ -0,0 +1,302 @@
+# exam-sync-v2/backend/api/middleware.py
+
+import cProfile
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from . import metrics, profiling, routers
+
+logger = logging.getLogger(__name__)
+
+re_accepts_br = _lazy_re_compile(r"\bbr\b")
+re_accepts_gzip = _lazy_re_compile(r"\bgzip\b")
+
+
+# ============================================================
+# API RESPONSE COMPRESSION
+# ============================================================
+class ApiCompressionMiddleware:
+    """
+    Compress /api/ responses larger than API_COMPRESSION_MIN_BYTES.
+    Brotli is used when the client accepts it and the package is installed,
+    gzip otherwise. Streaming and already-encoded responses pass through.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if not request.path.startswith('/api/'):
+            return response
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if len(response.content) < settings.API_COMPRESSION_MIN_BYTES:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if brotli is not None and re_accepts_br.search(accept_encoding):
+            encoding = 'br'
+            compressed = brotli.compress(response.content, quality=settings.API_BROTLI_QUALITY)
+        elif re_accepts_gzip.search(accept_encoding):
+            encoding = 'gzip'
+            compressed = compress_string(
+                response.content, max_random_bytes=GZipMiddleware.max_random_bytes
+            )
+        else:
+            return response
+
+        # Not worth it if the payload doesn't shrink
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        response.headers['Content-Encoding'] = encoding
+
+        # The body changed, so a strong ETag no longer holds
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+
+        return response
+
+
+# ============================================================
+# REQUEST METRICS
+# ============================================================
+class QueryTimer:
+    """connection.execute_wrapper() that counts and times every query."""
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+@contextmanager
+def execute_wrapper(connection, wrapper):
+    """
+    connection.execute_wrapper() that removes `wrapper` itself on exit.
+    Django's pops the last wrapper instead, which is another one when the
+    connection was opened inside the block and gained _timed_execute, and
+    would leave `wrapper` on the connection for every later request.
+    """
+    connection.execute_wrappers.append(wrapper)
+    try:
+        yield
+    finally:
+        connection.execute_wrappers.remove(wrapper)
+
+
+# Under ASGI the ORM runs on executor threads whose connections the
+# middleware can't wrap from the event loop. Every connection gets this
+# wrapper when it opens instead, and it finds the request's timer through a
+# context variable, which asgiref copies into those threads.
+_request_timer = ContextVar('request_query_timer', default=None)
+
+
+def _timed_execute(execute, sql, params, many, context):
+    timer = _request_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+def _wrap_new_connection(sender, connection, **kwargs):
+    if _timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_timed_execute)
+
+
+if settings.SERVER_MODE == 'asgi':
+    connection_created.connect(_wrap_new_connection, dispatch_uid='request_metrics_timer')
+
+
+class RequestMetricsMiddleware:
+    """
+    Time each request and the SQL it runs, add a Server-Timing header
+    (visible in the browser's network panel) plus X-Query-Count, and feed
+    the per-URL-name histograms behind /debug/metrics (api/metrics.py).
+    Streaming responses are timed until the view returns, not until the
+    last chunk is sent.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.REQUEST_METRICS_ENABLED:
+            return self.get_response(request)
+
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(execute_wrapper(connection, timer))
+            response = self.get_response(request)
+        return self.record(request, response, timer, start)
+
+    async def __acall__(self, request):
+        if not settings.REQUEST_METRICS_ENABLED:
+            return await self.get_response(request)
+
+        timer = QueryTimer()
+        start = time.perf_counter()
+        token = _request_timer.set(timer)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_timer.reset(token)
+        return self.record(request, response, timer, start)
+
+    def record(self, request, response, timer, start):
+        total_ms = (time.perf_counter() - start) * 1000
+        sql_ms = timer.seconds * 1000
+
+        response.headers['Server-Timing'] = (
+            f'db;dur={sql_ms:.1f};desc="{timer.count} queries", '
+            f'app;dur={total_ms - sql_ms:.1f}, total;dur={total_ms:.1f}'
+        )
+        response.headers['X-Query-Count'] = str(timer.count)
+
+        match = request.resolver_match
+        route = match.view_name if match else 'unresolved'
+        metrics.record(route, response.status_code, total_ms, timer.count, sql_ms)
+
+        if total_ms >= settings.REQUEST_SLOW_MS:
+            logger.warning(
+                "Slow request %s %s (%s): %.0f ms, %d queries, %.0f ms SQL",
+                request.method, request.path, route, total_ms, timer.count, sql_ms,
+            )
+        return response
+
+
+# ============================================================
+# READ-YOUR-WRITES FOR THE READ REPLICA
+# ============================================================
+class ReplicaStickinessMiddleware:
+    """
+    After a successful write (an unsafe method answered below 400), keep the
+    client's replica reads on the primary for REPLICA_STICKY_SECONDS so it
+    sees its own change (see api/routers.py). Does nothing without a replica.
+    """
+    sync_capable = True
+    async_capable = True
+
+    safe_methods = ('GET', 'HEAD', 'OPTIONS', 'TRACE')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def wrote(self, request, response):
+        return request.method not in self.safe_methods and response.status_code < 400
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self.wrote(request, response):
+            routers.mark_write(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.wrote(request, response):
+            await routers.amark_write(request)
+        return response
+
+
+# ============================================================
+# ON-DEMAND PROFILING
+# ============================================================
+class ProfilingMiddleware:
+    """
+    Run the view (and its response rendering) under cProfile for requests
+    that ask for it and may (see api/profiling.py), store the report and
+    return its id in X-Profile-Id. Must be the last middleware, so every
+    other process_view() has already run.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        # Django adapts process_view() itself; this only passes through
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # cProfile can't follow a coroutine across awaits; async views run unprofiled
+        if iscoroutinefunction(view_func):
+            return None
+        if not profiling.wants_profile(request) or not profiling.may_profile(request):
+            return None
+
+        def view():
+            response = view_func(request, *view_args, **view_kwargs)
+            # DRF responses serialize lazily; include that in the profile
+            if hasattr(response, 'render') and callable(response.render):
+                response = response.render()
+            return response
+
+        profiler = cProfile.Profile()
+        sql = profiling.SqlRecorder(settings.PROFILE_MAX_QUERIES)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(execute_wrapper(connection, sql))
+                response = profiler.runcall(view)
+        finally:
+            report = profiling.build_report(request, profiler, sql, time.perf_counter() - start)
+            profile_id = profiling.store_report(report)
+            logger.info("Profiled %s %s as %s", request.method, request.path, profile_id)
+
+        response.headers['X-Profile-Id'] = profile_id
+        return response
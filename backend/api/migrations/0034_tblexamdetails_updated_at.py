@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 19:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0033_alter_tblusers_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tblexamdetails',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='tblexamdetails',
+            index=models.Index(fields=['college_name', 'updated_at'], name='tbl_examdet_college_08301d_idx'),
+        ),
+    ]
@@ -290,6 +290,9 @@ class TblExamdetails(models.Model):
     college_name = models.TextField(blank=True, null=True)
     building_name = models.CharField(blank=True, null=True)
 
+    # Lets the exam viewer poll for changed rows only
+    updated_at = models.DateTimeField(auto_now=True, blank=True, null=True)
+
     class Meta:
         managed = True
         db_table = 'tbl_examdetails'
@@ -300,6 +303,7 @@ class TblExamdetails(models.Model):
             models.Index(fields=['examperiod']),
             models.Index(fields=['exam_date']),
             models.Index(fields=['course_id']),
+            models.Index(fields=['college_name', 'updated_at']),
         ]
 
 class TblExamperiod(models.Model):
@@ -0,0 +1,28 @@
+# exam-sync-v2/backend/api/pagination.py
+
+from rest_framework.pagination import CursorPagination
+
+# ============================================================
+# KEYSET PAGINATION
+# ============================================================
+# The list views return whole tables by default and the frontend relies on
+# that, so pagination is opt-in: sending `?cursor=` (empty for the first page)
+# switches a view to keyset pages of PAGE_SIZE rows, wrapped as
+# {"next": ..., "previous": ..., "results": [...]}. Follow `next` for the
+# following page. Ordering is always on a unique, indexed key so pages stay
+# stable while rows are being added.
+
+
+class KeysetPagination(CursorPagination):
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def __init__(self, ordering):
+        self.ordering = ordering
+
+    @classmethod
+    def for_request(cls, request, ordering):
+        """Return a paginator if the client opted in with ?cursor=, else None."""
+        if cls.cursor_query_param not in request.query_params:
+            return None
+        return cls(ordering)
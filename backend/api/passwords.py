@@ -0,0 +1,46 @@
+# exam-sync-v2/backend/api/passwords.py
+
+from django.contrib.auth.hashers import make_password
+
+from . import workers
+
+# ============================================================
+# PASSWORD HASHING
+# ============================================================
+# PBKDF2 is slow on purpose (~0.3s per password), so onboarding a few
+# hundred accounts serially times the request out. Batches are hashed in
+# the "passwords" pool (api/workers.py) in parallel; a batch the pool can't
+# queue is hashed in the request instead.
+
+HASH_BATCH_SIZE = 8
+
+
+def default_password(last_name, user_id):
+    """Initial password for accounts created without one: LastName@user_id."""
+    return f"{last_name}@{user_id}"
+
+
+def _hash_batch(passwords):
+    return [make_password(password) for password in passwords]
+
+
+def hash_passwords(passwords):
+    """Return make_password() of each raw password, in order."""
+    passwords = list(passwords)
+    if len(passwords) <= 1:
+        return _hash_batch(passwords)
+
+    batches = [passwords[i:i + HASH_BATCH_SIZE] for i in range(0, len(passwords), HASH_BATCH_SIZE)]
+    futures = [workers.submit('passwords', _hash_batch, batch) for batch in batches]
+
+    hashed = []
+    for batch, future in zip(batches, futures):
+        if future is not None:
+            try:
+                hashed.extend(future.result())
+                continue
+            except Exception:
+                # A child died (BrokenProcessPool); the next submit() starts a fresh pool
+                pass
+        hashed.extend(_hash_batch(batch))
+    return hashed
@@ -0,0 +1,85 @@
+# exam-sync-v2/backend/api/profiling.py
+
+import io
+import pstats
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .metrics import debug_allowed
+
+# ============================================================
+# ON-DEMAND PROFILING
+# ============================================================
+# ProfilingMiddleware (api/middleware.py) runs a single request's view under
+# cProfile when the caller asks for it with an "X-Profile: 1" header or a
+# "_profile=1" query parameter. Profiling is off unless PROFILING_ENABLED is
+# set, and even then only staff sessions or callers holding METRICS_TOKEN
+# may use it. Reports go to the default cache and are read back from
+# /debug/profile/<id>, whose id is returned in the X-Profile-Id header.
+
+PROFILE_KEY_PREFIX = 'profile'
+
+
+def wants_profile(request):
+    return request.headers.get('X-Profile') == '1' or request.GET.get('_profile') == '1'
+
+
+def may_profile(request):
+    if not settings.PROFILING_ENABLED:
+        return False
+    user = getattr(request, 'user', None)
+    return bool(user is not None and user.is_staff) or debug_allowed(request)
+
+
+class SqlRecorder:
+    """connection.execute_wrapper() keeping each statement with its duration."""
+    def __init__(self, limit):
+        self.limit = limit
+        self.statements = []
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.count += 1
+            self.seconds += duration
+            if len(self.statements) < self.limit:
+                self.statements.append({'sql': sql, 'ms': round(duration * 1000, 2), 'many': many})
+
+
+def build_report(request, profiler, sql, elapsed):
+    """Top cumulative entries as pstats text plus the SQL the request ran."""
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(settings.PROFILE_TOP)
+
+    match = request.resolver_match
+    return {
+        'method': request.method,
+        'path': request.get_full_path(),
+        'route': match.view_name if match else None,
+        'created_at': time.time(),
+        'total_ms': round(elapsed * 1000, 1),
+        'sql_ms': round(sql.seconds * 1000, 1),
+        'query_count': sql.count,
+        'queries': sql.statements,
+        'queries_truncated': sql.count > len(sql.statements),
+        'stats': stream.getvalue(),
+    }
+
+
+def store_report(report):
+    profile_id = uuid.uuid4().hex
+    cache.set(f"{PROFILE_KEY_PREFIX}:{profile_id}", report, timeout=settings.PROFILE_TTL)
+    return profile_id
+
+
+def load_report(profile_id):
+    return cache.get(f"{PROFILE_KEY_PREFIX}:{profile_id}")
@@ -0,0 +1,39 @@
+# exam-sync-v2/backend/api/renderers.py
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer backed by orjson.
+    Types orjson doesn't handle natively (Decimal, timedelta, lazy strings,
+    querysets, ...) go through DRF's own encoder, so the output matches
+    JSONRenderer, with one deliberate exception: NaN and +/-Infinity are
+    rendered as null, where DRF's STRICT_JSON raises and the request fails.
+    Data orjson can't encode at all (integers beyond 64 bits) is rendered by
+    JSONRenderer, as is everything when orjson isn't installed or the client
+    asked for indented output.
+    """
+    encoder = JSONEncoder()
+
+    if orjson is not None:
+        options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            return orjson.dumps(data, default=self.encoder.default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
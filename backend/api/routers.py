@@ -0,0 +1,128 @@
+# exam-sync-v2/backend/api/routers.py
+
+import hashlib
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# READ REPLICA ROUTING
+# ============================================================
+# Reporting reads (monitoring history, role history, attendance history,
+# export lookups) can go to the optional 'replica' database configured by
+# DB_REPLICA_* in settings.py, away from the primary taking attendance
+# writes. Nothing is routed implicitly: a view opts in with
+#
+#   @read_from_replica                      # the whole (read-only) view
+#   with replica_reads(request): ...        # one section of a view
+#
+# and every other read and all writes stay on the primary. Reads fall back
+# to the primary when:
+#   - no replica is configured (local development, tests)
+#   - the replica failed to connect within REPLICA_RETRY_SECONDS
+#   - the code is inside a transaction on the primary
+#   - this client wrote within REPLICA_STICKY_SECONDS, so it keeps seeing its
+#     own writes while the replica catches up (ReplicaStickinessMiddleware)
+
+REPLICA = 'replica'
+
+_use_replica = ContextVar('use_replica', default=False)
+_replica_down_until = 0.0
+
+
+def replica_configured():
+    return REPLICA in settings.DATABASES
+
+
+def replica_available():
+    """Configured and connectable; a failure keeps reads on the primary for a while."""
+    global _replica_down_until
+    if not replica_configured() or time.monotonic() < _replica_down_until:
+        return False
+    try:
+        connections[REPLICA].ensure_connection()
+    except DatabaseError as e:
+        _replica_down_until = time.monotonic() + settings.REPLICA_RETRY_SECONDS
+        logger.warning(
+            "Read replica unavailable, using the primary for %ss: %s", settings.REPLICA_RETRY_SECONDS, e,
+        )
+        return False
+    return True
+
+
+# Read-your-writes
+# ------------------------------
+def _sticky_key(request):
+    # The API token when the client sends one, else the IP the throttles use
+    ident = request.META.get('HTTP_AUTHORIZATION') or BaseThrottle().get_ident(request) or ''
+    return 'replica_sticky:' + hashlib.sha256(ident.encode()).hexdigest()[:32]
+
+
+def mark_write(request):
+    """Keep this client's replica reads on the primary for REPLICA_STICKY_SECONDS."""
+    if replica_configured() and settings.REPLICA_STICKY_SECONDS > 0:
+        cache.set(_sticky_key(request), 1, settings.REPLICA_STICKY_SECONDS)
+
+
+async def amark_write(request):
+    if replica_configured() and settings.REPLICA_STICKY_SECONDS > 0:
+        await cache.aset(_sticky_key(request), 1, settings.REPLICA_STICKY_SECONDS)
+
+
+def recently_wrote(request):
+    return cache.get(_sticky_key(request)) is not None
+
+
+# Opting in
+# ------------------------------
+@contextmanager
+def replica_reads(request=None):
+    """
+    Send reads inside the block to the replica when one is available and
+    `request`'s client hasn't just written. Yields whether it will.
+    """
+    use = replica_configured() and not (request is not None and recently_wrote(request)) and replica_available()
+    token = _use_replica.set(use)
+    try:
+        yield use
+    finally:
+        _use_replica.reset(token)
+
+
+def read_from_replica(view):
+    """Run a read-only view inside replica_reads(request)."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        with replica_reads(request):
+            return view(request, *args, **kwargs)
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if not _use_replica.get():
+            return None
+        # Reads inside a primary transaction must see its uncommitted writes
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return REPLICA
+
+    def db_for_write(self, model, **hints):
+        # Explicit, or saving a row read from the replica would write there
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA
@@ -2,8 +2,20 @@
 
 from rest_framework import serializers
 from django.utils import timezone
+from django.db.models import Exists, OuterRef, Prefetch, Case, When, Value
 from .models import TblScheduleapproval, TblAvailableRooms,TblScheduleFooter, TblExamOtp, TblProctorAttendance, TblProctorSubstitution, TblNotification, TblUsers, TblRoles, TblExamdetails, TblAvailability, TblModality, TblSectioncourse, TblBuildings, TblUserRoleHistory, TblRooms, TblUserRole, TblCourseUsers, TblCourse, TblProgram, TblExamperiod, TblUserRole, TblTerm, TblCollege, TblDepartment
 from django.contrib.auth.hashers import make_password
+from .fieldsets import SparseFieldsetMixin, wanted_fields
+from .caching import bump_table_version
+from .passwords import default_password
+
+def course_users_prefetch(lookup='tblcourseusers_set'):
+    """
+    Prefetch for the instructors CourseSerializer lists, with their users joined.
+    `lookup` is the path to a course's tblcourseusers_set, e.g. 'course__tblcourseusers_set'.
+    """
+    return Prefetch(lookup, queryset=TblCourseUsers.objects.select_related('user'))
+
 
 class CourseSerializer(serializers.Serializer):
     # This is a custom serializer (not ModelSerializer) because the db layout uses a join table.
@@ -15,13 +27,20 @@ class CourseSerializer(serializers.Serializer):
     leaders = serializers.ListField(child=serializers.IntegerField(), required=False)
     instructor_names = serializers.ListField(child=serializers.CharField(), read_only=True)
 
+    @staticmethod
+    def _course_users(instance):
+        # Lists prefetch these with course_users_prefetch(); a single course joins them here.
+        if 'tblcourseusers_set' in getattr(instance, '_prefetched_objects_cache', {}):
+            return instance.tblcourseusers_set.all()
+        return instance.tblcourseusers_set.select_related('user')
+
     def to_representation(self, instance: TblCourse):
         """
         instance is TblCourse model instance. Build representation expected by frontend.
         """
         term = instance.term
         # find all TblCourseUsers entries for this course
-        course_users = instance.tblcourseusers_set.select_related('user').all()
+        course_users = self._course_users(instance)
         user_ids = [cu.user.user_id for cu in course_users]
         instructor_names = [f"{cu.user.first_name} {cu.user.last_name}" for cu in course_users]
         leaders = [cu.user.user_id for cu in course_users if cu.is_bayanihan_leader]
@@ -36,6 +55,52 @@ class CourseSerializer(serializers.Serializer):
             'instructor_names': instructor_names,
         }
 
+    def _sync_course_users(self, course, user_ids, leaders):
+        """
+        Bring TblCourseUsers for `course` in line with `user_ids` / `leaders`.
+        Only the difference is written: one delete for removed instructors, one
+        bulk_create for new ones and one update for rows whose leader flag or
+        course name changed. Raises TblUsers.DoesNotExist for unknown users.
+        """
+        wanted = list(dict.fromkeys(user_ids))
+        leaders = set(leaders)
+        current = {cu.user_id: cu for cu in TblCourseUsers.objects.filter(course=course)}
+
+        removed = [uid for uid in current if uid not in wanted]
+        added = [uid for uid in wanted if uid not in current]
+        changed = [
+            uid for uid in wanted
+            if uid in current and (
+                current[uid].is_bayanihan_leader != (uid in leaders)
+                or current[uid].course_name != course.course_name
+            )
+        ]
+
+        if added:
+            found = set(TblUsers.objects.filter(pk__in=added).values_list('pk', flat=True))
+            if len(found) != len(added):
+                raise TblUsers.DoesNotExist('One or more users not found')
+
+        if removed:
+            TblCourseUsers.objects.filter(course=course, user_id__in=removed).delete()
+        if added:
+            TblCourseUsers.objects.bulk_create([
+                TblCourseUsers(course=course, user_id=uid, course_name=course.course_name, is_bayanihan_leader=uid in leaders)
+                for uid in added
+            ])
+        if changed:
+            TblCourseUsers.objects.filter(course=course, user_id__in=changed).update(
+                course_name=course.course_name,
+                is_bayanihan_leader=Case(
+                    When(user_id__in=[uid for uid in changed if uid in leaders], then=Value(True)),
+                    default=Value(False),
+                ),
+            )
+
+        # bulk_create() and update() skip the signals that bump the cache version
+        if added or changed:
+            bump_table_version(TblCourseUsers._meta.db_table)
+
     def create(self, validated_data):
         """
         Create TblCourse and associated TblCourseUsers rows.
@@ -57,13 +122,7 @@ class CourseSerializer(serializers.Serializer):
             course.term = term
             course.save()
 
-        # sync TblCourseUsers: remove all for this course then add current
-        TblCourseUsers.objects.filter(course=course).delete()
-
-        for uid in user_ids:
-            user = TblUsers.objects.get(pk=uid)
-            is_leader = uid in leaders
-            TblCourseUsers.objects.create(course=course, user=user, course_name=course_name, is_bayanihan_leader=is_leader)
+        self._sync_course_users(course, user_ids, leaders)
 
         return course
 
@@ -72,7 +131,7 @@ class CourseSerializer(serializers.Serializer):
         Update TblCourse + TblCourseUsers.
         """
         course_name = validated_data.get('course_name', instance.course_name)
-        term_id = validated_data.get('term_id', instance.term.term_id if instance.term else None)
+        term_id = validated_data.get('term_id', instance.term_id)
         user_ids = validated_data.get('user_ids', [])
         leaders = validated_data.get('leaders', [])
 
@@ -82,12 +141,7 @@ class CourseSerializer(serializers.Serializer):
         instance.course_name = course_name
         instance.save()
 
-        # sync course users
-        TblCourseUsers.objects.filter(course=instance).delete()
-        for uid in user_ids:
-            user = TblUsers.objects.get(pk=uid)
-            is_leader = uid in leaders
-            TblCourseUsers.objects.create(course=instance, user=user, course_name=course_name, is_bayanihan_leader=is_leader)
+        self._sync_course_users(instance, user_ids, leaders)
 
         return instance
     
@@ -200,7 +254,7 @@ class TblExamperiodSerializer(serializers.ModelSerializer):
             'college', 'college_id', 'college_name'
         ]
 
-class TblUserRoleSerializer(serializers.ModelSerializer):
+class TblUserRoleSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     # Input fields (for POST/PUT)
     user = serializers.PrimaryKeyRelatedField(queryset=TblUsers.objects.all())
     role = serializers.PrimaryKeyRelatedField(queryset=TblRoles.objects.all())
@@ -252,6 +306,10 @@ class TblUserRoleSerializer(serializers.ModelSerializer):
             'date_start',
             'date_ended',
         ]
+        sparse_sources = {
+            'user_full_name': ('user__first_name', 'user__last_name'),
+            'college_object': ('college__college_id', 'college__college_name'),
+        }
 
     def get_user_full_name(self, obj):
         """Return user's full name if available"""
@@ -326,6 +384,7 @@ class TblUsersSerializer(serializers.ModelSerializer):
             'password',
             'employment_type',  # ✅ NEW FIELD
         ]
+        sparse_sources = {'full_name': ('first_name', 'middle_name', 'last_name')}
 
     def get_full_name(self, obj):
         middle = f" {obj.middle_name[0]}." if obj.middle_name else ""
@@ -337,7 +396,7 @@ class TblUsersSerializer(serializers.ModelSerializer):
         
         # If no password provided, generate default: LastName@user_id
         if not password:
-            password = f"{validated_data['last_name']}@{validated_data['user_id']}"
+            password = default_password(validated_data['last_name'], validated_data['user_id'])
         
         # Hash the password
         validated_data['password'] = make_password(password)
@@ -359,7 +418,7 @@ class TblUsersSerializer(serializers.ModelSerializer):
 
 
 # Also update the basic UserSerializer if it's used elsewhere
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = TblUsers
         fields = [
@@ -546,7 +605,7 @@ class TblAvailabilitySerializer(serializers.ModelSerializer):
         instance.save()
         return instance
 
-class TblModalitySerializer(serializers.ModelSerializer):
+class TblModalitySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     room = TblRoomsSerializer(read_only=True)
     user = TblUsersSerializer(read_only=True)
     course = CourseSerializer(read_only=True)
@@ -595,12 +654,19 @@ class TblModalitySerializer(serializers.ModelSerializer):
     
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        representation['course_id'] = instance.course.course_id if instance.course else None
-        representation['user_id'] = instance.user.user_id if instance.user else None
-        representation['room_id'] = instance.room.room_id if instance.room else None
-        representation['program_id'] = instance.program_id
-        representation['sections'] = instance.sections or []
-        representation['total_students'] = instance.total_students or 0
+        # FK attnames rather than instance.course etc., so a sparse fieldset
+        # that didn't join the relation doesn't fetch it row by row.
+        overrides = {
+            'course_id': lambda: instance.course_id,
+            'user_id': lambda: instance.user_id,
+            'room_id': lambda: instance.room_id,
+            'program_id': lambda: instance.program_id,
+            'sections': lambda: instance.sections or [],
+            'total_students': lambda: instance.total_students or 0,
+        }
+        for name, value in overrides.items():
+            if name in self.fields:
+                representation[name] = value()
         return representation
     
     def create(self, validated_data):
@@ -800,7 +866,239 @@ class TblExamdetailsSerializer(serializers.ModelSerializer):
 
         instance.save()
         return instance
-    
+
+
+class TblExamdetailsListSerializer(serializers.BaseSerializer):
+    """
+    Read-only fast path for exam lists.
+    Produces the same JSON as TblExamdetailsSerializer, but from flat values()
+    rows: one joined query for the exams plus one for the course instructors,
+    instead of nested serializers and a query per exam for attendance.
+    """
+    USER_COLUMNS = (
+        'user_id', 'first_name', 'last_name', 'middle_name', 'email_address',
+        'contact_number', 'status', 'created_at', 'avatar_url', 'employment_type',
+    )
+    ROOM_COLUMNS = (
+        'room_id', 'room_name', 'room_type', 'room_capacity', 'building_id', 'building__building_name',
+    )
+    EXAM_COLUMNS = (
+        'examdetails_id', 'course_id', 'program_id', 'proctor_id',
+        'exam_duration', 'exam_start_time', 'exam_end_time',
+        'sections', 'instructors', 'proctors', 'section_name', 'instructor_id',
+        'academic_year', 'semester', 'exam_category', 'exam_period', 'exam_date',
+        'college_name', 'building_name',
+    )
+    MODALITY_COLUMNS = (
+        'modality_id', 'modality_type', 'room_type', 'modality_remarks', 'program_id',
+        'created_at', 'sections', 'total_students', 'possible_rooms',
+        'course_id', 'course__course_name', 'course__term_id', 'course__term__term_name',
+    )
+    EXAMPERIOD_COLUMNS = (
+        'examperiod_id', 'start_date', 'end_date', 'academic_year', 'exam_category',
+    )
+
+    datetime_field = serializers.DateTimeField()
+    duration_field = serializers.DurationField()
+
+    @classmethod
+    def key_columns(cls):
+        """values() columns behind each output key, in output order."""
+        return {
+            'examdetails_id': ['examdetails_id'],
+            'course_id': ['course_id'],
+            'program_id': ['program_id'],
+            'room': [f'room__{c}' for c in cls.ROOM_COLUMNS],
+            'room_id': ['room__room_id'],
+            'modality': (
+                [f'modality__{c}' for c in cls.MODALITY_COLUMNS]
+                + [f'modality__room__{c}' for c in cls.ROOM_COLUMNS]
+                + [f'modality__user__{c}' for c in cls.USER_COLUMNS]
+            ),
+            'proctor': [f'proctor__{c}' for c in cls.USER_COLUMNS],
+            'proctor_id': ['proctor_id'],
+            'examperiod': [f'examperiod__{c}' for c in cls.EXAMPERIOD_COLUMNS],
+            'exam_duration': ['exam_duration'],
+            'exam_start_time': ['exam_start_time'],
+            'exam_end_time': ['exam_end_time'],
+            'sections': ['sections'],
+            'instructors': ['instructors'],
+            'proctors': ['proctors'],
+            'section_name': ['section_name'],
+            'instructor_id': ['instructor_id'],
+            'academic_year': ['academic_year'],
+            'semester': ['semester'],
+            'exam_category': ['exam_category'],
+            'exam_period': ['exam_period'],
+            'exam_date': ['exam_date'],
+            'college_name': ['college_name'],
+            'building_name': ['building_name'],
+            'examdetails_status': ['has_attendance', 'exam_end_time'],
+        }
+
+    @classmethod
+    def values_columns(cls, keys=None):
+        key_columns = cls.key_columns()
+        columns = []
+        for key in keys if keys is not None else key_columns:
+            columns += [c for c in key_columns[key] if c not in columns]
+        return columns
+
+    @classmethod
+    def from_queryset(cls, queryset, fields=None, expand=None, paginate=None):
+        """
+        Run the list query and return serialized data.
+        With a sparse fieldset only the requested keys are selected and built.
+        `paginate` receives the values() queryset and returns the rows of one
+        page (see KeysetPagination); the primary key is always selected for it.
+        """
+        keep = wanted_fields(fields, expand)
+        keys = [key for key in cls.key_columns() if keep is None or key in keep]
+
+        if 'examdetails_status' in keys:
+            queryset = queryset.annotate(
+                has_attendance=Exists(
+                    TblProctorAttendance.objects.filter(examdetails_id=OuterRef('pk'))
+                )
+            )
+        columns = cls.values_columns(keys)
+        if 'examdetails_id' not in columns:
+            columns.append('examdetails_id')
+        rows = queryset.values(*columns)
+        rows = paginate(rows) if paginate else list(rows)
+
+        course_ids = {row['modality__course_id'] for row in rows if row.get('modality__course_id')}
+        course_users = {}
+        if course_ids:
+            for cu in TblCourseUsers.objects.filter(course_id__in=course_ids).values(
+                'course_id', 'user_id', 'is_bayanihan_leader', 'user__first_name', 'user__last_name'
+            ):
+                course_users.setdefault(cu['course_id'], []).append(cu)
+
+        return cls(rows, many=True, context={'course_users': course_users, 'keys': keys}).data
+
+    def _datetime(self, value):
+        return self.datetime_field.to_representation(value) if value is not None else None
+
+    def _user(self, row, prefix):
+        if row[f'{prefix}user_id'] is None:
+            return None
+        middle_name = row[f'{prefix}middle_name']
+        middle = f" {middle_name[0]}." if middle_name else ""
+        return {
+            'id': row[f'{prefix}user_id'],
+            'user_id': row[f'{prefix}user_id'],
+            'first_name': row[f'{prefix}first_name'],
+            'last_name': row[f'{prefix}last_name'],
+            'middle_name': middle_name,
+            'email_address': row[f'{prefix}email_address'],
+            'contact_number': row[f'{prefix}contact_number'],
+            'status': row[f'{prefix}status'],
+            'created_at': self._datetime(row[f'{prefix}created_at']),
+            'avatar_url': row[f'{prefix}avatar_url'],
+            'full_name': f"{row[f'{prefix}first_name']}{middle} {row[f'{prefix}last_name']}".strip(),
+            'employment_type': row[f'{prefix}employment_type'],
+        }
+
+    def _room(self, row, prefix):
+        if row[f'{prefix}room_id'] is None:
+            return None
+        return {
+            'room_id': row[f'{prefix}room_id'],
+            'room_name': row[f'{prefix}room_name'],
+            'room_type': row[f'{prefix}room_type'],
+            'room_capacity': row[f'{prefix}room_capacity'],
+            'building': row[f'{prefix}building_id'],
+            'building_id': row[f'{prefix}building_id'],
+            'building_name': row[f'{prefix}building__building_name'],
+        }
+
+    def _course(self, row):
+        course_id = row['modality__course_id']
+        course_users = self.context.get('course_users', {}).get(course_id, [])
+        return {
+            'course_id': course_id,
+            'course_name': row['modality__course__course_name'],
+            'term_id': row['modality__course__term_id'],
+            'term_name': row['modality__course__term__term_name'],
+            'user_ids': [cu['user_id'] for cu in course_users],
+            'leaders': [cu['user_id'] for cu in course_users if cu['is_bayanihan_leader']],
+            'instructor_names': [f"{cu['user__first_name']} {cu['user__last_name']}" for cu in course_users],
+        }
+
+    def _modality(self, row):
+        if row['modality__modality_id'] is None:
+            return None
+        return {
+            'modality_id': row['modality__modality_id'],
+            'modality_type': row['modality__modality_type'],
+            'room_type': row['modality__room_type'],
+            'modality_remarks': row['modality__modality_remarks'],
+            'course': self._course(row),
+            'course_id': row['modality__course_id'],
+            'program_id': row['modality__program_id'],
+            'room': self._room(row, 'modality__room__'),
+            'room_id': row['modality__room__room_id'],
+            'user': self._user(row, 'modality__user__'),
+            'user_id': row['modality__user__user_id'],
+            'created_at': self._datetime(row['modality__created_at']),
+            'sections': row['modality__sections'] or [],
+            'total_students': row['modality__total_students'] or 0,
+            'possible_rooms': row['modality__possible_rooms'],
+        }
+
+    def _examperiod(self, row):
+        if row['examperiod__examperiod_id'] is None:
+            return None
+        return {
+            'examperiod_id': row['examperiod__examperiod_id'],
+            'start_date': row['examperiod__start_date'],
+            'end_date': row['examperiod__end_date'],
+            'academic_year': row['examperiod__academic_year'],
+            'exam_category': row['examperiod__exam_category'],
+        }
+
+    def _status(self, row):
+        if row['has_attendance']:
+            return "confirmed"
+        if row['exam_end_time'] and timezone.now() > row['exam_end_time']:
+            return "absent"
+        return "pending"
+
+    # Output key -> builder, in the original serializer's field order.
+    KEY_BUILDERS = {
+        'examdetails_id': lambda self, row: row['examdetails_id'],
+        'course_id': lambda self, row: row['course_id'],
+        'program_id': lambda self, row: row['program_id'],
+        'room': lambda self, row: self._room(row, 'room__'),
+        'room_id': lambda self, row: row['room__room_id'],
+        'modality': lambda self, row: self._modality(row),
+        'proctor': lambda self, row: self._user(row, 'proctor__'),
+        'proctor_id': lambda self, row: row['proctor_id'],
+        'examperiod': lambda self, row: self._examperiod(row),
+        'exam_duration': lambda self, row: self.duration_field.to_representation(row['exam_duration']) if row['exam_duration'] is not None else None,
+        'exam_start_time': lambda self, row: self._datetime(row['exam_start_time']),
+        'exam_end_time': lambda self, row: self._datetime(row['exam_end_time']),
+        'sections': lambda self, row: row['sections'] or [],
+        'instructors': lambda self, row: row['instructors'] or [],
+        'proctors': lambda self, row: row['proctors'] or [],
+        'section_name': lambda self, row: row['section_name'],
+        'instructor_id': lambda self, row: row['instructor_id'],
+        'academic_year': lambda self, row: row['academic_year'],
+        'semester': lambda self, row: row['semester'],
+        'exam_category': lambda self, row: row['exam_category'],
+        'exam_period': lambda self, row: row['exam_period'],
+        'exam_date': lambda self, row: row['exam_date'],
+        'college_name': lambda self, row: row['college_name'],
+        'building_name': lambda self, row: row['building_name'],
+        'examdetails_status': lambda self, row: self._status(row),
+    }
+
+    def to_representation(self, row):
+        keys = self.context.get('keys', self.KEY_BUILDERS)
+        return {key: self.KEY_BUILDERS[key](self, row) for key in keys}
+
+
 class TblScheduleapprovalSerializer(serializers.ModelSerializer):
     submitted_by_name = serializers.SerializerMethodField()
 
@@ -0,0 +1,50 @@
+# exam-sync-v2/backend/api/signals.py
+
+from django.db.models.signals import post_save, post_delete
+
+from .caching import bump_table_version, invalidate_user_roles
+from .models import (
+    TblRooms, TblBuildings, TblProgram, TblDepartment, TblCollege, TblRoles, TblTerm,
+    TblExamperiod, TblSectioncourse, TblCourse, TblCourseUsers, TblUserRole, TblUsers,
+    TblModality, TblExamdetails, TblScheduleapproval, TblScheduleFooter,
+)
+
+# Tables whose cached payloads are invalidated through version keys.
+VERSIONED_MODELS = [
+    TblRooms,
+    TblBuildings,
+    TblProgram,
+    TblDepartment,
+    TblCollege,
+    TblRoles,
+    TblTerm,
+    # scheduler bootstrap
+    TblExamperiod,
+    TblSectioncourse,
+    TblCourse,
+    TblCourseUsers,
+    TblUserRole,
+    TblUsers,
+    TblModality,
+    TblExamdetails,
+    # schedule exports (api/exports.py)
+    TblScheduleapproval,
+    TblScheduleFooter,
+]
+
+
+def bump_model_version(sender, **kwargs):
+    bump_table_version(sender._meta.db_table)
+
+
+for model in VERSIONED_MODELS:
+    post_save.connect(bump_model_version, sender=model, dispatch_uid=f"version_save_{model._meta.db_table}")
+    post_delete.connect(bump_model_version, sender=model, dispatch_uid=f"version_delete_{model._meta.db_table}")
+
+
+def invalidate_user_roles_cache(sender, instance, **kwargs):
+    invalidate_user_roles(instance.user_id)
+
+
+post_save.connect(invalidate_user_roles_cache, sender=TblUserRole, dispatch_uid="user_roles_save")
+post_delete.connect(invalidate_user_roles_cache, sender=TblUserRole, dispatch_uid="user_roles_delete")
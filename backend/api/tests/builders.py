@@ -0,0 +1,264 @@
+# exam-sync-v2/backend/api/tests/builders.py
+
+import itertools
+import uuid
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+from ..models import (
+    TblAvailability, TblBuildings, TblCollege, TblCourse, TblCourseUsers, TblDepartment,
+    TblExamdetails, TblExamOtp, TblExamperiod, TblModality, TblNotification,
+    TblProctorAttendance, TblProgram, TblRoles, TblRooms, TblScheduleapproval,
+    TblSectioncourse, TblTerm, TblUserRole, TblUsers,
+)
+
+# ============================================================
+# FIXTURE BUILDERS
+# ============================================================
+# Each make_* creates one row with just enough data to be valid; keyword
+# arguments override any field. Keys come from a shared counter, so builders
+# can be called any number of times in one test. ExamWeek wires them together
+# into a schedule whose size a test can grow between two measurements.
+
+ROLE_NAMES = {1: 'Dean', 2: 'Admin', 3: 'Scheduler', 4: 'Bayanihan Leader', 5: 'Proctor'}
+
+_ids = itertools.count(1)
+
+
+def next_id():
+    return next(_ids)
+
+
+def make_roles():
+    """The fixed role rows views filter on by id (1 = dean, 3 = scheduler, 5 = proctor)."""
+    for role_id, role_name in ROLE_NAMES.items():
+        TblRoles.objects.get_or_create(role_id=role_id, defaults={'role_name': role_name})
+
+
+def make_college(**fields):
+    n = next_id()
+    fields.setdefault('college_id', f"C{n}")
+    fields.setdefault('college_name', f"College {n}")
+    return TblCollege.objects.create(**fields)
+
+
+def make_department(college, **fields):
+    n = next_id()
+    fields.setdefault('department_id', f"D{n}")
+    fields.setdefault('department_name', f"Department {n}")
+    return TblDepartment.objects.create(college=college, **fields)
+
+
+def make_program(department, **fields):
+    n = next_id()
+    fields.setdefault('program_id', f"P{n}")
+    fields.setdefault('program_name', f"Program {n}")
+    return TblProgram.objects.create(department=department, **fields)
+
+
+def make_term(**fields):
+    fields.setdefault('term_name', f"Term {next_id()}")
+    return TblTerm.objects.create(**fields)
+
+
+def make_building(**fields):
+    n = next_id()
+    fields.setdefault('building_id', f"B{n}")
+    fields.setdefault('building_name', f"Building {n}")
+    return TblBuildings.objects.create(**fields)
+
+
+def make_room(building, **fields):
+    n = next_id()
+    fields.setdefault('room_id', f"{building.building_id}-{n}")
+    fields.setdefault('room_name', f"Room {n}")
+    fields.setdefault('room_type', 'Lecture')
+    fields.setdefault('room_capacity', 40)
+    return TblRooms.objects.create(building=building, **fields)
+
+
+def make_user(**fields):
+    n = next_id()
+    fields.setdefault('user_id', 100000 + n)
+    fields.setdefault('first_name', f"First{n}")
+    fields.setdefault('last_name', f"Last{n}")
+    fields.setdefault('email_address', f"user{n}@example.com")
+    fields.setdefault('contact_number', '09170000000')
+    fields.setdefault('status', 'Active')
+    fields.setdefault('password', 'x')
+    return TblUsers.objects.create(**fields)
+
+
+def grant_role(user, role_id, college=None, department=None, **fields):
+    fields.setdefault('status', 'Active')
+    fields.setdefault('created_at', timezone.now())
+    return TblUserRole.objects.create(
+        user=user, role_id=role_id, college=college, department=department, **fields,
+    )
+
+
+def make_proctor(college, department=None, **fields):
+    user = make_user(**fields)
+    grant_role(user, 5, college=college, department=department)
+    return user
+
+
+def make_course(term, instructors=(), **fields):
+    n = next_id()
+    fields.setdefault('course_id', f"CRS{n}")
+    fields.setdefault('course_name', f"Course {n}")
+    course = TblCourse.objects.create(term=term, **fields)
+    for index, user in enumerate(instructors):
+        TblCourseUsers.objects.create(
+            course=course, user=user, course_name=course.course_name, is_bayanihan_leader=index == 0,
+        )
+    return course
+
+
+def make_section(course, program, term, **fields):
+    fields.setdefault('section_name', f"S{next_id()}")
+    fields.setdefault('number_of_students', 35)
+    fields.setdefault('year_level', '1')
+    return TblSectioncourse.objects.create(course=course, program=program, term=term, **fields)
+
+
+def make_exam_period(term, college=None, department=None, **fields):
+    start = timezone.make_aware(datetime.combine(date.today(), time(0, 0)))
+    fields.setdefault('start_date', start)
+    fields.setdefault('end_date', start + timedelta(days=5))
+    fields.setdefault('academic_year', '2025-2026')
+    fields.setdefault('exam_category', 'Midterm')
+    return TblExamperiod.objects.create(term=term, college=college, department=department, **fields)
+
+
+def make_modality(course, program, user, sections=(), possible_rooms=(), **fields):
+    fields.setdefault('modality_type', 'Written (Lecture)')
+    fields.setdefault('room_type', 'Lecture')
+    fields.setdefault('created_at', timezone.now())
+    return TblModality.objects.create(
+        course=course, program_id=program.program_id, user=user,
+        sections=list(sections), possible_rooms=list(possible_rooms), **fields,
+    )
+
+
+def make_exam(modality, room, examperiod, college, proctors=(), instructors=(), start=None, **fields):
+    start = start or timezone.now().replace(minute=0, second=0, microsecond=0)
+    proctor_ids = [user.user_id for user in proctors]
+    fields.setdefault('exam_date', timezone.localtime(start).date().isoformat())
+    fields.setdefault('exam_period', examperiod.exam_category)
+    fields.setdefault('exam_category', examperiod.exam_category)
+    fields.setdefault('academic_year', examperiod.academic_year)
+    fields.setdefault('semester', examperiod.term.term_name)
+    fields.setdefault('building_name', room.building.building_name)
+    return TblExamdetails.objects.create(
+        course_id=modality.course_id,
+        program_id=modality.program_id,
+        room=room,
+        modality=modality,
+        examperiod=examperiod,
+        proctor_id=proctor_ids[0] if proctor_ids else None,
+        proctors=proctor_ids,
+        instructors=[user.user_id for user in instructors],
+        sections=list(modality.sections or []),
+        exam_duration=timedelta(hours=1, minutes=30),
+        exam_start_time=start,
+        exam_end_time=start + timedelta(hours=1, minutes=30),
+        college_name=college.college_id,
+        **fields,
+    )
+
+
+def make_otp(exam, **fields):
+    fields.setdefault('otp_code', f"{exam.room_id}-{exam.course_id}-{next_id()}")
+    fields.setdefault('expires_at', timezone.now() + timedelta(days=1))
+    return TblExamOtp.objects.create(examdetails=exam, **fields)
+
+
+def make_attendance(exam, proctor, **fields):
+    fields.setdefault('otp_used', 'OTP')
+    return TblProctorAttendance.objects.create(examdetails=exam, proctor=proctor, **fields)
+
+
+def make_availability(user, days=None, **fields):
+    fields.setdefault('time_slots', ['7 AM - 1 PM (Morning)'])
+    fields.setdefault('status', 'available')
+    fields.setdefault('type', 'availability')
+    return TblAvailability.objects.create(user=user, days=days or [date.today()], **fields)
+
+
+def make_notification(user, sender=None, **fields):
+    fields.setdefault('title', 'Notice')
+    fields.setdefault('message', f"Message {next_id()}")
+    fields.setdefault('type', 'general')
+    return TblNotification.objects.create(user=user, sender=sender, **fields)
+
+
+def approve_schedule(college, dean, examperiod):
+    return TblScheduleapproval.objects.create(
+        request_id=uuid.uuid4(),
+        dean_user_id=dean.user_id,
+        submitted_by=dean,
+        status='approved',
+        created_at=timezone.now(),
+        submitted_at=timezone.now(),
+        college_name=college.college_id,
+        schedule_data={
+            'college_name': college.college_id,
+            'exam_period': examperiod.exam_category,
+            'semester': examperiod.term.term_name,
+            'academic_year': examperiod.academic_year,
+        },
+    )
+
+
+class ExamWeek:
+    """
+    One college's exam week: a dean, a scheduler, an approved schedule and,
+    per add_exams() row, its own course, section, modality, room, proctor,
+    OTP, attendance, availability and notification. Each exam starts an hour
+    after the previous one, from half an hour ago, so dashboards see ongoing
+    and upcoming exams; past=True adds exams that ended yesterday instead.
+    Passing `proctor` assigns every new exam to that one user.
+    """
+    def __init__(self):
+        make_roles()
+        self.college = make_college()
+        self.department = make_department(self.college)
+        self.program = make_program(self.department)
+        self.term = make_term()
+        self.building = make_building()
+        self.dean = make_user()
+        grant_role(self.dean, 1, college=self.college)
+        self.scheduler = make_user()
+        grant_role(self.scheduler, 3, college=self.college)
+        self.examperiod = make_exam_period(self.term, college=self.college)
+        self.approval = approve_schedule(self.college, self.dean, self.examperiod)
+        self.start = timezone.now().replace(second=0, microsecond=0) - timedelta(minutes=30)
+        self.exams = []
+        self.proctors = []
+
+    def add_exams(self, count, proctor=None, past=False):
+        for _ in range(count):
+            index = len(self.exams)
+            start = self.start + timedelta(hours=index) - timedelta(days=1 if past else 0)
+            instructor = make_user()
+            exam_proctor = proctor or make_proctor(self.college, self.department)
+            course = make_course(self.term, instructors=[instructor])
+            section = make_section(course, self.program, self.term, user=instructor)
+            room = make_room(self.building)
+            modality = make_modality(
+                course, self.program, self.scheduler,
+                sections=[section.section_name], possible_rooms=[room.room_id],
+            )
+            exam = make_exam(
+                modality, room, self.examperiod, self.college,
+                proctors=[exam_proctor], instructors=[instructor], start=start,
+            )
+            make_otp(exam)
+            make_attendance(exam, exam_proctor)
+            make_availability(exam_proctor)
+            make_notification(exam_proctor, sender=self.scheduler)
+            self.exams.append(exam)
+            self.proctors.append(exam_proctor)
+        return self
@@ -0,0 +1,38 @@
+# exam-sync-v2/backend/api/tests/test_availability.py
+
+import json
+from datetime import date, datetime, time, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import TblAvailability
+from .builders import make_availability, make_exam_period, make_term, make_user
+
+# ============================================================
+# BULK AVAILABILITY
+# ============================================================
+
+
+class AvailabilityBulkTests(TestCase):
+    def test_replace_uses_the_periods_local_dates(self):
+        # A Manila-midnight period, stored as 16:00 UTC the day before
+        start = timezone.make_aware(datetime.combine(date(2026, 3, 9), time(0, 0)))
+        period = make_exam_period(make_term(), start_date=start, end_date=start + timedelta(days=4))
+        user = make_user()
+        make_availability(user, days=[date(2026, 3, 8)])
+        make_availability(user, days=[date(2026, 3, 13)])
+
+        response = self.client.post('/api/tbl_availability/bulk/', json.dumps({
+            'items': [{'user_id': user.user_id, 'days': ['2026-03-10'],
+                       'time_slots': ['7 AM - 1 PM (Morning)'], 'status': 'available'}],
+            'replace': True,
+            'examperiod_id': period.examperiod_id,
+        }), content_type='application/json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json(), {'created': 1, 'deleted': 1})
+        self.assertEqual(
+            sorted(d for row in TblAvailability.objects.filter(user=user) for d in row.days),
+            [date(2026, 3, 8), date(2026, 3, 10)],
+        )
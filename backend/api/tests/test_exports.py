@@ -0,0 +1,75 @@
+# exam-sync-v2/backend/api/tests/test_exports.py
+
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .. import exports
+from ..exports import approved_schedule
+from ..models import TblScheduleapproval
+from .builders import approve_schedule, make_college, make_exam_period, make_term, make_user
+
+# ============================================================
+# SCHEDULE EXPORTS
+# ============================================================
+
+
+class ApprovedScheduleTests(TestCase):
+    def setUp(self):
+        self.college = make_college()
+        self.dean = make_user()
+        self.approval = approve_schedule(self.college, self.dean, make_exam_period(make_term(), college=self.college))
+
+    def resubmit(self, status):
+        return TblScheduleapproval.objects.create(
+            request_id=uuid.uuid4(),
+            dean_user_id=self.dean.user_id,
+            submitted_by=self.dean,
+            status=status,
+            created_at=timezone.now(),
+            submitted_at=self.approval.submitted_at + timedelta(minutes=5),
+            college_name=self.college.college_id,
+            schedule_data=self.approval.schedule_data,
+        )
+
+    def test_latest_approval(self):
+        self.assertEqual(approved_schedule(self.college.college_id), self.approval)
+
+    def test_newer_submission_hides_the_old_approval(self):
+        for status in ('pending', 'rejected'):
+            with self.subTest(status=status):
+                newer = self.resubmit(status)
+                self.assertIsNone(approved_schedule(self.college.college_id))
+                response = self.client.get(f'/api/schedule-export/csv/?college_name={self.college.college_id}')
+                self.assertEqual(response.status_code, 404)
+                newer.delete()
+
+
+@override_settings(STORAGES={**settings.STORAGES, 'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'}})
+class ExportFileTests(TestCase):
+    def setUp(self):
+        self.college = make_college()
+        approve_schedule(self.college, make_user(), make_exam_period(make_term(), college=self.college))
+
+    def test_file_pruned_before_it_is_opened_is_rendered_again(self):
+        render = exports.render_export
+        renders = []
+
+        def render_then_prune(approval, fmt, name):
+            render(approval, fmt, name)
+            renders.append(name)
+            if len(renders) == 1:
+                # A request for another version prunes ours before we open it
+                default_storage.delete(name)
+
+        with mock.patch.object(exports, 'render_export', side_effect=render_then_prune):
+            response = self.client.get(f'/api/schedule-export/csv/?college_name={self.college.college_id}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(renders), 2)
+        self.assertIn(b'Date,Start,End', b''.join(response.streaming_content))
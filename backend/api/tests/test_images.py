@@ -0,0 +1,72 @@
+# exam-sync-v2/backend/api/tests/test_images.py
+
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, override_settings
+from PIL import Image
+
+from ..images import store_original
+
+# ============================================================
+# MEDIA VIEW
+# ============================================================
+# An upload's variants are rendered after it returns; until then the media
+# view answers a variant's URL with the original, whatever the storage.
+
+ORIGINAL = 'avatars/7/0123456789abcdef-original.png'
+VARIANT = 'avatars/7/0123456789abcdef-400.jpg'
+
+
+def png():
+    buffer = BytesIO()
+    Image.new('RGB', (4, 4)).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+class MediaTestCase(SimpleTestCase):
+    def setUp(self):
+        default_storage.save(ORIGINAL, ContentFile(png()))
+
+
+@override_settings(STORAGES={**settings.STORAGES, 'default': {'BACKEND': 'django.core.files.storage.InMemoryStorage'}})
+class ObjectStorageMediaTests(MediaTestCase):
+    @override_settings(MEDIA_BASE_URL='https://api.example.edu/')
+    def test_stored_url_goes_through_the_media_view(self):
+        _, url = store_original('avatars', 8, png())
+        self.assertTrue(url.startswith('https://api.example.edu/media/avatars/8/'), url)
+
+    def test_variant_falls_back_to_the_original_until_rendered(self):
+        response = self.client.get(f'/media/{VARIANT}')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], default_storage.url(ORIGINAL))
+        self.assertEqual(response['Cache-Control'], 'no-store')
+
+        default_storage.save(VARIANT, ContentFile(b'jpeg'))
+        response = self.client.get(f'/media/{VARIANT}')
+        self.assertEqual(response.status_code, 301)
+        self.assertEqual(response['Location'], default_storage.url(VARIANT))
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_unknown_file(self):
+        self.assertEqual(self.client.get('/media/avatars/7/ffffffffffffffff-400.jpg').status_code, 404)
+
+
+class LocalMediaTests(MediaTestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        local = override_settings(MEDIA_ROOT=media_root)
+        local.enable()
+        self.addCleanup(local.disable)
+        super().setUp()
+
+    def test_variant_falls_back_to_the_original_until_rendered(self):
+        response = self.client.get(f'/media/{VARIANT}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), png())
+        self.assertEqual(response['Cache-Control'], 'no-store')
@@ -0,0 +1,203 @@
+# exam-sync-v2/backend/api/tests/test_mail.py
+
+import json
+import threading
+from unittest import mock
+
+import httpx
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.throttling import SimpleRateThrottle
+
+from .. import mailer
+from ..models import TblNotification
+from .builders import ExamWeek, make_user
+
+# ============================================================
+# MAIL DELIVERY
+# ============================================================
+# Resend is replaced by an httpx.MockTransport that records each request
+# and answers with whatever the test queued for that path.
+
+
+class ResendStub:
+    def __init__(self):
+        self.requests = []
+        self.responses = {}
+
+    def reply(self, path, *responses):
+        self.responses[path] = list(responses)
+
+    def handler(self, request):
+        payload = json.loads(request.content)
+        self.requests.append((request.url.path, payload))
+        queued = self.responses.get(request.url.path)
+        if queued:
+            return queued.pop(0)
+        if request.url.path == '/emails/batch':
+            return httpx.Response(200, json={'data': [{'id': f'm{i}'} for i in range(len(payload))]})
+        return httpx.Response(200, json={'id': 'm0'})
+
+    def client(self):
+        return httpx.AsyncClient(base_url='https://resend.test', transport=httpx.MockTransport(self.handler))
+
+
+class MailTestCase(TestCase):
+    def setUp(self):
+        cache.clear()  # throttle history
+        self.resend = ResendStub()
+        patcher = mock.patch.object(mailer, 'make_client', self.resend.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post(self, url, body):
+        return self.client.post(url, json.dumps(body), content_type='application/json')
+
+
+@override_settings(MAIL_BATCH_SIZE=2, MAIL_RETRIES=1)
+class SendProctorEmailsTests(MailTestCase):
+    def setUp(self):
+        super().setUp()
+        self.sender = make_user()
+        self.proctors = [make_user() for _ in range(3)]
+
+    def emails(self):
+        return [
+            {'email': p.email_address, 'name': p.first_name,
+             'subject': 'Schedule', 'message': 'Hello', 'user_id': p.user_id}
+            for p in self.proctors
+        ]
+
+    def test_sends_in_batches_and_records_notifications(self):
+        body = {'sender_id': self.sender.user_id, 'emails': self.emails() + [{'email': 'x@example.com'}]}
+        response = self.post('/api/send-proctor-emails/', body)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data['sent_count'], data['total_count'], data['success']), (3, 4, True))
+        self.assertEqual(data['failed_emails'][0]['reason'], 'Missing required fields')
+        self.assertEqual([len(payload) for _, payload in self.resend.requests], [2, 1])
+        self.assertEqual(TblNotification.objects.filter(type='email', sender=self.sender).count(), 3)
+
+    def test_failed_batch_fails_its_messages(self):
+        self.resend.reply('/emails/batch', httpx.Response(500, json={'message': 'Internal error'}))
+        data = self.post('/api/send-proctor-emails/', {'sender_id': self.sender.user_id, 'emails': self.emails()}).json()
+
+        self.assertEqual(data['sent_count'], 1)
+        self.assertEqual(len(data['failed_emails']), 2)
+        self.assertIn('Internal error', data['failed_emails'][0]['reason'])
+        self.assertEqual(TblNotification.objects.filter(type='email').count(), 1)
+
+    def test_invalid_address_fails_only_its_message(self):
+        self.resend.reply('/emails/batch', httpx.Response(422, json={'message': 'Invalid `to` field'}))
+        self.resend.reply('/emails', httpx.Response(422, json={'message': 'Invalid `to` field'}))
+        data = self.post('/api/send-proctor-emails/', {'sender_id': self.sender.user_id, 'emails': self.emails()}).json()
+
+        self.assertEqual(data['sent_count'], 2)
+        [failed] = data['failed_emails']
+        self.assertEqual(failed['email'], self.proctors[0].email_address)
+        self.assertIn('Invalid `to` field', failed['reason'])
+        self.assertEqual(sorted(path for path, _ in self.resend.requests), ['/emails', '/emails'] + ['/emails/batch'] * 2)
+
+    def test_rate_limited_batch_is_retried(self):
+        self.resend.reply('/emails/batch', httpx.Response(429, headers={'Retry-After': '0'}))
+        data = self.post('/api/send-proctor-emails/', {'emails': self.emails()[:1]}).json()
+
+        self.assertEqual(data['sent_count'], 1)
+        self.assertEqual(len(self.resend.requests), 2)
+
+    def test_no_emails(self):
+        self.assertEqual(self.post('/api/send-proctor-emails/', {'emails': []}).status_code, 400)
+
+
+class PasswordResetEmailTests(MailTestCase):
+    def setUp(self):
+        super().setUp()
+        self.deliveries = []
+        send_later = mailer.send_later
+        patcher = mock.patch.object(mailer, 'send_later', lambda payload: self.deliveries.append(send_later(payload)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def delivered(self):
+        for thread in self.deliveries:
+            thread.join()
+
+    def test_stores_token_and_sends_link(self):
+        user = make_user(email_address='reset@example.com')
+        response = self.post('/api/auth/request-password-change/', {'email': 'reset@example.com'})
+
+        self.assertEqual(response.status_code, 200)
+        self.delivered()
+        token = cache.get(f'password_reset_{user.pk}')
+        [(path, payload)] = self.resend.requests
+        self.assertEqual((path, payload['to']), ('/emails', ['reset@example.com']))
+        self.assertIn(token, payload['text'])
+
+    def test_delivery_failure_is_not_reported(self):
+        make_user(email_address='reset@example.com')
+        self.resend.reply('/emails', httpx.Response(500, text='down'))
+        with self.assertLogs('api.mailer', 'WARNING'):
+            response = self.post('/api/auth/request-password-change/', {'email': 'reset@example.com'})
+            self.delivered()
+        self.assertEqual(response.status_code, 200)
+
+    def test_response_does_not_wait_for_delivery(self):
+        make_user(email_address='reset@example.com')
+        release = threading.Event()
+        handler = self.resend.handler
+        self.resend.handler = lambda request: release.wait(5) and handler(request)
+
+        response = self.post('/api/auth/request-password-change/', {'email': 'reset@example.com'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.resend.requests, [])
+        release.set()
+        self.delivered()
+        self.assertEqual(len(self.resend.requests), 1)
+
+    def test_unknown_email(self):
+        response = self.post('/api/auth/request-password-change/', {'email': 'nobody@example.com'})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.resend.requests, [])
+
+
+class MailThrottleTests(MailTestCase):
+    @mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {'anon': '2/min'})
+    def test_requests_over_the_anon_rate_are_refused(self):
+        user = make_user(email_address='reset@example.com')
+        email = {'email': user.email_address, 'subject': 'Schedule', 'message': 'Hello', 'user_id': user.user_id}
+        for url, body in [
+            ('/api/auth/request-password-change/', {'email': user.email_address}),
+            ('/api/send-proctor-emails/', {'emails': [email]}),
+        ]:
+            cache.clear()
+            statuses = [self.post(url, body).status_code for _ in range(3)]
+            self.assertEqual(statuses, [200, 200, 429])
+        self.assertIn('Retry-After', self.post(url, body))
+
+
+class ApprovalFanOutTests(TestCase):
+    def approve(self, week):
+        week.approval.status = 'pending'
+        week.approval.save()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                f'/api/tbl_scheduleapproval/{week.approval.request_id}/',
+                json.dumps({'status': 'approved'}), content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_notifies_every_proctor_in_constant_queries(self):
+        small = self.approve(ExamWeek().add_exams(2))
+        week = ExamWeek().add_exams(5)
+        large = self.approve(week)
+
+        self.assertEqual(large, small)
+        notified = TblNotification.objects.filter(type='schedule_approval', sender_id=week.dean.user_id)
+        self.assertEqual(
+            set(notified.values_list('user_id', flat=True)),
+            {p.user_id for p in week.proctors} | {week.dean.user_id},
+        )
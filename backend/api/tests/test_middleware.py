@@ -0,0 +1,55 @@
+# exam-sync-v2/backend/api/tests/test_middleware.py
+
+from django.core.cache import cache, caches
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import TransactionTestCase, override_settings
+
+from .. import middleware
+from .builders import make_roles
+
+# ============================================================
+# QUERY WRAPPERS
+# ============================================================
+# The metrics and profiling middleware wrap the connection for one request.
+# When the connection is (re)opened inside that request, as it is every
+# time without persistent connections, the wrappers must still come off.
+
+
+@override_settings(PROFILING_ENABLED=True, METRICS_TOKEN='token')
+class ExecuteWrapperTests(TransactionTestCase):
+    def setUp(self):
+        make_roles()
+        # As on a fresh worker thread: nothing on the connection yet
+        connection.execute_wrappers.clear()
+
+    def wrappers_after_requests(self, url, count=5, **headers):
+        sizes = []
+        for _ in range(count):
+            cache.clear()
+            caches['reference'].clear()
+            connection.close()
+            response = self.client.get(url, **headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['X-Query-Count'], '0')
+            sizes.append(len(connection.execute_wrappers))
+        return sizes
+
+    def assertFlat(self, sizes):
+        self.assertEqual(len(set(sizes)), 1, f"execute_wrappers grew across requests: {sizes}")
+
+    def test_metrics(self):
+        self.assertFlat(self.wrappers_after_requests('/api/tbl_roles/'))
+
+    def test_profiling(self):
+        sizes = self.wrappers_after_requests('/api/tbl_roles/?_profile=1', HTTP_X_METRICS_TOKEN='token')
+        self.assertFlat(sizes)
+
+    def test_with_asgi_connection_hook(self):
+        # SERVER_MODE=asgi adds _timed_execute to each connection as it opens
+        connection_created.connect(middleware._wrap_new_connection, dispatch_uid='test_asgi_timer')
+        self.addCleanup(connection_created.disconnect, dispatch_uid='test_asgi_timer')
+
+        self.assertFlat(self.wrappers_after_requests('/api/tbl_roles/'))
+        self.assertFlat(self.wrappers_after_requests('/api/tbl_roles/?_profile=1', HTTP_X_METRICS_TOKEN='token'))
+        self.assertEqual(connection.execute_wrappers.count(middleware._timed_execute), 1)
@@ -0,0 +1,30 @@
+# exam-sync-v2/backend/api/tests/test_pagination.py
+
+from django.test import TestCase
+
+from .builders import ExamWeek
+
+# ============================================================
+# KEYSET PAGINATION
+# ============================================================
+
+
+class CursorTests(TestCase):
+    URLS = ('/api/tbl_examdetails', '/api/proctor-monitoring/')
+
+    def setUp(self):
+        ExamWeek().add_exams(3)
+
+    def test_first_page(self):
+        for url in self.URLS:
+            with self.subTest(url=url):
+                response = self.client.get(url, {'cursor': ''})
+                self.assertEqual(response.status_code, 200)
+                self.assertIn('results', response.json())
+
+    def test_invalid_cursor_is_not_found(self):
+        for url in self.URLS:
+            with self.subTest(url=url):
+                response = self.client.get(url, {'cursor': 'not-a-cursor'})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json(), {'detail': 'Invalid cursor'})
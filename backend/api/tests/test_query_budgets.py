@@ -0,0 +1,183 @@
+# exam-sync-v2/backend/api/tests/test_query_budgets.py
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..models import TblProctorAttendanceHistory
+from .builders import ExamWeek
+
+# ============================================================
+# QUERY BUDGETS
+# ============================================================
+# Every list endpoint is requested twice: once against a small exam week and
+# once after more rows were added. The query count must not change between
+# the two (no per-row lookups) and must stay within the endpoint's budget.
+# Caches are cleared before each request so the cold path is what's counted.
+
+
+class QueryBudgetTestCase(TestCase):
+    initial_rows = 2
+    added_rows = 3
+
+    def setUp(self):
+        self.week = ExamWeek().add_exams(self.initial_rows)
+
+    def count_queries(self, url, params=None):
+        cache.clear()
+        caches['reference'].clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200, f"GET {url} -> {response.status_code}")
+        return [query['sql'] for query in queries.captured_queries]
+
+    def assertQueryBudget(self, url, budget, params=None, grow=None):
+        """
+        Fail if GET `url` runs more than `budget` queries, or if the count
+        changes after grow() (by default: add_exams(added_rows)) adds rows.
+        `url` and `params` may be callables, evaluated for each request.
+        """
+        def resolve(value):
+            return value() if callable(value) else value
+
+        before = self.count_queries(resolve(url), resolve(params))
+        if grow is None:
+            self.week.add_exams(self.added_rows)
+        else:
+            grow()
+        after = self.count_queries(resolve(url), resolve(params))
+
+        self.assertEqual(
+            len(after), len(before),
+            f"GET {resolve(url)}: {len(before)} queries grew to {len(after)} with more rows:\n"
+            + '\n'.join(after),
+        )
+        self.assertLessEqual(
+            len(before), budget,
+            f"GET {resolve(url)}: {len(before)} queries, budget is {budget}:\n" + '\n'.join(before),
+        )
+
+
+class UserEndpointTests(QueryBudgetTestCase):
+    def test_users_list(self):
+        self.assertQueryBudget('/api/users/', 1)
+
+    def test_accounts_list(self):
+        self.assertQueryBudget('/api/accounts/', 1)
+
+    def test_user_role_list(self):
+        self.assertQueryBudget('/api/tbl_user_role', 1)
+
+    def test_user_roles_bulk(self):
+        self.assertQueryBudget('/api/user-roles/bulk/', 1, {'college_id': self.week.college.college_id})
+
+    def test_users_bulk(self):
+        self.assertQueryBudget(
+            '/api/users/bulk/', 1,
+            lambda: {'ids': ','.join(str(user.user_id) for user in self.week.proctors)},
+        )
+
+    def test_user_role_history(self):
+        self.assertQueryBudget('/api/user-role-history/', 1)
+
+    def test_proctors_list(self):
+        self.client.force_login(get_user_model().objects.create_user('scheduler', password='x'))
+        self.assertQueryBudget(f'/api/proctors/{self.week.scheduler.user_id}/', 5)
+
+
+class ReferenceEndpointTests(QueryBudgetTestCase):
+    def test_terms(self):
+        self.assertQueryBudget('/api/tbl_term', 1)
+
+    def test_colleges(self):
+        self.assertQueryBudget('/api/tbl_college/', 1)
+
+    def test_departments(self):
+        self.assertQueryBudget('/api/departments/', 2)
+
+    def test_programs(self):
+        self.assertQueryBudget('/api/programs/', 2)
+
+    def test_buildings(self):
+        self.assertQueryBudget('/api/tbl_buildings', 1)
+
+    def test_rooms(self):
+        self.assertQueryBudget('/api/tbl_rooms', 1)
+
+    def test_roles(self):
+        self.assertQueryBudget('/api/tbl_roles/', 1)
+
+    def test_exam_periods(self):
+        self.assertQueryBudget('/api/tbl_examperiod', 3)
+
+    def test_available_rooms(self):
+        self.assertQueryBudget('/api/tbl_available_rooms/', 1)
+
+    def test_schedule_footer(self):
+        self.assertQueryBudget('/api/tbl_schedule_footer/', 1)
+
+
+class SchedulingEndpointTests(QueryBudgetTestCase):
+    def test_courses(self):
+        self.assertQueryBudget('/api/courses/', 2)
+
+    def test_course_users(self):
+        self.assertQueryBudget('/api/tbl_course_users/', 2)
+
+    def test_section_courses(self):
+        self.assertQueryBudget('/api/tbl_sectioncourse/', 2)
+
+    def test_section_course_page_data(self):
+        self.assertQueryBudget('/api/tbl_sectioncourse/page-data/', 7)
+
+    def test_modalities(self):
+        self.assertQueryBudget('/api/tbl_modality/', 2)
+
+    def test_availability(self):
+        self.assertQueryBudget('/api/tbl_availability/', 1)
+
+    def test_exam_details(self):
+        self.assertQueryBudget('/api/tbl_examdetails', 2, {'college_name': self.week.college.college_id})
+
+    def test_schedule_approvals(self):
+        self.assertQueryBudget('/api/tbl_scheduleapproval/', 1)
+
+    def test_scheduler_bootstrap(self):
+        self.assertQueryBudget('/api/scheduler/bootstrap/', 13, {'college_id': self.week.college.college_id})
+
+    def test_scheduler_viewer(self):
+        self.assertQueryBudget('/api/scheduler/viewer/', 7, {'college_id': self.week.college.college_id})
+
+
+class ProctorEndpointTests(QueryBudgetTestCase):
+    def test_notifications(self):
+        proctor = self.week.proctors[0]
+        self.assertQueryBudget(
+            f'/api/notifications/{proctor.user_id}/', 1,
+            grow=lambda: self.week.add_exams(self.added_rows, proctor=proctor),
+        )
+
+    def test_proctor_assigned_exams(self):
+        proctor = self.week.proctors[0]
+        self.assertQueryBudget(
+            f'/api/proctor-assigned-exams/{proctor.user_id}/', 6,
+            grow=lambda: self.week.add_exams(self.added_rows, proctor=proctor),
+        )
+
+    def test_exams_for_substitution(self):
+        self.assertQueryBudget(
+            '/api/all-exams-for-substitution/', 3, {'user_id': self.week.proctors[0].user_id},
+        )
+
+    def test_monitoring_dashboard(self):
+        self.assertQueryBudget('/api/proctor-monitoring/', 9, {'college_name': self.week.college.college_id})
+
+    def test_monitoring_dashboard_archives_in_one_batch(self):
+        self.week.add_exams(self.initial_rows, past=True)
+        self.assertQueryBudget(
+            '/api/proctor-monitoring/', 16, {'college_name': self.week.college.college_id},
+            grow=lambda: self.week.add_exams(self.added_rows, past=True),
+        )
+        self.assertEqual(TblProctorAttendanceHistory.objects.count(), self.initial_rows + self.added_rows)
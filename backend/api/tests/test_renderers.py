@@ -0,0 +1,31 @@
+# exam-sync-v2/backend/api/tests/test_renderers.py
+
+import datetime
+import decimal
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from ..renderers import ORJSONRenderer
+
+# ============================================================
+# JSON RENDERING
+# ============================================================
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    def test_matches_json_renderer(self):
+        data = {
+            'when': timezone.now(), 'date': datetime.date(2026, 1, 2), 'time': datetime.time(1, 2, 3, 456789),
+            'amount': decimal.Decimal('1.50'), 'id': uuid.uuid4(), 'duration': datetime.timedelta(hours=1),
+            'name': 'Peña ✓', 'keys': {1: 'x'}, 'big': 2 ** 70,
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_non_finite_floats_are_null(self):
+        data = {'nan': float('nan'), 'inf': float('inf'), '-inf': float('-inf')}
+        self.assertEqual(ORJSONRenderer().render(data), b'{"nan":null,"inf":null,"-inf":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
@@ -0,0 +1,88 @@
+# exam-sync-v2/backend/api/tests/test_routers.py
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from .. import routers
+from ..middleware import ReplicaStickinessMiddleware
+from ..models import TblProctorAttendanceHistory
+from ..routers import REPLICA, ReplicaRouter, recently_wrote, replica_reads
+
+# ============================================================
+# READ REPLICA ROUTING
+# ============================================================
+# The test settings have no replica, so these patch replica_configured()
+# and replica_available() to exercise the routing decisions without one.
+
+
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def read_db(self):
+        return self.router.db_for_read(TblProctorAttendanceHistory)
+
+    def with_replica(self):
+        configured = mock.patch.object(routers, 'replica_configured', return_value=True)
+        available = mock.patch.object(routers, 'replica_available', return_value=True)
+        configured.start()
+        available.start()
+        self.addCleanup(configured.stop)
+        self.addCleanup(available.stop)
+
+    def test_primary_without_replica(self):
+        with replica_reads() as using:
+            self.assertFalse(using)
+            self.assertIsNone(self.read_db())
+
+    def test_replica_only_inside_block(self):
+        self.with_replica()
+        with replica_reads() as using:
+            self.assertTrue(using)
+            self.assertEqual(self.read_db(), REPLICA)
+        self.assertIsNone(self.read_db())
+        self.assertEqual(self.router.db_for_write(TblProctorAttendanceHistory), 'default')
+
+    def test_primary_inside_transaction(self):
+        self.with_replica()
+        with replica_reads(), mock.patch.object(connection, 'in_atomic_block', True):
+            self.assertIsNone(self.read_db())
+
+    def test_unreachable_replica_falls_back(self):
+        replica = mock.Mock(ensure_connection=mock.Mock(side_effect=routers.DatabaseError('down')))
+        with mock.patch.object(routers, 'replica_configured', return_value=True), \
+                mock.patch.object(routers, 'connections', {REPLICA: replica}), \
+                mock.patch.object(routers, '_replica_down_until', 0.0):
+            with self.assertLogs('api.routers', 'WARNING'):
+                self.assertFalse(routers.replica_available())
+            # Not retried until REPLICA_RETRY_SECONDS pass
+            self.assertFalse(routers.replica_available())
+        replica.ensure_connection.assert_called_once()
+
+    @override_settings(REPLICA_STICKY_SECONDS=5)
+    def test_writer_reads_primary_for_a_while(self):
+        self.with_replica()
+        middleware = ReplicaStickinessMiddleware(lambda request: HttpResponse(status=201))
+        middleware(self.factory.post('/api/submit-proctor-attendance/', HTTP_AUTHORIZATION='Token a'))
+
+        writer = self.factory.get('/api/proctor-monitoring/', HTTP_AUTHORIZATION='Token a')
+        other = self.factory.get('/api/proctor-monitoring/', HTTP_AUTHORIZATION='Token b')
+        self.assertTrue(recently_wrote(writer))
+        with replica_reads(writer) as using:
+            self.assertFalse(using)
+        with replica_reads(other) as using:
+            self.assertTrue(using)
+
+    def test_failed_or_safe_requests_are_not_writes(self):
+        self.with_replica()
+        rejected = ReplicaStickinessMiddleware(lambda request: HttpResponse(status=400))
+        rejected(self.factory.post('/api/verify-otp/'))
+        ok = ReplicaStickinessMiddleware(lambda request: HttpResponse())
+        ok(self.factory.get('/api/verify-otp/'))
+        self.assertFalse(recently_wrote(self.factory.get('/api/proctor-monitoring/')))
@@ -0,0 +1,44 @@
+# exam-sync-v2/backend/api/tests/test_seed.py
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import TblExamdetails, TblProctorAttendance, TblProctorAttendanceHistory
+from ..views import archive_completed_attendances
+
+# ============================================================
+# SEEDED DATABASE
+# ============================================================
+
+
+class SeedUniversityTests(TestCase):
+    def setUp(self):
+        call_command(
+            'seed_university', colleges=1, departments=1, programs=1, courses=2, sections=1,
+            faculty=3, buildings=1, rooms=3, exam_days=2,
+            start=timezone.localdate() - timedelta(days=1), stdout=StringIO(),
+        )
+
+    def test_real_attendance_is_archived_alongside_seeded_history(self):
+        seeded = TblProctorAttendanceHistory.objects.all()
+        self.assertTrue(seeded.exists())
+        self.assertFalse(seeded.filter(attendance_id__gte=0).exists())
+
+        # An attendance whose id equals a seeded exam id, once its exam ends
+        history = seeded.first()
+        exam = TblExamdetails.objects.get(pk=history.examdetails_id)
+        TblProctorAttendance.objects.filter(pk=exam.pk).delete()
+        attendance = TblProctorAttendance.objects.create(
+            attendance_id=exam.pk, examdetails=exam, proctor_id=history.proctor_id, otp_used='OTP',
+            time_in=exam.exam_start_time,
+        )
+        self.assertLess(exam.exam_end_time, timezone.now())
+
+        archive_completed_attendances()
+
+        self.assertFalse(TblProctorAttendance.objects.filter(pk=attendance.pk).exists())
+        self.assertTrue(TblProctorAttendanceHistory.objects.filter(attendance_id=attendance.pk).exists())
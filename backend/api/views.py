@@ -1,13 +1,19 @@
 # exam-sync-v2/backend/api/views.py
 
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+from django.http import JsonResponse
+from asgiref.sync import sync_to_async
+from functools import wraps
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
+from rest_framework.fields import DateTimeField
+from rest_framework.exceptions import APIException, ValidationError as DRFValidationError, Throttled
+from rest_framework.settings import api_settings
 from rest_framework import status
 from rest_framework import status as http_status
-from django.views.decorators.cache import cache_page
 from datetime import datetime, time
 from django.db.models import Q
 from .models import TblUsers, TblScheduleapproval, TblProctorAttendanceHistory, TblScheduleFooter, TblProctorSubstitution, TblProctorAttendance, TblExamOtp, TblAvailableRooms, TblNotification, TblUserRole, TblExamdetails, TblModality, TblAvailability, TblCourseUsers, TblSectioncourse, TblUserRoleHistory, TblRoles, TblBuildings, TblRooms, TblCourse, TblExamperiod, TblProgram, TblTerm, TblCollege, TblDepartment
@@ -31,28 +37,43 @@ from .serializers import (
     TblAvailabilitySerializer,
     TblModalitySerializer,
     TblExamdetailsSerializer,
+    TblExamdetailsListSerializer,
     TblScheduleapprovalSerializer,
     ScheduleSendSerializer,
     TblNotificationSerializer,
     EmailNotificationSerializer,
     TblAvailableRoomsSerializer,
-    TblScheduleFooterSerializer
+    TblScheduleFooterSerializer,
+    course_users_prefetch,
 )
 from django.core.mail import send_mail
 from django.contrib.auth.hashers import make_password, check_password
 from django.contrib.auth import get_user_model
 from django.conf import settings
-from django.db import transaction
+from django.db import transaction, IntegrityError
+from django.db.models.functions import Lower
 from django.utils import timezone
 from uuid import uuid4
-from threading import Thread
-from django.db.models import Q, Prefetch
+from django.db.models import Q, Prefetch, Exists, OuterRef
 import random
 import string
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as dt_timezone
 import secrets
 from django.core.cache import cache
+from .caching import cached_reference_list, versioned_cache_key, user_roles_cache_keys, bump_table_version, invalidate_user_roles
+from .fieldsets import parse_fieldset, sparse_queryset, wanted_fields
+from .pagination import KeysetPagination
+from .importers import IMPORTERS, ImportFileError, read_rows
+from .passwords import default_password, hash_passwords
+from .exports import EXPORT_FORMATS, ExportUnavailable, approved_schedule, export_file
+from . import mailer, metrics, profiling
+from .routers import mark_write, read_from_replica, replica_reads
+from .images import validate_image_upload, store_original, queue_variants, delete_images, original_for_variant, is_local_storage
 import re
+import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
@@ -551,8 +572,26 @@ def proctor_assigned_exams(request, user_id):
             'modality',
             'modality__course'
         ).prefetch_related(
-            'attendance_records'
+            Prefetch(
+                'attendance_records',
+                queryset=TblProctorAttendance.objects.filter(proctor_id=user_id).order_by('attendance_id'),
+                to_attr='own_attendance',
+            )
         ).order_by('exam_date', 'exam_start_time')
+        exams = list(exams)
+
+        # Instructor names for every exam in one query
+        instructor_ids = set()
+        for exam in exams:
+            instructor_ids.update(exam.instructors or [])
+            if exam.instructor_id:
+                instructor_ids.add(exam.instructor_id)
+        instructor_names_by_id = {
+            uid: f"{first} {last}"
+            for uid, first, last in TblUsers.objects.filter(user_id__in=instructor_ids).values_list(
+                'user_id', 'first_name', 'last_name'
+            )
+        }
 
         ongoing = []
         upcoming = []
@@ -587,9 +626,7 @@ def proctor_assigned_exams(request, user_id):
             if not is_schedule_approved(exam):
                 continue
 
-            attendance = exam.attendance_records.filter(
-                proctor_id=user_id
-            ).first()
+            attendance = exam.own_attendance[0] if exam.own_attendance else None
 
             if attendance:
                 if attendance.is_substitute:
@@ -603,24 +640,10 @@ def proctor_assigned_exams(request, user_id):
             else:
                 exam_status = 'absent' if now > exam_end_datetime else 'pending'
 
-            instructor_names = []
-            if exam.instructors:
-                for instructor_id in exam.instructors:
-                    try:
-                        instructor = TblUsers.objects.get(user_id=instructor_id)
-                        instructor_names.append(
-                            f"{instructor.first_name} {instructor.last_name}"
-                        )
-                    except TblUsers.DoesNotExist:
-                        pass
-            elif exam.instructor_id:
-                try:
-                    instructor = TblUsers.objects.get(user_id=exam.instructor_id)
-                    instructor_names.append(
-                        f"{instructor.first_name} {instructor.last_name}"
-                    )
-                except TblUsers.DoesNotExist:
-                    pass
+            exam_instructor_ids = exam.instructors or ([exam.instructor_id] if exam.instructor_id else [])
+            instructor_names = [
+                instructor_names_by_id[uid] for uid in exam_instructor_ids if uid in instructor_names_by_id
+            ]
 
             instructor_name = ', '.join(instructor_names) if instructor_names else None
             sections_display = ', '.join(exam.sections) if exam.sections else exam.section_name
@@ -650,20 +673,21 @@ def proctor_assigned_exams(request, user_id):
             proctor_id=user_id
         ).order_by('-exam_date', '-exam_start_time')
 
-        for record in history_records:
-            completed.append({
-                'id': record.examdetails_id,
-                'course_id': record.course_id,
-                'subject': record.course_id,
-                'section_name': record.section_name,
-                'exam_date': record.exam_date,
-                'exam_start_time': record.exam_start_time.isoformat() if record.exam_start_time else None,
-                'exam_end_time': record.exam_end_time.isoformat() if record.exam_end_time else None,
-                'building_name': record.building_name,
-                'room_id': record.room_id,
-                'instructor_name': record.instructor_name,
-                'status': record.status
-            })
+        with replica_reads(request):
+            for record in history_records:
+                completed.append({
+                    'id': record.examdetails_id,
+                    'course_id': record.course_id,
+                    'subject': record.course_id,
+                    'section_name': record.section_name,
+                    'exam_date': record.exam_date,
+                    'exam_start_time': record.exam_start_time.isoformat() if record.exam_start_time else None,
+                    'exam_end_time': record.exam_end_time.isoformat() if record.exam_end_time else None,
+                    'building_name': record.building_name,
+                    'room_id': record.room_id,
+                    'instructor_name': record.instructor_name,
+                    'status': record.status
+                })
 
         return Response({
             'ongoing': ongoing,
@@ -692,102 +716,110 @@ def archive_completed_attendances():
         examdetails__exam_end_time__lt=now
     )
 
-    archived_count = 0
-
-    with transaction.atomic():
-        for attendance in completed_attendances:
-            exam = attendance.examdetails
-
-            # Determine status
-            if attendance.is_substitute:
-                status = 'substitute'
-            elif attendance.time_in:
-                exam_start_datetime = build_exam_datetime(
-                    exam.exam_date,
-                    exam.exam_start_time
-                )
-                time_diff = (
-                    (attendance.time_in - exam_start_datetime)
-                    .total_seconds() / 60
-                )
-                status = 'late' if time_diff > 7 else 'confirmed'
-            else:
-                status = 'absent'
-
-            # Get instructor name
-            instructor_name = None
-            if exam.instructors:
-                instructor_names = []
-                for instructor_id in exam.instructors:
-                    try:
-                        instructor = TblUsers.objects.get(user_id=instructor_id)
-                        instructor_names.append(
-                            f"{instructor.first_name} {instructor.last_name}"
-                        )
-                    except TblUsers.DoesNotExist:
-                        pass
-                instructor_name = ', '.join(instructor_names) if instructor_names else None
-            elif exam.instructor_id:
-                try:
-                    instructor = TblUsers.objects.get(user_id=exam.instructor_id)
-                    instructor_name = f"{instructor.first_name} {instructor.last_name}"
-                except TblUsers.DoesNotExist:
-                    pass
-
-            # Substitution info
-            substituted_for_id = None
-            substituted_for_name = None
-
-            if attendance.is_substitute:
-                try:
-                    substitution = TblProctorSubstitution.objects.filter(
-                        examdetails=exam,
-                        substitute_proctor_id=attendance.proctor_id
-                    ).first()
-
-                    if substitution and substitution.original_proctor:
-                        substituted_for_id = substitution.original_proctor.user_id
-                        substituted_for_name = (
-                            f"{substitution.original_proctor.first_name} "
-                            f"{substitution.original_proctor.last_name}"
-                        )
-                except Exception:
-                    pass
-
-            # Skip if already archived
-            if TblProctorAttendanceHistory.objects.filter(
-                attendance_id=attendance.attendance_id
-            ).exists():
-                continue
+    attendances = list(completed_attendances)
+    if not attendances:
+        return 0
+
+    # Names, substitutions and already-archived rows for the whole batch
+    exams = {attendance.examdetails_id: attendance.examdetails for attendance in attendances}
+    instructor_ids = set()
+    for exam in exams.values():
+        instructor_ids.update(exam.instructors or [])
+        if exam.instructor_id:
+            instructor_ids.add(exam.instructor_id)
+    instructor_names_by_id = {
+        uid: f"{first} {last}"
+        for uid, first, last in TblUsers.objects.filter(user_id__in=instructor_ids).values_list(
+            'user_id', 'first_name', 'last_name'
+        )
+    }
+    substitutions = {}
+    for substitution in TblProctorSubstitution.objects.filter(
+        examdetails_id__in=list(exams)
+    ).select_related('original_proctor').order_by('substitution_id'):
+        substitutions.setdefault((substitution.examdetails_id, substitution.substitute_proctor_id), substitution)
+    already_archived = set(TblProctorAttendanceHistory.objects.filter(
+        attendance_id__in=[attendance.attendance_id for attendance in attendances]
+    ).values_list('attendance_id', flat=True))
+
+    records = []
+    for attendance in attendances:
+        exam = attendance.examdetails
+
+        # Skip if already archived
+        if attendance.attendance_id in already_archived:
+            continue
 
-            # Create history record
-            TblProctorAttendanceHistory.objects.create(
-                attendance_id=attendance.attendance_id,
-                examdetails_id=exam.examdetails_id,
-                proctor_id=attendance.proctor_id,
-                proctor_name=f"{attendance.proctor.first_name} {attendance.proctor.last_name}",
-                course_id=exam.course_id,
-                section_name=', '.join(exam.sections) if exam.sections else exam.section_name,
-                exam_date=exam.exam_date,
-                exam_start_time=exam.exam_start_time,
-                exam_end_time=exam.exam_end_time,
-                building_name=exam.building_name,
-                room_id=exam.room.room_id if exam.room else None,
-                instructor_name=instructor_name,
-                is_substitute=attendance.is_substitute,
-                remarks=attendance.remarks,
-                substituted_for_id=substituted_for_id,
-                substituted_for_name=substituted_for_name,
-                time_in=attendance.time_in,
-                time_out=attendance.time_out,
-                otp_used=attendance.otp_used,
-                status=status
+        # Determine status
+        if attendance.is_substitute:
+            status = 'substitute'
+        elif attendance.time_in:
+            exam_start_datetime = build_exam_datetime(
+                exam.exam_date,
+                exam.exam_start_time
             )
+            time_diff = (
+                (attendance.time_in - exam_start_datetime)
+                .total_seconds() / 60
+            )
+            status = 'late' if time_diff > 7 else 'confirmed'
+        else:
+            status = 'absent'
+
+        # Get instructor name
+        instructor_name = None
+        if exam.instructors:
+            instructor_names = [
+                instructor_names_by_id[uid] for uid in exam.instructors if uid in instructor_names_by_id
+            ]
+            instructor_name = ', '.join(instructor_names) if instructor_names else None
+        elif exam.instructor_id:
+            instructor_name = instructor_names_by_id.get(exam.instructor_id)
+
+        # Substitution info
+        substituted_for_id = None
+        substituted_for_name = None
+
+        if attendance.is_substitute:
+            substitution = substitutions.get((exam.examdetails_id, attendance.proctor_id))
+            if substitution and substitution.original_proctor:
+                substituted_for_id = substitution.original_proctor.user_id
+                substituted_for_name = (
+                    f"{substitution.original_proctor.first_name} "
+                    f"{substitution.original_proctor.last_name}"
+                )
 
-            archived_count += 1
-
-        if archived_count > 0:
-            completed_attendances.delete()
+        records.append(TblProctorAttendanceHistory(
+            attendance_id=attendance.attendance_id,
+            examdetails_id=exam.examdetails_id,
+            proctor_id=attendance.proctor_id,
+            proctor_name=f"{attendance.proctor.first_name} {attendance.proctor.last_name}",
+            course_id=exam.course_id,
+            section_name=', '.join(exam.sections) if exam.sections else exam.section_name,
+            exam_date=exam.exam_date,
+            exam_start_time=exam.exam_start_time,
+            exam_end_time=exam.exam_end_time,
+            building_name=exam.building_name,
+            room_id=exam.room.room_id if exam.room else None,
+            instructor_name=instructor_name,
+            is_substitute=attendance.is_substitute,
+            remarks=attendance.remarks,
+            substituted_for_id=substituted_for_id,
+            substituted_for_name=substituted_for_name,
+            time_in=attendance.time_in,
+            time_out=attendance.time_out,
+            otp_used=attendance.otp_used,
+            status=status
+        ))
+
+    archived_count = len(records)
+    if archived_count > 0:
+        with transaction.atomic():
+            TblProctorAttendanceHistory.objects.bulk_create(records)
+            # Only the rows read above; attendances completing meanwhile wait for the next run
+            TblProctorAttendance.objects.filter(
+                attendance_id__in=[attendance.attendance_id for attendance in attendances]
+            ).delete()
 
     return archived_count
 
@@ -811,13 +843,13 @@ def all_exams_for_substitution(request):
         today = timezone.now().date()
         
         # Get user's assigned exams to check conflicts
-        user_exams = TblExamdetails.objects.filter(
+        user_exams = list(TblExamdetails.objects.filter(
             Q(proctor_id=user_id) | Q(proctors__contains=[user_id]),
             exam_date__gte=today.isoformat()
-        ).values('exam_date', 'exam_start_time', 'exam_end_time')
+        ).values('exam_date', 'exam_start_time', 'exam_end_time'))
         
         # Get all upcoming exams
-        all_exams = TblExamdetails.objects.filter(
+        all_exams = list(TblExamdetails.objects.filter(
             exam_date__gte=today.isoformat()
         ).exclude(
             Q(proctor_id=user_id) | Q(proctors__contains=[user_id])
@@ -826,7 +858,17 @@ def all_exams_for_substitution(request):
             'room__building',
             'proctor',
             'modality'
-        ).order_by('exam_date', 'exam_start_time')
+        ).annotate(
+            has_attendance=Exists(TblProctorAttendance.objects.filter(examdetails=OuterRef('pk')))
+        ).order_by('exam_date', 'exam_start_time'))
+
+        # Instructor names for every exam in one query
+        instructor_names = {
+            uid: f"{first} {last}"
+            for uid, first, last in TblUsers.objects.filter(
+                user_id__in={exam.instructor_id for exam in all_exams if exam.instructor_id}
+            ).values_list('user_id', 'first_name', 'last_name')
+        }
         
         result = []
         for exam in all_exams:
@@ -843,22 +885,14 @@ def all_exams_for_substitution(request):
             if has_conflict:
                 continue
             
-            # Get instructor name
-            instructor_name = None
-            if exam.instructor_id:
-                try:
-                    instructor = TblUsers.objects.get(user_id=exam.instructor_id)
-                    instructor_name = f"{instructor.first_name} {instructor.last_name}"
-                except TblUsers.DoesNotExist:
-                    pass
+            instructor_name = instructor_names.get(exam.instructor_id)
             
             # Get assigned proctor name
             assigned_proctor = None
             if exam.proctor:
                 assigned_proctor = f"{exam.proctor.first_name} {exam.proctor.last_name}"
             
-            has_attendance = TblProctorAttendance.objects.filter(examdetails=exam).exists()
-            exam_status = 'confirmed' if has_attendance else 'pending'
+            exam_status = 'confirmed' if exam.has_attendance else 'pending'
             sections_display = ', '.join(exam.sections) if exam.sections else exam.section_name
             
             result.append({
@@ -895,9 +929,13 @@ def proctor_monitoring_dashboard(request):
     """
     Get monitoring data - shows WHO checked in for each exam
     FIXED: Check history table first to preserve statuses
+    With ?cursor= the archived history records are paged; live exams are
+    only included on the first page.
     """
     try:
-        archive_completed_attendances()
+        # Rows archived just now may not have reached the replica yet
+        if archive_completed_attendances():
+            mark_write(request)
         college_name = request.GET.get('college_name')
         exam_date = request.GET.get('exam_date')
         year = request.GET.get('year')
@@ -924,25 +962,48 @@ def proctor_monitoring_dashboard(request):
         queryset = queryset.order_by('exam_date', 'exam_start_time')
         result = []
 
-        for exam in queryset:
-            try:
-                otp_record = TblExamOtp.objects.filter(examdetails=exam).first()
-                otp_code = otp_record.otp_code if otp_record else None
-            except Exception:
-                otp_code = None
+        paginator = KeysetPagination.for_request(request, '-history_id')
+        if paginator and request.query_params.get(paginator.cursor_query_param):
+            queryset = queryset.none()
+
+        # Everything the rows below look up, fetched once for all exams
+        exams = list(queryset)
+        exam_ids = [exam.examdetails_id for exam in exams]
+        otp_codes = dict(
+            TblExamOtp.objects.filter(examdetails_id__in=exam_ids).values_list('examdetails_id', 'otp_code')
+        )
+        history_records = {}
+        for record in TblProctorAttendanceHistory.objects.filter(examdetails_id__in=exam_ids).order_by('history_id'):
+            history_records.setdefault((record.examdetails_id, record.proctor_id), record)
+        user_ids = set()
+        for exam in exams:
+            user_ids.update(exam.proctors or [])
+            user_ids.update(exam.instructors or [])
+            user_ids.update(uid for uid in (exam.proctor_id, exam.instructor_id) if uid)
+        user_names = {
+            uid: f"{first} {last}"
+            for uid, first, last in TblUsers.objects.filter(user_id__in=user_ids).values_list(
+                'user_id', 'first_name', 'last_name'
+            )
+        }
+
+        for exam in exams:
+            otp_code = otp_codes.get(exam.examdetails_id)
+            attendances = sorted(exam.attendance_records.all(), key=lambda a: a.attendance_id)
+            attendance_by_proctor = {}
+            for attendance in attendances:
+                attendance_by_proctor.setdefault(attendance.proctor_id, attendance)
 
             assigned_proctor_ids = exam.proctors if exam.proctors else ([exam.proctor_id] if exam.proctor_id else [])
             proctor_statuses = []
 
             for proctor_id in assigned_proctor_ids:
                 try:
-                    proctor = TblUsers.objects.get(user_id=proctor_id)
-                    proctor_name = f"{proctor.first_name} {proctor.last_name}"
+                    proctor_name = user_names.get(proctor_id)
+                    if proctor_name is None:
+                        continue
 
-                    history_record = TblProctorAttendanceHistory.objects.filter(
-                        examdetails_id=exam.examdetails_id,
-                        proctor_id=proctor_id
-                    ).first()
+                    history_record = history_records.get((exam.examdetails_id, proctor_id))
 
                     if history_record:
                         proctor_statuses.append({
@@ -957,7 +1018,7 @@ def proctor_monitoring_dashboard(request):
                         })
                         continue
 
-                    attendance = exam.attendance_records.filter(proctor_id=proctor_id).first()
+                    attendance = attendance_by_proctor.get(proctor_id)
                     if attendance:
                         if attendance.is_substitute:
                             status = 'substitute'
@@ -978,9 +1039,7 @@ def proctor_monitoring_dashboard(request):
                         if attendance.is_substitute:
                             assigned_ids = exam.proctors if exam.proctors else ([exam.proctor_id] if exam.proctor_id else [])
                             if assigned_ids:
-                                original_proctor = TblUsers.objects.filter(user_id=assigned_ids[0]).first()
-                                if original_proctor:
-                                    substituted_for = f"{original_proctor.first_name} {original_proctor.last_name}"
+                                substituted_for = user_names.get(assigned_ids[0])
                         proctor_statuses.append({
                             'proctor_id': proctor_id,
                             'proctor_name': proctor_name,
@@ -1001,24 +1060,21 @@ def proctor_monitoring_dashboard(request):
                             'is_assigned': True,
                             'is_substitute': False
                         })
-                except TblUsers.DoesNotExist:
-                    continue
                 except Exception:
                     continue
 
-            for attendance in exam.attendance_records.filter(is_substitute=True):
+            substitutions = sorted(exam.substitutions.all(), key=lambda s: s.substitution_id)
+            for attendance in attendances:
+                if not attendance.is_substitute:
+                    continue
                 if not any(p['proctor_id'] == attendance.proctor_id for p in proctor_statuses):
                     proctor_name = f"{attendance.proctor.first_name} {attendance.proctor.last_name}"
                     original_proctor_name = None
-                    try:
-                        substitution = TblProctorSubstitution.objects.filter(
-                            examdetails=exam,
-                            substitute_proctor_id=attendance.proctor_id
-                        ).first()
-                        if substitution and substitution.original_proctor:
-                            original_proctor_name = f"{substitution.original_proctor.first_name} {substitution.original_proctor.last_name}"
-                    except Exception:
-                        pass
+                    substitution = next(
+                        (s for s in substitutions if s.substitute_proctor_id == attendance.proctor_id), None
+                    )
+                    if substitution and substitution.original_proctor:
+                        original_proctor_name = f"{substitution.original_proctor.first_name} {substitution.original_proctor.last_name}"
                     proctor_statuses.append({
                         'proctor_id': attendance.proctor_id,
                         'proctor_name': proctor_name,
@@ -1047,20 +1103,8 @@ def proctor_monitoring_dashboard(request):
             overall_status = 'confirmed' if has_any_attendance else 'pending'
             first_time_in = next((p['time_in'] for p in proctor_statuses if p['time_in']), None)
 
-            instructor_names = []
-            if exam.instructors:
-                for instructor_id in exam.instructors:
-                    try:
-                        instructor = TblUsers.objects.get(user_id=instructor_id)
-                        instructor_names.append(f"{instructor.first_name} {instructor.last_name}")
-                    except TblUsers.DoesNotExist:
-                        pass
-            elif exam.instructor_id:
-                try:
-                    instructor = TblUsers.objects.get(user_id=exam.instructor_id)
-                    instructor_names.append(f"{instructor.first_name} {instructor.last_name}")
-                except TblUsers.DoesNotExist:
-                    pass
+            instructor_ids = exam.instructors or ([exam.instructor_id] if exam.instructor_id else [])
+            instructor_names = [user_names[uid] for uid in instructor_ids if uid in user_names]
 
             instructor_name = ', '.join(instructor_names) if instructor_names else None
             sections_display = ', '.join(exam.sections) if exam.sections else exam.section_name
@@ -1102,40 +1146,50 @@ def proctor_monitoring_dashboard(request):
         if is_viewing_history:
             result = []
 
-        for record in history_query:
-            result.append({
-                'id': record.examdetails_id,
-                'course_id': record.course_id,
-                'subject': record.course_id,
-                'section_name': record.section_name,
-                'exam_date': record.exam_date,
-                'exam_start_time': record.exam_start_time.isoformat() if record.exam_start_time else None,
-                'exam_end_time': record.exam_end_time.isoformat() if record.exam_end_time else None,
-                'building_name': record.building_name,
-                'room_id': record.room_id,
-                'proctor_name': record.proctor_name,
-                'proctor_details': [{
-                    'proctor_id': record.proctor_id,
+        # Archived history is read-only reporting; the replica can serve it
+        with replica_reads(request):
+            if paginator:
+                history_query = paginator.paginate_queryset(history_query, request)
+
+            for record in history_query:
+                result.append({
+                    'id': record.examdetails_id,
+                    'course_id': record.course_id,
+                    'subject': record.course_id,
+                    'section_name': record.section_name,
+                    'exam_date': record.exam_date,
+                    'exam_start_time': record.exam_start_time.isoformat() if record.exam_start_time else None,
+                    'exam_end_time': record.exam_end_time.isoformat() if record.exam_end_time else None,
+                    'building_name': record.building_name,
+                    'room_id': record.room_id,
                     'proctor_name': record.proctor_name,
+                    'proctor_details': [{
+                        'proctor_id': record.proctor_id,
+                        'proctor_name': record.proctor_name,
+                        'status': record.status,
+                        'time_in': record.time_in.isoformat() if record.time_in else None,
+                        'is_assigned': not record.is_substitute,
+                        'is_substitute': record.is_substitute,
+                        'substituted_for': record.substituted_for_name,
+                        'substitution_remarks': record.remarks if record.is_substitute else None
+                    }],
+                    'instructor_name': record.instructor_name,
+                    'department': '',
+                    'college': '',
+                    'examdetails_status': record.status,
                     'status': record.status,
-                    'time_in': record.time_in.isoformat() if record.time_in else None,
-                    'is_assigned': not record.is_substitute,
-                    'is_substitute': record.is_substitute,
-                    'substituted_for': record.substituted_for_name,
-                    'substitution_remarks': record.remarks if record.is_substitute else None
-                }],
-                'instructor_name': record.instructor_name,
-                'department': '',
-                'college': '',
-                'examdetails_status': record.status,
-                'status': record.status,
-                'code_entry_time': record.time_in.isoformat() if record.time_in else None,
-                'otp_code': record.otp_used,
-                'approval_status': 'approved'
-            })
+                    'code_entry_time': record.time_in.isoformat() if record.time_in else None,
+                    'otp_code': record.otp_used,
+                    'approval_status': 'approved'
+                })
 
+        if paginator:
+            return paginator.get_paginated_response(result)
         return Response(result, status=http_status.HTTP_200_OK)
 
+    except APIException:
+        # e.g. an invalid ?cursor= (404); DRF renders it
+        raise
     except Exception as e:
         return Response({
             'error': str(e),
@@ -1444,17 +1498,6 @@ def tbl_scheduleapproval_detail(request, pk):
                         college_name=college_name
                     ).select_related('proctor', 'room', 'room__building').order_by('exam_date', 'exam_start_time')
                     
-                    # Get dean name for notification
-                    dean_name = "Dean"
-                    dean_email = ""
-                    if updated_approval.dean_user_id:
-                        try:
-                            dean = TblUsers.objects.get(user_id=updated_approval.dean_user_id)
-                            dean_name = f"{dean.first_name} {dean.last_name}"
-                            dean_email = dean.email_address or ""
-                        except TblUsers.DoesNotExist:
-                            pass
-                    
                     # Group exams by proctor
                     proctor_schedules = {}
                     for exam in exams:
@@ -1487,14 +1530,29 @@ def tbl_scheduleapproval_detail(request, pk):
                         except:
                             return date_str
                     
-                    # Create notifications for all proctors with their specific schedules
-                    notifications_created = 0
+                    # Dean, scheduler and every proctor in one query
+                    users = TblUsers.objects.in_bulk({
+                        *proctor_schedules,
+                        updated_approval.dean_user_id,
+                        updated_approval.submitted_by_id,
+                    } - {None})
+
+                    # Get dean name for notification
+                    dean_name = "Dean"
+                    dean_email = ""
+                    dean = users.get(updated_approval.dean_user_id)
+                    if dean:
+                        dean_name = f"{dean.first_name} {dean.last_name}"
+                        dean_email = dean.email_address or ""
+
+                    # Build notifications for all proctors with their specific schedules
+                    now = timezone.now()
+                    notifications = []
                     for proctor_id, proctor_exams in proctor_schedules.items():
+                        proctor = users.get(proctor_id)
+                        if proctor is None:
+                            continue
                         try:
-                            # Get proctor details
-                            proctor = TblUsers.objects.get(user_id=proctor_id)
-                            proctor_name = f"{proctor.first_name} {proctor.last_name}"
-                            
                             # Build detailed schedule message
                             notification_message = f"Dear {proctor.first_name} {proctor.last_name},\n\n"
                             notification_message += f"The exam schedule for {college_name} has been approved by {dean_name}.\n\n"
@@ -1524,8 +1582,7 @@ def tbl_scheduleapproval_detail(request, pk):
                             if dean_email:
                                 notification_message += f"{dean_email}"
                             
-                            # Create notification
-                            TblNotification.objects.create(
+                            notifications.append(TblNotification(
                                 user_id=proctor_id,
                                 sender_id=updated_approval.dean_user_id,
                                 title=f"Proctoring Assignment - {college_name}",
@@ -1535,23 +1592,19 @@ def tbl_scheduleapproval_detail(request, pk):
                                 link_url='/proctor-schedule',
                                 is_seen=False,
                                 priority=2,
-                                created_at=timezone.now()
-                            )
-                            notifications_created += 1
+                                created_at=now
+                            ))
                             
-                        except TblUsers.DoesNotExist:
-                            continue
                         except Exception as e:
                             import traceback
                             traceback.print_exc()
                             continue
+                    notifications_created = len(notifications)
                     
                     # Also notify the scheduler who submitted it
-                    if updated_approval.submitted_by_id:
+                    scheduler = users.get(updated_approval.submitted_by_id)
+                    if scheduler:
                         try:
-                            scheduler = TblUsers.objects.get(user_id=updated_approval.submitted_by_id)
-                            scheduler_name = f"{scheduler.first_name} {scheduler.last_name}"
-                            
                             scheduler_notification_message = (
                                 f"Dear {scheduler.first_name} {scheduler.last_name},\n\n"
                                 f"Your exam schedule for {college_name} has been approved by {dean_name}.\n\n"
@@ -1562,7 +1615,7 @@ def tbl_scheduleapproval_detail(request, pk):
                                 f"Dean, {college_name}"
                             )
                             
-                            TblNotification.objects.create(
+                            notifications.append(TblNotification(
                                 user_id=updated_approval.submitted_by_id,
                                 sender_id=updated_approval.dean_user_id,
                                 title=f"Schedule Approved - {college_name}",
@@ -1572,10 +1625,13 @@ def tbl_scheduleapproval_detail(request, pk):
                                 link_url='/scheduler-dashboard',
                                 is_seen=False,
                                 priority=1,
-                                created_at=timezone.now()
-                            )
+                                created_at=now
+                            ))
                         except Exception:
                             pass
+
+                    # Nothing here waits on anything but Postgres: one insert for the whole fan-out
+                    TblNotification.objects.bulk_create(notifications)
                     
                 except Exception as e:
                     # Log error but don't fail the approval
@@ -1598,15 +1654,7 @@ def tbl_scheduleapproval_detail(request, pk):
 def tbl_examdetails_list(request):
     if request.method == 'GET':
         try:
-            queryset = TblExamdetails.objects.select_related(
-                'room',
-                'room__building',
-                'modality',
-                'modality__course',
-                'modality__user',
-                'proctor',
-                'examperiod'
-            ).all()
+            queryset = TblExamdetails.objects.all()
 
             # Filter by proctor_id (supports both single proctor and proctors array)
             proctor_id = request.GET.get('proctor_id')
@@ -1635,10 +1683,23 @@ def tbl_examdetails_list(request):
             if modality_id:
                 modality_ids = [mid.strip() for mid in modality_id.split(',') if mid.strip()]
                 queryset = queryset.filter(modality_id__in=modality_ids)
-            
-            serializer = TblExamdetailsSerializer(queryset, many=True)
-            return Response(serializer.data)
+
+            # Read path: one joined values() query instead of nested serializers
+            fields, expand = parse_fieldset(request)
+
+            paginator = KeysetPagination.for_request(request, 'examdetails_id')
+            if paginator:
+                data = TblExamdetailsListSerializer.from_queryset(
+                    queryset, fields, expand,
+                    paginate=lambda rows: paginator.paginate_queryset(rows, request),
+                )
+                return paginator.get_paginated_response(data)
+
+            return Response(TblExamdetailsListSerializer.from_queryset(queryset, fields, expand))
         
+        except APIException:
+            # e.g. an invalid ?cursor= (404); DRF renders it
+            raise
         except Exception as e:
             return Response(
                 {'error': str(e), 'detail': 'Failed to fetch exam details'},
@@ -1720,8 +1781,12 @@ def tbl_modality_list(request):
                 queryset = queryset.filter(modality_type=modality_type)
             if room_type:
                 queryset = queryset.filter(room_type=room_type)
-            
-            serializer = TblModalitySerializer(queryset, many=True)
+
+            fields, expand = parse_fieldset(request)
+            queryset = sparse_queryset(queryset, TblModalitySerializer, fields, expand)
+            if 'course' in (wanted_fields(fields, expand) or {'course'}):
+                queryset = queryset.prefetch_related(course_users_prefetch('course__tblcourseusers_set'))
+            serializer = TblModalitySerializer(queryset, many=True, fields=fields, expand=expand)
             return Response(serializer.data)
         
         except Exception as e:
@@ -1846,6 +1911,11 @@ def tbl_availability_list(request):
         if days:
             availabilities = availabilities.filter(days__overlap=days)
 
+        paginator = KeysetPagination.for_request(request, 'availability_id')
+        if paginator:
+            page = paginator.paginate_queryset(availabilities, request)
+            return paginator.get_paginated_response(TblAvailabilitySerializer(page, many=True).data)
+
         serializer = TblAvailabilitySerializer(availabilities, many=True)
         return Response(serializer.data)
 
@@ -1904,6 +1974,77 @@ def tbl_availability_detail(request, availability_id):
     elif request.method == 'DELETE':
         availability.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+def _period_days(start, end):
+    """Every date from start to end inclusive, for days__overlap filters."""
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def tbl_availability_bulk(request):
+    """
+    Save many availability rows in one request.
+
+    Body: {"items": [{user_id, days, time_slots, status, ...}, ...],
+           "replace": bool, "examperiod_id": int | "start_date"/"end_date": "YYYY-MM-DD"}
+    (a bare list is read as "items"). Every item is validated and all users are
+    resolved in one query before anything is written. With "replace", the
+    regular availability of the submitted users that falls in the period (or
+    all of it when no period is given) is deleted in the same transaction.
+    Returns counts instead of the created rows.
+    """
+    data = request.data
+    if isinstance(data, list):
+        data = {'items': data}
+    items = data.get('items')
+    if not isinstance(items, list) or not items:
+        return Response({'error': 'items must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = TblAvailabilitySerializer(data=items, many=True)
+    if not serializer.is_valid():
+        return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    rows = serializer.validated_data
+
+    user_ids = {row['user_id'] for row in rows}
+    found = set(TblUsers.objects.filter(user_id__in=user_ids).values_list('user_id', flat=True))
+    errors = [
+        {'index': index, 'user_id': row['user_id'], 'error': 'User not found'}
+        for index, row in enumerate(rows) if row['user_id'] not in found
+    ]
+    if errors:
+        return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    period = None
+    if data.get('examperiod_id'):
+        try:
+            exam_period = TblExamperiod.objects.get(pk=data['examperiod_id'])
+        except (TblExamperiod.DoesNotExist, ValueError, TypeError):
+            return Response({'error': 'Exam period not found'}, status=status.HTTP_400_BAD_REQUEST)
+        # Periods are stored as local (Manila) midnights, a day behind in UTC
+        period = _period_days(timezone.localdate(exam_period.start_date), timezone.localdate(exam_period.end_date))
+    elif data.get('start_date') and data.get('end_date'):
+        try:
+            start = datetime.strptime(data['start_date'], '%Y-%m-%d').date()
+            end = datetime.strptime(data['end_date'], '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            return Response({'error': 'start_date and end_date must be YYYY-MM-DD'}, status=status.HTTP_400_BAD_REQUEST)
+        period = _period_days(start, end)
+
+    with transaction.atomic():
+        deleted = 0
+        if data.get('replace'):
+            existing = TblAvailability.objects.filter(user_id__in=user_ids, type='availability')
+            if period is not None:
+                existing = existing.filter(days__overlap=period)
+            deleted, _ = existing.delete()
+
+        created = TblAvailability.objects.bulk_create([
+            TblAvailability(**{**row, 'type': row.get('type') or 'availability'})
+            for row in rows
+        ])
+
+    return Response({'created': len(created), 'deleted': deleted}, status=status.HTTP_201_CREATED)
     
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
@@ -1912,7 +2053,9 @@ def tbl_course_users_list(request):
         user_id = request.GET.get('user_id')
         is_bayanihan_leader = request.GET.get('is_bayanihan_leader')
         
-        course_users = TblCourseUsers.objects.select_related('course', 'user').all()
+        course_users = TblCourseUsers.objects.select_related('course', 'course__term', 'user').prefetch_related(
+            course_users_prefetch('course__tblcourseusers_set')
+        ).all()
         
         if user_id:
             course_users = course_users.filter(user__user_id=user_id)
@@ -2134,6 +2277,328 @@ def tbl_sectioncourse_page_data(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
     
+# ============================================================
+# SCHEDULER BOOTSTRAP
+# ============================================================
+# Tables the bootstrap payload is built from; a write to any of them
+# invalidates every college's cached payload (see api/signals.py).
+SCHEDULER_BOOTSTRAP_TABLES = (
+    'tbl_college', 'tbl_department', 'tbl_program', 'tbl_term', 'tbl_examperiod',
+    'tbl_sectioncourse', 'tbl_course', 'tbl_course_users', 'tbl_rooms', 'tbl_buildings',
+    'tbl_user_role', 'tbl_users', 'tbl_modality', 'tbl_examdetails',
+)
+
+_datetime_field = DateTimeField()
+
+
+def _format_datetime(value):
+    """Same formatting DRF serializers give DateTimeFields."""
+    return _datetime_field.to_representation(value) if value is not None else None
+
+
+def _college_proctor_ids(college_id):
+    """Proctors belong to a college either directly or through a department."""
+    return TblUserRole.objects.filter(role_id=5).filter(
+        Q(college_id=college_id) | Q(department__college_id=college_id)
+    ).values('user_id')
+
+
+def _user_rows(user_ids):
+    """UserSerializer-shaped users, minus the avatar data URL."""
+    users = []
+    for u in TblUsers.objects.filter(user_id__in=user_ids).order_by('user_id').values(
+        'user_id', 'first_name', 'middle_name', 'last_name', 'email_address',
+        'status', 'employment_type',
+    ):
+        middle = f" {u['middle_name'][0]}." if u['middle_name'] else ""
+        u['full_name'] = f"{u['first_name']}{middle} {u['last_name']}".strip()
+        users.append(u)
+    return users
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def scheduler_bootstrap(request):
+    """
+    Everything S_ExamGenerator needs on load, already scoped to one college:
+    exam periods, departments, programs, section courses, the courses they
+    reference, modalities, proctors, rooms and buildings.
+    """
+    college_id = request.GET.get('college_id')
+    if not college_id:
+        return Response({'error': 'college_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    cache_key = versioned_cache_key(f'scheduler_bootstrap:{college_id}', SCHEDULER_BOOTSTRAP_TABLES)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return Response(cached)
+
+    try:
+        college = TblCollege.objects.filter(college_id=college_id).values('college_id', 'college_name').first()
+        if college is None:
+            return Response({'error': 'College not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        departments = [
+            {
+                'department_id': d['department_id'],
+                'department_name': d['department_name'],
+                'college': college,
+                'college_id': d['college_id'],
+            }
+            for d in TblDepartment.objects.filter(college_id=college_id).values(
+                'department_id', 'department_name', 'college_id'
+            )
+        ]
+
+        programs = [
+            {
+                'program_id': p['program_id'],
+                'program_name': p['program_name'],
+                'department': p['department__department_name'] or 'N/A',
+                'department_id': p['department_id'],
+            }
+            for p in TblProgram.objects.filter(department__college_id=college_id).values(
+                'program_id', 'program_name', 'department_id', 'department__department_name'
+            )
+        ]
+        program_ids = [p['program_id'] for p in programs]
+
+        exam_periods = []
+        for ep in TblExamperiod.objects.filter(college_id=college_id).values(
+            'examperiod_id', 'start_date', 'end_date', 'academic_year', 'exam_category',
+            'term_id', 'term__term_name',
+            'department_id', 'department__department_name',
+            'college_id', 'college__college_name',
+        ):
+            period = {
+                'examperiod_id': ep['examperiod_id'],
+                'start_date': _format_datetime(ep['start_date']),
+                'end_date': _format_datetime(ep['end_date']),
+                'academic_year': ep['academic_year'],
+                'exam_category': ep['exam_category'],
+                'term': ep['term_id'],
+                'term_id': ep['term_id'],
+                'term_name': ep['term__term_name'],
+                'department': ep['department_id'],
+            }
+            # TblExamperiodSerializer leaves these out for college-wide periods
+            if ep['department_id'] is not None:
+                period['department_id'] = ep['department_id']
+                period['department_name'] = ep['department__department_name']
+            period.update({
+                'college': ep['college_id'],
+                'college_id': ep['college_id'],
+                'college_name': ep['college__college_name'],
+            })
+            exam_periods.append(period)
+
+        terms = list(TblTerm.objects.order_by('term_id').values('term_id', 'term_name'))
+
+        section_courses = [
+            {
+                'id': sc['id'],
+                'section_name': sc['section_name'],
+                'number_of_students': sc['number_of_students'],
+                'year_level': sc['year_level'],
+                'is_night_class': sc['is_night_class'],
+                'course_id': sc['course_id'],
+                'program_id': sc['program_id'],
+                'term_id': sc['term_id'],
+                'user_id': sc['user_id'],
+            }
+            for sc in TblSectioncourse.objects.filter(program_id__in=program_ids).values(
+                'id', 'section_name', 'number_of_students', 'year_level', 'is_night_class',
+                'course_id', 'program_id', 'term_id', 'user_id',
+            )
+        ]
+        course_ids = {sc['course_id'] for sc in section_courses}
+
+        course_users = {}
+        for cu in TblCourseUsers.objects.filter(course_id__in=course_ids).values(
+            'course_id', 'user_id', 'is_bayanihan_leader', 'user__first_name', 'user__last_name'
+        ):
+            course_users.setdefault(cu['course_id'], []).append(cu)
+
+        courses = [
+            {
+                'course_id': c['course_id'],
+                'course_name': c['course_name'],
+                'term_id': c['term_id'],
+                'term_name': c['term__term_name'],
+                'user_ids': [cu['user_id'] for cu in course_users.get(c['course_id'], [])],
+                'leaders': [cu['user_id'] for cu in course_users.get(c['course_id'], []) if cu['is_bayanihan_leader']],
+                'instructor_names': [
+                    f"{cu['user__first_name']} {cu['user__last_name']}"
+                    for cu in course_users.get(c['course_id'], [])
+                ],
+            }
+            for c in TblCourse.objects.filter(course_id__in=course_ids).values(
+                'course_id', 'course_name', 'term_id', 'term__term_name'
+            )
+        ]
+
+        modalities = list(
+            TblModality.objects.filter(program_id__in=program_ids).values(
+                'modality_id', 'modality_type', 'room_type', 'modality_remarks',
+                'course_id', 'program_id', 'room_id', 'user_id',
+                'sections', 'total_students', 'possible_rooms',
+            )
+        )
+        for m in modalities:
+            m['sections'] = m['sections'] or []
+            m['total_students'] = m['total_students'] or 0
+
+        scheduled_modality_ids = list(
+            TblExamdetails.objects.filter(modality__program_id__in=program_ids)
+            .values_list('modality_id', flat=True).distinct()
+        )
+
+        proctors = _user_rows(_college_proctor_ids(college_id))
+
+        rooms = [
+            {
+                'room_id': r['room_id'],
+                'room_name': r['room_name'],
+                'room_type': r['room_type'],
+                'room_capacity': r['room_capacity'],
+                'building': r['building_id'],
+                'building_id': r['building_id'],
+                'building_name': r['building__building_name'],
+            }
+            for r in TblRooms.objects.values(
+                'room_id', 'room_name', 'room_type', 'room_capacity', 'building_id', 'building__building_name'
+            )
+        ]
+        buildings = list(TblBuildings.objects.values('building_id', 'building_name'))
+
+        data = {
+            'college':                college,
+            'exam_periods':           exam_periods,
+            'departments':            departments,
+            'programs':               programs,
+            'terms':                  terms,
+            'section_courses':        section_courses,
+            'courses':                courses,
+            'modalities':             modalities,
+            'scheduled_modality_ids': scheduled_modality_ids,
+            'proctors':               proctors,
+            'rooms':                  rooms,
+            'buildings':              buildings,
+        }
+
+        cache.set(cache_key, data, timeout=settings.REFERENCE_CACHE_TIMEOUT)
+        return Response(data)
+
+    except Exception as e:
+        return Response(
+            {'error': str(e), 'detail': 'Failed to load scheduler data'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+# ============================================================
+# EXAM VIEWER
+# ============================================================
+# Rows changed this close to the previous poll are sent again, so a write
+# that committed just after that poll's query is never missed.
+VIEWER_CHANGE_OVERLAP = timedelta(seconds=5)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def scheduler_viewer(request):
+    """
+    Everything S_ExamViewer shows for one college (and optionally one exam
+    period): exams, the users they reference plus the college's proctors,
+    the dean, footer and latest approval status.
+
+    Every response carries a `version`. Polling with ?changed_since=<version>
+    returns only exams changed since then (edited, checked in, or just ended),
+    the users they reference, the approval status, and `exam_ids` - every
+    current exam id, so the client can drop deleted ones.
+    """
+    college_id = request.GET.get('college_id')
+    if not college_id:
+        return Response({'error': 'college_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    changed_since = request.GET.get('changed_since')
+    if changed_since:
+        try:
+            changed_since = datetime.fromtimestamp(int(changed_since) / 1000, tz=dt_timezone.utc)
+        except (ValueError, OverflowError, OSError):
+            return Response({'error': 'changed_since must be a version from a previous response'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        college = TblCollege.objects.filter(college_id=college_id).values('college_id', 'college_name').first()
+        if college is None:
+            return Response({'error': 'College not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        now = timezone.now()
+        exams = TblExamdetails.objects.filter(college_name=college['college_name'])
+        examperiod_id = request.GET.get('examperiod_id')
+        if examperiod_id:
+            exams = exams.filter(examperiod_id=examperiod_id)
+
+        changed = exams
+        if changed_since:
+            since = changed_since - VIEWER_CHANGE_OVERLAP
+            changed = exams.filter(
+                Q(updated_at__gt=since)
+                | Q(Exists(TblProctorAttendance.objects.filter(examdetails_id=OuterRef('pk'), time_in__gt=since)))
+                | Q(exam_end_time__gt=since, exam_end_time__lte=now)
+            )
+        exam_data = TblExamdetailsListSerializer.from_queryset(changed)
+
+        user_ids = set()
+        for exam in exam_data:
+            user_ids.update(exam['proctors'] or [])
+            user_ids.update(exam['instructors'] or [])
+            user_ids.update(uid for uid in (exam['proctor_id'], exam['instructor_id']) if uid)
+
+        approval = TblScheduleapproval.objects.select_related('submitted_by').filter(
+            college_name=college['college_name']
+        ).order_by('-submitted_at').first()
+
+        data = {
+            'version': int(now.timestamp() * 1000),
+            'college': college,
+            'exams': exam_data,
+            'approval': TblScheduleapprovalSerializer(approval).data if approval else None,
+        }
+
+        if changed_since:
+            data['exam_ids'] = list(exams.values_list('examdetails_id', flat=True))
+            data['users'] = _user_rows(user_ids)
+            return Response(data)
+
+        dean_role = TblUserRole.objects.filter(college_id=college_id, role_id=1).values('user_id').first()
+        proctor_ids = [row['user_id'] for row in _college_proctor_ids(college_id)]
+        users = _user_rows(user_ids | set(proctor_ids) | ({dean_role['user_id']} if dean_role else set()))
+
+        dean = None
+        if dean_role:
+            dean_user = next((u for u in users if u['user_id'] == dean_role['user_id']), None)
+            if dean_user:
+                dean = {
+                    'user_id': dean_user['user_id'],
+                    'name': f"{dean_user['first_name']} {dean_user['last_name']}",
+                }
+
+        footer = TblScheduleFooter.objects.select_related('college').filter(college_id=college_id).first()
+
+        data.update({
+            'users': users,
+            'proctor_ids': sorted(set(proctor_ids)),
+            'dean': dean,
+            'footer': TblScheduleFooterSerializer(footer).data if footer else None,
+        })
+        return Response(data)
+
+    except Exception as e:
+        return Response(
+            {'error': str(e), 'detail': 'Failed to load exam viewer data'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
 def tbl_sectioncourse_list(request):
@@ -2146,7 +2611,7 @@ def tbl_sectioncourse_list(request):
             'term',
             'user'
         ).prefetch_related(
-            'course__tblcourseusers_set__user'
+            course_users_prefetch('course__tblcourseusers_set')
         ).all()
 
         serializer = TblSectioncourseSerializer(qs, many=True)
@@ -2185,9 +2650,9 @@ def tbl_sectioncourse_detail(request, pk):
         cache.delete('sectioncourse_page_data')
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 5)    
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_roles')
 def tbl_roles_list(request):
     if request.method == 'GET':
         roles = TblRoles.objects.all()
@@ -2226,15 +2691,23 @@ def tbl_roles_detail(request, role_id):
     
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@read_from_replica
 def user_role_history_list(request):
     """
     List all history records or filter by user_role_id.
+    Send ?cursor= for keyset pages, newest first.
     """
     user_role_id = request.GET.get('user_role_id')
     queryset = TblUserRoleHistory.objects.all().order_by('-changed_at')
     if user_role_id:
         queryset = queryset.filter(user_role_id=user_role_id)
-    
+
+    # changed_at is nullable, so pages are keyed on the (append-only) primary key
+    paginator = KeysetPagination.for_request(request, '-history_id')
+    if paginator:
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(TblUserRoleHistorySerializer(page, many=True).data)
+
     serializer = TblUserRoleHistorySerializer(queryset, many=True)
     return Response(serializer.data)
 
@@ -2299,9 +2772,9 @@ def accounts_detail(request, pk):
         user.delete()
         return Response({'message': 'Deleted successfully'}, status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 5)    
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_buildings')
 def tbl_buildings_list(request):
     if request.method == 'GET':
         buildings = TblBuildings.objects.all()
@@ -2339,12 +2812,12 @@ def tbl_buildings_detail(request, pk):
         building.delete()
         return Response({'message': 'Building deleted'}, status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 3)
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_rooms', 'tbl_buildings')
 def tbl_rooms_list(request):
     if request.method == 'GET':
-        rooms = TblRooms.objects.all()
+        rooms = TblRooms.objects.select_related('building')
         serializer = TblRoomsSerializer(rooms, many=True)
         return Response(serializer.data)
 
@@ -2383,7 +2856,7 @@ def tbl_rooms_detail(request, pk):
 @permission_classes([AllowAny])
 def courses_list(request):
     if request.method == 'GET':
-        courses = TblCourse.objects.select_related('term').prefetch_related('tblcourseusers_set__user').all()
+        courses = TblCourse.objects.select_related('term').prefetch_related(course_users_prefetch()).all()
         serializer = CourseSerializer(courses, many=True)
         return Response(serializer.data)
 
@@ -2434,9 +2907,9 @@ def course_detail(request, pk):
         course.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 3)    
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_program', 'tbl_department')
 def program_list(request):
     if request.method == 'GET':
         programs = TblProgram.objects.all()
@@ -2473,9 +2946,9 @@ def program_detail(request, pk):
         program.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 3)     
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_department', 'tbl_college')
 def department_list(request):
     if request.method == 'GET':
         departments = TblDepartment.objects.all()
@@ -2512,9 +2985,9 @@ def department_detail(request, pk):
         department.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 5)
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_college')
 def tbl_college_list(request):
     if request.method == 'GET':
         colleges = TblCollege.objects.all()
@@ -2554,26 +3027,65 @@ def tbl_college_detail(request, pk):
 # ------------------------------
 # PASSWORD RESET - STEP 1: Send reset email
 # ------------------------------
+def json_body(request):
+    """JSON object sent to a plain (non-DRF) view; ValueError if it isn't one."""
+    data = json.loads(request.body or b'{}')
+    if not isinstance(data, dict):
+        raise ValueError('Expected a JSON object')
+    return data
+
+def _throttle_waits(request):
+    waits = []
+    for throttle_class in api_settings.DEFAULT_THROTTLE_CLASSES:
+        throttle = throttle_class()
+        if not throttle.allow_request(request, None):
+            waits.append(throttle.wait())
+    return waits
+
+def throttled(view):
+    """
+    DEFAULT_THROTTLE_CLASSES for a plain async view, which @api_view would
+    otherwise apply: without them the mail endpoints are an open relay.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        # Sync: the throttles read request.user and the cache
+        waits = await sync_to_async(_throttle_waits)(request)
+        if not waits:
+            return await view(request, *args, **kwargs)
+        exc = Throttled(max((w for w in waits if w is not None), default=None))
+        response = JsonResponse({'detail': str(exc.detail)}, status=exc.status_code)
+        if exc.wait is not None:
+            response['Retry-After'] = '%d' % exc.wait
+        return response
+    return wrapper
+
+# Async: the only slow part is the call to Resend, which runs after the
+# response rather than holding a worker thread (see api/mailer.py and
+# SERVER_MODE=asgi)
 @csrf_exempt
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def request_password_change(request):
-    email = request.data.get('email')
+@require_POST
+@throttled
+async def request_password_change(request):
+    try:
+        email = json_body(request).get('email')
+    except ValueError:
+        return JsonResponse({'error': 'Invalid JSON body.'}, status=status.HTTP_400_BAD_REQUEST)
 
     if not email:
-        return Response({'error': 'Email is required.'}, status=status.HTTP_400_BAD_REQUEST)
+        return JsonResponse({'error': 'Email is required.'}, status=status.HTTP_400_BAD_REQUEST)
 
     try:
-        user = TblUsers.objects.get(email_address=email)
+        user = await TblUsers.objects.aget(email_address=email)
     except TblUsers.DoesNotExist:
-        return Response({'error': 'No account found with this email.'}, status=status.HTTP_404_NOT_FOUND)
+        return JsonResponse({'error': 'No account found with this email.'}, status=status.HTTP_404_NOT_FOUND)
 
     try:
         token = secrets.token_urlsafe(32)
         uid = str(user.pk)
 
         cache_key = f"password_reset_{uid}"
-        cache.set(cache_key, token, timeout=15 * 60)
+        await cache.aset(cache_key, token, timeout=15 * 60)
 
         reset_link = f"{settings.FRONTEND_URL}/reset-password?uid={uid}&token={token}"
 
@@ -2586,93 +3098,76 @@ def request_password_change(request):
             f"Best,\nExamSync Team"
         )
 
-        def send_email_async():
-            try:
-                import resend
-                resend.api_key = settings.RESEND_API_KEY
-                resend.Emails.send({
-                    "from": settings.DEFAULT_FROM_EMAIL,
-                    "to": [email],
-                    "subject": subject,
-                    "text": message,
-                })
-            except Exception:
-                pass
-
-        Thread(target=send_email_async).start()
+        # As before, the email goes out after the response and a delivery
+        # failure isn't reported back to the client
+        mailer.send_later(mailer.message(email, subject, message))
 
-        return Response({
+        return JsonResponse({
             'message': 'Password reset link will be sent to your email shortly!'
         }, status=status.HTTP_200_OK)
 
     except Exception:
-        return Response({
+        return JsonResponse({
             'error': 'Failed to process password reset request.'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-@api_view(['POST'])
-@permission_classes([AllowAny])
-def send_proctor_emails(request):
+@csrf_exempt
+@require_POST
+@throttled
+async def send_proctor_emails(request):
     try:
-        import resend
-        resend.api_key = settings.RESEND_API_KEY
-
-        emails_data = request.data.get('emails', [])
-        sender_id = request.data.get('sender_id')
+        data = json_body(request)
+        emails_data = data.get('emails', [])
+        sender_id = data.get('sender_id')
 
         if not emails_data:
-            return Response(
+            return JsonResponse(
                 {'error': 'No emails to send'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        sent_count = 0
         failed_emails = []
-
+        valid = []
         for email_data in emails_data:
-            proctor_email = email_data.get('email')
-            proctor_name = email_data.get('name')
-            subject = email_data.get('subject')
-            message = email_data.get('message')
-
-            if not all([proctor_email, subject, message]):
+            if not all([email_data.get('email'), email_data.get('subject'), email_data.get('message')]):
                 failed_emails.append({
-                    'email': proctor_email,
-                    'name': proctor_name,
+                    'email': email_data.get('email'),
+                    'name': email_data.get('name'),
                     'reason': 'Missing required fields'
                 })
                 continue
+            valid.append(email_data)
 
-            try:
-                params = {
-                    "from": settings.DEFAULT_FROM_EMAIL,
-                    "to": [proctor_email],
-                    "subject": subject,
-                    "text": message,
-                }
-                resend.Emails.send(params)
-
-                TblNotification.objects.create(
-                    user_id=email_data.get('user_id'),
-                    sender_id=sender_id,
-                    title=subject,
-                    message=message,
-                    type='email',
-                    status='sent',
-                    is_seen=False,
-                    priority=2,
-                    created_at=timezone.now()
-                )
-
-                sent_count += 1
+        # Every message goes out in a few concurrent batch calls
+        reasons = await mailer.send_many([
+            mailer.message(email_data['email'], email_data['subject'], email_data['message'])
+            for email_data in valid
+        ])
 
-            except Exception as e:
+        now = timezone.now()
+        notifications = []
+        for email_data, reason in zip(valid, reasons):
+            if reason is not None:
                 failed_emails.append({
-                    'email': proctor_email,
-                    'name': proctor_name,
-                    'reason': str(e)
+                    'email': email_data['email'],
+                    'name': email_data.get('name'),
+                    'reason': reason
                 })
-
+                continue
+            notifications.append(TblNotification(
+                user_id=email_data.get('user_id'),
+                sender_id=sender_id,
+                title=email_data['subject'],
+                message=email_data['message'],
+                type='email',
+                status='sent',
+                is_seen=False,
+                priority=2,
+                created_at=now
+            ))
+        await TblNotification.objects.abulk_create(notifications)
+
+        sent_count = len(notifications)
         response_data = {
             'sent_count': sent_count,
             'total_count': len(emails_data),
@@ -2682,12 +3177,14 @@ def send_proctor_emails(request):
         if failed_emails:
             response_data['failed_emails'] = failed_emails
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        return JsonResponse(response_data, status=status.HTTP_200_OK)
 
+    except ValueError:
+        return JsonResponse({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
     except Exception as e:
         import traceback
         traceback.print_exc()
-        return Response(
+        return JsonResponse(
             {'error': str(e), 'detail': 'Failed to send emails'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -2819,48 +3316,31 @@ def user_avatar_upload(request, user_id):
     if not avatar_file:
         return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
     
-    allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
-    if avatar_file.content_type not in allowed_types:
-        return Response({
-            'error': 'Invalid file type. Allowed: JPEG, PNG, GIF, WEBP'
-        }, status=status.HTTP_400_BAD_REQUEST)
-    
-    if avatar_file.size > 5 * 1024 * 1024:
-        return Response({
-            'error': 'File too large. Maximum size is 5MB'
-        }, status=status.HTTP_400_BAD_REQUEST)
+    error = validate_image_upload(avatar_file)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        import base64
-        from io import BytesIO
-        from PIL import Image
-        
-        img = Image.open(avatar_file)
-        
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        img.thumbnail((400, 400), Image.Resampling.LANCZOS)
-        
-        buffer = BytesIO()
-        img.save(buffer, format='JPEG', quality=85, optimize=True)
-        buffer.seek(0)
-        
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        avatar_url = f"data:image/jpeg;base64,{img_base64}"
+        data = avatar_file.read()
+        digest, avatar_url = store_original('avatars', user.user_id, data)
         
         user.avatar_url = avatar_url
-        user.save()
+        user.save(update_fields=['avatar_url'])
+        
+        # Thumbnails and WebP copies are rendered after the response goes out
+        queue_variants(
+            'avatars', user.user_id, digest, data,
+            is_current=lambda d: TblUsers.objects.filter(user_id=user.user_id, avatar_url__contains=d).exists(),
+        )
         
         return Response({
             'message': 'Avatar uploaded successfully',
             'avatar_url': avatar_url
         }, status=status.HTTP_200_OK)
         
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -2882,12 +3362,46 @@ def user_avatar_delete(request, user_id):
         return Response({'error': 'User not found'}, status=status.HTTP_404_NOT_FOUND)
     
     user.avatar_url = None
-    user.save()
+    user.save(update_fields=['avatar_url'])
+    delete_images('avatars', user.user_id)
     
     return Response({
         'message': 'Avatar deleted successfully'
     }, status=status.HTTP_200_OK)
 
+# ============================================================
+# MEDIA FILES
+# ============================================================
+def media_file(request, path):
+    """
+    Serve an uploaded image: from MEDIA_ROOT with local storage, otherwise
+    by redirecting to the default storage's URL for it.
+    File names are content-hashed (see api/images.py), so responses are
+    cacheable for MEDIA_CACHE_MAX_AGE and never need revalidating.
+    """
+    from django.core.files.storage import default_storage
+    from django.http import Http404, HttpResponsePermanentRedirect, HttpResponseRedirect
+    from django.views.static import serve
+
+    name = path
+    rendering = not default_storage.exists(path)
+    if rendering:
+        # Variants still rendering: answer with the upload, but don't let it be cached
+        name = original_for_variant(path)
+        if name is None:
+            raise Http404(f'"{path}" does not exist')
+
+    if is_local_storage():
+        response = serve(request, name, document_root=default_storage.location)
+    elif rendering:
+        response = HttpResponseRedirect(default_storage.url(name))
+    else:
+        response = HttpResponsePermanentRedirect(default_storage.url(name))
+    response['Cache-Control'] = (
+        'no-store' if rendering else f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}, immutable'
+    )
+    return response
+
 # ============================================================
 # CREATE ACCOUNT (HASHES PASSWORD)
 # ============================================================
@@ -2905,7 +3419,7 @@ def create_account_with_password(request):
         if not data.get('password'):
             last_name = data.get('last_name', '')
             user_id = data.get('user_id', '')
-            data['password'] = f"{last_name}@{user_id}"
+            data['password'] = default_password(last_name, user_id)
                 
         serializer = TblUsersSerializer(data=data)
         if serializer.is_valid():
@@ -2922,14 +3436,172 @@ def create_account_with_password(request):
             'detail': 'Failed to create account'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+# ============================================================
+# BULK ACCOUNT CREATION
+# ============================================================
+BULK_ACCOUNT_FIELDS = ['user_id', 'first_name', 'last_name', 'email_address', 'contact_number']
+
+
+def _bulk_account_roles(user_id, roles, valid):
+    """TblUserRole rows for one account; raises ValueError on a bad entry."""
+    now = timezone.now()
+    rows = []
+    for index, role in enumerate(roles or [], start=1):
+        role_id = role.get('role') or role.get('role_id')
+        college_id = role.get('college') or role.get('college_id') or None
+        department_id = role.get('department') or role.get('department_id') or None
+        try:
+            role_id = int(role_id)
+        except (TypeError, ValueError):
+            raise ValueError(f'Role {index}: role is required')
+        if role_id not in valid['roles']:
+            raise ValueError(f'Role {index}: role {role_id} not found')
+        if college_id and college_id not in valid['colleges']:
+            raise ValueError(f'Role {index}: college "{college_id}" not found')
+        if department_id and department_id not in valid['departments']:
+            raise ValueError(f'Role {index}: department "{department_id}" not found')
+        try:
+            date_start = _datetime_field.to_internal_value(role['date_start']) if role.get('date_start') else None
+            date_ended = _datetime_field.to_internal_value(role['date_ended']) if role.get('date_ended') else None
+        except DRFValidationError as e:
+            raise ValueError(f'Role {index}: {e.detail[0]}')
+        rows.append(TblUserRole(
+            user_id=user_id, role_id=role_id, college_id=college_id, department_id=department_id,
+            date_start=date_start, date_ended=date_ended, status=role.get('status') or 'Active', created_at=now,
+        ))
+    return rows
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def create_accounts_bulk(request):
+    """
+    Create many accounts at once.
+    Body: {"accounts": [...]} or a bare list; each account takes the
+    create-account fields plus an optional "roles" list of
+    {role, college, department, date_start, date_ended}.
+
+    Rows whose user_id or email already exists (or repeats within the batch)
+    are reported under "duplicates" and invalid rows under "errors"; the rest
+    are still created. Passwords (LastName@user_id when omitted) are hashed
+    in the "passwords" process pool, users and roles are inserted with one
+    bulk_create each.
+    """
+    accounts = request.data.get('accounts') if isinstance(request.data, dict) else request.data
+    if not isinstance(accounts, list) or not accounts:
+        return Response({'error': 'accounts must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        user_ids, emails = set(), set()
+        for account in accounts:
+            if isinstance(account, dict):
+                user_ids.add(str(account.get('user_id') or '').strip())
+                emails.add(str(account.get('email_address') or '').strip().lower())
+        existing_ids = set(TblUsers.objects.filter(
+            user_id__in=[int(u) for u in user_ids if u.isdigit()]
+        ).values_list('user_id', flat=True))
+        existing_emails = set(TblUsers.objects.annotate(
+            email_lower=Lower('email_address')
+        ).filter(email_lower__in=emails).values_list('email_lower', flat=True))
+        valid = {
+            'roles': set(TblRoles.objects.values_list('role_id', flat=True)),
+            'colleges': set(TblCollege.objects.values_list('college_id', flat=True)),
+            'departments': set(TblDepartment.objects.values_list('department_id', flat=True)),
+        }
+
+        users, roles, passwords, duplicates, errors = [], [], [], [], []
+        for index, account in enumerate(accounts):
+            if not isinstance(account, dict):
+                errors.append({'index': index, 'error': 'Each account must be an object'})
+                continue
+            missing = [f for f in BULK_ACCOUNT_FIELDS if not str(account.get(f) or '').strip()]
+            if missing:
+                errors.append({'index': index, 'error': f"Missing {', '.join(missing)}"})
+                continue
+            try:
+                user_id = int(account['user_id'])
+            except (TypeError, ValueError):
+                errors.append({'index': index, 'error': 'user_id must be a number'})
+                continue
+            email = str(account['email_address']).strip()
+
+            if user_id in existing_ids:
+                duplicates.append({'index': index, 'user_id': user_id, 'field': 'user_id'})
+                continue
+            if email.lower() in existing_emails:
+                duplicates.append({'index': index, 'user_id': user_id, 'field': 'email_address'})
+                continue
+            try:
+                user_roles = _bulk_account_roles(user_id, account.get('roles'), valid)
+            except ValueError as e:
+                errors.append({'index': index, 'error': str(e)})
+                continue
+
+            existing_ids.add(user_id)
+            existing_emails.add(email.lower())
+            users.append(TblUsers(
+                user_id=user_id,
+                first_name=str(account['first_name']).strip(),
+                last_name=str(account['last_name']).strip(),
+                middle_name=str(account.get('middle_name') or '').strip() or None,
+                email_address=email,
+                contact_number=str(account['contact_number']).strip(),
+                status=account.get('status') or 'Active',
+                employment_type=account.get('employment_type') or None,
+            ))
+            passwords.append(account.get('password') or default_password(users[-1].last_name, user_id))
+            roles.extend(user_roles)
+
+        for user, hashed in zip(users, hash_passwords(passwords)):
+            user.password = hashed
+
+        with transaction.atomic():
+            TblUsers.objects.bulk_create(users)
+            TblUserRole.objects.bulk_create(roles)
+    except IntegrityError:
+        # Another request created one of these accounts between the checks and the insert
+        return Response({
+            'error': 'An account in this batch was created concurrently; nothing was saved',
+            'detail': 'Retry the request to get the duplicates reported',
+        }, status=status.HTTP_409_CONFLICT)
+    except Exception as e:
+        logger.exception("Bulk account creation failed")
+        return Response({
+            'error': str(e),
+            'detail': 'Failed to create accounts'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    # bulk_create skips the post_save signals that normally bump these
+    if users:
+        bump_table_version(TblUsers._meta.db_table)
+    if roles:
+        bump_table_version(TblUserRole._meta.db_table)
+        for user_id in {role.user_id for role in roles}:
+            invalidate_user_roles(user_id)
+
+    return Response({
+        'created': [user.user_id for user in users],
+        'roles_created': len(roles),
+        'duplicates': duplicates,
+        'errors': errors,
+    }, status=status.HTTP_201_CREATED if users else status.HTTP_200_OK)
+
 # ============================================================
 # USERS LIST
 # ============================================================
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def users_list(request):
-    users = TblUsers.objects.all()
-    serializer = UserSerializer(users, many=True)
+    fields, expand = parse_fieldset(request)
+    users = sparse_queryset(TblUsers.objects.all(), UserSerializer, fields, expand)
+
+    paginator = KeysetPagination.for_request(request, 'user_id')
+    if paginator:
+        page = paginator.paginate_queryset(users, request)
+        serializer = UserSerializer(page, many=True, fields=fields, expand=expand)
+        return paginator.get_paginated_response(serializer.data)
+
+    serializer = UserSerializer(users, many=True, fields=fields, expand=expand)
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -2962,12 +3634,86 @@ def user_detail(request, user_id):
 
 # User roles
 # ------------------------------
+def _roles_by_user(queryset):
+    """
+    Group role rows by user_id in the UserRoleSerializer shape (plus role_id),
+    from one joined values() query instead of a lookup per college/department.
+    """
+    roles = {}
+    for r in queryset.order_by('user_role_id').values(
+        'user_role_id', 'user_id', 'role_id', 'role__role_name', 'status',
+        'college_id', 'college__college_name',
+        'department_id', 'department__department_name',
+    ):
+        roles.setdefault(r['user_id'], []).append({
+            'user_role_id': r['user_role_id'],
+            'role_id': r['role_id'],
+            'role_name': r['role__role_name'],
+            'status': r['status'],
+            'college': {
+                'college_id': r['college_id'],
+                'college_name': r['college__college_name'],
+            } if r['college_id'] else None,
+            'department': {
+                'department_id': r['department_id'],
+                'department_name': r['department__department_name'],
+            } if r['department_id'] else None,
+        })
+    return roles
+
+
+def _cached_user_roles(user_ids):
+    """Roles for each of `user_ids`, served from the per-user role cache where possible."""
+    keys = user_roles_cache_keys(user_ids)
+    found = cache.get_many(list(keys.values()))
+    result = {user_id: found[key] for user_id, key in keys.items() if key in found}
+
+    missing = [user_id for user_id in user_ids if user_id not in result]
+    if missing:
+        loaded = _roles_by_user(TblUserRole.objects.filter(user_id__in=missing))
+        fresh = {user_id: loaded.get(user_id, []) for user_id in missing}
+        cache.set_many({keys[user_id]: roles for user_id, roles in fresh.items()}, timeout=settings.REFERENCE_CACHE_TIMEOUT)
+        result.update(fresh)
+    return result
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def user_roles(request, user_id):
-    roles = TblUserRole.objects.filter(user__user_id=user_id)
-    serializer = UserRoleSerializer(roles, many=True)
-    return Response(serializer.data)
+    return Response(_cached_user_roles([user_id])[user_id])
+
+
+@api_view(['GET', 'POST'])
+@permission_classes([AllowAny])
+def user_roles_bulk(request):
+    """
+    Roles for many users at once, as {user_id: [roles]}.
+    Pass user_ids (comma-separated in the query string, or a list in a POST
+    body for long lists), or filter by college_id and/or role_id instead.
+    """
+    source = request.data if request.method == 'POST' else request.GET
+    user_ids = source.get('user_ids')
+    college_id = source.get('college_id')
+    role_id = source.get('role_id')
+
+    if user_ids:
+        if isinstance(user_ids, str):
+            user_ids = user_ids.split(',')
+        try:
+            user_ids = list(dict.fromkeys(int(uid) for uid in user_ids if str(uid).strip()))
+        except (TypeError, ValueError):
+            return Response({'error': 'user_ids must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(_cached_user_roles(user_ids))
+
+    if not college_id and not role_id:
+        return Response({'error': 'user_ids, college_id or role_id is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    queryset = TblUserRole.objects.all()
+    if college_id:
+        queryset = queryset.filter(college_id=college_id)
+    if role_id:
+        queryset = queryset.filter(role_id=role_id)
+    return Response(_roles_by_user(queryset))
 
 # ------------------------------
 # Exam periods
@@ -3114,7 +3860,9 @@ def tbl_user_role_list(request):
         if college_id:                                # ← ADD THIS
             queryset = queryset.filter(college_id=college_id)
 
-        serializer = TblUserRoleSerializer(queryset, many=True)
+        fields, expand = parse_fieldset(request)
+        queryset = sparse_queryset(queryset, TblUserRoleSerializer, fields, expand)
+        serializer = TblUserRoleSerializer(queryset, many=True, fields=fields, expand=expand)
         return Response(serializer.data)
         
     elif request.method == 'POST':
@@ -3147,9 +3895,9 @@ def tbl_user_role_detail(request, user_role_id):
         instance.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
-@cache_page(60 * 5)     
 @api_view(['GET', 'POST'])
 @permission_classes([AllowAny])
+@cached_reference_list('tbl_term')
 def tbl_term_list(request):
     if request.method == 'GET':
         terms = TblTerm.objects.all().order_by('term_id')
@@ -3257,40 +4005,25 @@ def upload_schedule_logo(request):
     if not logo_file:
         return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
     
-    allowed_types = ['image/jpeg', 'image/jpg', 'image/png', 'image/gif', 'image/webp']
-    if logo_file.content_type not in allowed_types:
-        return Response({
-            'error': 'Invalid file type. Allowed: JPEG, PNG, GIF, WEBP'
-        }, status=status.HTTP_400_BAD_REQUEST)
+    error = validate_image_upload(logo_file)
+    if error:
+        return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
     
     try:
-        import base64
-        from io import BytesIO
-        from PIL import Image
-        
-        img = Image.open(logo_file)
-        
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        
-        img.thumbnail((400, 400), Image.Resampling.LANCZOS)
-        
-        buffer = BytesIO()
-        img.save(buffer, format='PNG', optimize=True)
-        buffer.seek(0)
-        
-        img_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        logo_url = f"data:image/png;base64,{img_base64}"
+        # Older logos stay: the footer keeps pointing at them until it is saved
+        data = logo_file.read()
+        owner = college_id or 'shared'
+        digest, logo_url = store_original('logos', owner, data)
+        queue_variants('logos', owner, digest, data)
         
         return Response({
             'message': 'Logo uploaded successfully',
             'logo_url': logo_url
         }, status=status.HTTP_200_OK)
         
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
     except Exception as e:
         return Response({
             'error': 'Failed to process image',
@@ -3321,4 +4054,126 @@ def users_bulk(request):
         'user_id', 'first_name', 'last_name', 'middle_name',
         'email_address', 'status', 'avatar_url'
     )
-    return Response(list(users))
\ No newline at end of file
+    return Response(list(users))
+
+
+# ============================================================
+# SPREADSHEET IMPORT
+# ============================================================
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def bulk_import(request, resource):
+    """
+    POST /api/import/<rooms|courses|section_courses|users>/ with a CSV, XLSX or
+    XLS `file` in the admin template layout. Valid rows are saved in one
+    transaction; invalid ones come back as per-row errors. Send dry_run=true
+    to validate without saving.
+    """
+    importer_class = IMPORTERS.get(resource)
+    if importer_class is None:
+        return Response({
+            'error': f"Unknown import type '{resource}'",
+            'detail': f"Expected one of: {', '.join(IMPORTERS)}"
+        }, status=status.HTTP_404_NOT_FOUND)
+
+    upload = request.FILES.get('file')
+    if not upload:
+        return Response({'error': 'No file provided'}, status=status.HTTP_400_BAD_REQUEST)
+    dry_run = str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+
+    try:
+        result = importer_class().run(read_rows(upload), dry_run=dry_run)
+    except ImportFileError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        logger.exception("Import of %s failed", resource)
+        return Response({
+            'error': str(e),
+            'detail': 'Import failed; nothing was saved'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    return Response({'resource': resource, **result}, status=status.HTTP_200_OK)
+
+
+# ============================================================
+# SCHEDULE EXPORT
+# ============================================================
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def schedule_export(request, fmt):
+    """
+    GET /api/schedule-export/<csv|xlsx|pdf>/?college_name=CITC
+    Download a college's approved schedule. Files are rendered once per
+    schedule version and served from storage afterwards (see api/exports.py).
+    """
+    from django.http import FileResponse, HttpResponseNotModified
+
+    if fmt not in EXPORT_FORMATS:
+        return Response({'error': f'Unknown format "{fmt}"'}, status=status.HTTP_404_NOT_FOUND)
+    college_name = request.GET.get('college_name')
+    if not college_name:
+        return Response({'error': 'college_name is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Only the lookup: a new version is rendered from the primary, since the
+    # stored file is named after the primary's table versions and would keep
+    # a lagging replica's rows for as long as that version lasts
+    with replica_reads(request):
+        approval = approved_schedule(college_name)
+    if approval is None:
+        return Response({'error': f'No approved schedule for {college_name}'}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        export, version = export_file(approval, fmt)
+    except ExportUnavailable as e:
+        return Response({'error': str(e)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+    except Exception as e:
+        logger.exception("Failed to export schedule for %s", college_name)
+        return Response({
+            'error': str(e),
+            'detail': 'Failed to export schedule'
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    etag = f'"{version}"'
+    if request.headers.get('If-None-Match') == etag:
+        export.close()
+        return HttpResponseNotModified()
+
+    content_type, ext = EXPORT_FORMATS[fmt]
+    filename = re.sub(r'[^A-Za-z0-9_-]', '_', college_name) + f'_Schedule_APPROVED.{ext}'
+    response = FileResponse(
+        export, as_attachment=True, filename=filename, content_type=content_type,
+    )
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+# ============================================================
+# DEBUG ENDPOINTS
+# ============================================================
+def debug_metrics(request):
+    """
+    GET /debug/metrics[?reset=1]
+    Per-URL-name latency, query count and SQL time histograms collected by
+    RequestMetricsMiddleware in this worker process, plus its DB pool waits.
+    """
+    from django.http import Http404, JsonResponse
+
+    if not metrics.debug_allowed(request):
+        raise Http404
+    return JsonResponse(metrics.snapshot(reset=request.GET.get('reset') == '1'))
+
+
+def debug_profile(request, profile_id):
+    """
+    GET /debug/profile/<id>
+    Report stored by ProfilingMiddleware for a request sent with X-Profile: 1.
+    """
+    from django.http import Http404, JsonResponse
+
+    if not profiling.may_profile(request):
+        raise Http404
+    report = profiling.load_report(profile_id)
+    if report is None:
+        raise Http404
+    return JsonResponse(report)
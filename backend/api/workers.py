@@ -0,0 +1,95 @@
+# exam-sync-v2/backend/api/workers.py
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# PROCESS POOLS
+# ============================================================
+# CPU-heavy work (image resizing, password hashing) is handed to a small process pool so
+# it doesn't hold a gunicorn worker's GIL while other requests wait. Pools
+# are created lazily in each web process, after gunicorn has forked, and use
+# the "spawn" start method so children never inherit DB connections or
+# threads. Each pool also caps how many jobs may be queued: past that,
+# submit() returns None and the caller does the work itself, which slows
+# that one request down instead of letting the queue grow without bound.
+
+
+def setup_django():
+    """Initializer for pools whose jobs need settings or the app registry."""
+    import django
+    django.setup()
+
+
+# name -> (settings attribute holding (max_workers, max_queued), child initializer)
+POOL_SETTINGS = {
+    'images': ('IMAGE_POOL', None),
+    'passwords': ('PASSWORD_POOL', setup_django),
+}
+
+_pools = {}
+_slots = {}
+_pid = None
+_lock = threading.Lock()
+
+
+def get_pool(name):
+    """Return this process's pool for `name`, creating it on first use."""
+    global _pid
+    with _lock:
+        if _pid != os.getpid():
+            # Forked since the pools were made; the parent's pools are unusable here
+            _pools.clear()
+            _slots.clear()
+            _pid = os.getpid()
+        if name not in _pools:
+            setting, initializer = POOL_SETTINGS[name]
+            max_workers, max_queued = getattr(settings, setting)
+            _pools[name] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=initializer,
+            )
+            _slots[name] = threading.BoundedSemaphore(max_workers + max_queued)
+        return _pools[name]
+
+
+def submit(name, fn, *args, callback=None):
+    """
+    Run fn(*args) in the `name` pool and return its Future, or None when the
+    pool is saturated. `callback(future)` runs in the parent process once the
+    job finishes, on the pool's management thread.
+    """
+    pool = get_pool(name)
+    slots = _slots[name]
+    if not slots.acquire(blocking=False):
+        return None
+
+    def release(future):
+        slots.release()
+        if callback is None:
+            return
+        try:
+            callback(future)
+        except Exception:
+            logger.exception("%s pool callback failed", name)
+
+    try:
+        future = pool.submit(fn, *args)
+    except Exception:
+        # Usually BrokenProcessPool after a child died; start a fresh pool next time
+        slots.release()
+        logger.exception("%s pool rejected a job", name)
+        with _lock:
+            if _pools.get(name) is pool:
+                del _pools[name]
+        return None
+    future.add_done_callback(release)
+    return future
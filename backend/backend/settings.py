@@ -1,6 +1,7 @@
 # exam-sync-v2/backend/backend/settings.py
 
 from pathlib import Path
+import copy
 import os
 from decouple import config
 
@@ -45,8 +46,11 @@ INSTALLED_APPS = [
 # MIDDLEWARE
 # ──────────────────────────────────────────────
 MIDDLEWARE = [
+    # First, so its timings cover every other middleware
+    "api.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "api.middleware.ApiCompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -54,6 +58,9 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "api.middleware.ReplicaStickinessMiddleware",
+    # Last, so it wraps only the view
+    "api.middleware.ProfilingMiddleware",
 ]
 
 # ──────────────────────────────────────────────
@@ -88,10 +95,12 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
+    "x-metrics-token",
+    "x-profile",
 ]
 
 CORS_PREFLIGHT_MAX_AGE = 86400
-CORS_EXPOSE_HEADERS = ['Content-Type', 'X-CSRFToken']
+CORS_EXPOSE_HEADERS = ['Content-Type', 'X-CSRFToken', 'Server-Timing', 'X-Query-Count', 'X-Profile-Id']
 
 CSRF_TRUSTED_ORIGINS = [
     "https://exam-sync-v2-0-lkat.onrender.com",
@@ -139,9 +148,53 @@ else:
     }
     SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 
+# Reference tables (rooms, buildings, programs, ...) are served from process
+# memory. Entries are keyed by table versions kept in the default cache, so
+# writes invalidate them everywhere and the timeout can be hours.
+REFERENCE_CACHE_TIMEOUT = config('REFERENCE_CACHE_TIMEOUT', default=60 * 60 * 6, cast=int)
+
+CACHES["reference"] = {
+    "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    "LOCATION": "examsync-reference",
+    "TIMEOUT": REFERENCE_CACHE_TIMEOUT,
+    "OPTIONS": {
+        "MAX_ENTRIES": 500,
+    },
+}
+
 # ──────────────────────────────────────────────
 # DATABASE CONFIGURATION
 # ──────────────────────────────────────────────
+# 'wsgi' or 'asgi', as chosen in gunicorn.conf.py. Under ASGI sync code runs
+# on whichever pool thread is free and each thread would keep its own idle
+# connection, so Django advises against persistent connections there.
+SERVER_MODE = config('SERVER_MODE', default='wsgi').lower()
+
+# Connection pooling (psycopg 3). Each web process keeps one pool and every
+# request borrows a connection from it, so Postgres sees at most
+# instances x WEB_CONCURRENCY x DB_POOL_MAX_SIZE connections however many
+# requests arrive, and the TLS handshake is paid when the pool grows rather
+# than by every new thread or recycled worker. A request that finds the pool
+# busy waits up to DB_POOL_TIMEOUT seconds, then fails with a 500 instead
+# of opening one more connection. Pool wait times are in /debug/metrics.
+DB_POOL = config('DB_POOL', default=True, cast=bool)
+DB_POOL_MIN_SIZE = config('DB_POOL_MIN_SIZE', default=1, cast=int)
+# One connection per gthread thread means requests never wait on each other
+DB_POOL_MAX_SIZE = config('DB_POOL_MAX_SIZE', default=config('GUNICORN_THREADS', default=4, cast=int), cast=int)
+DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10.0, cast=float)
+# Connections above the minimum close after this many idle seconds, and
+# every connection is replaced after DB_POOL_MAX_LIFETIME
+DB_POOL_MAX_IDLE = config('DB_POOL_MAX_IDLE', default=300.0, cast=float)
+DB_POOL_MAX_LIFETIME = config('DB_POOL_MAX_LIFETIME', default=1800.0, cast=float)
+# Fail at once when this many requests are already queued (0: no limit)
+DB_POOL_MAX_WAITING = config('DB_POOL_MAX_WAITING', default=0, cast=int)
+
+# Set when DB_HOST is a pgbouncer in transaction mode. Django already turns
+# off psycopg's prepared statements; server-side cursors (QuerySet.iterator())
+# must go too, since they outlive the transaction pgbouncer pins them to.
+DB_PGBOUNCER = config('DB_PGBOUNCER', default=False, cast=bool)
+DB_SSLMODE = config('DB_SSLMODE', default='require')
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -150,11 +203,14 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD"),
         "HOST": config("DB_HOST"),
         "PORT": config("DB_PORT", cast=int),
-        "CONN_MAX_AGE": 600,
+        # The pool replaces persistent connections; Django refuses both at once
+        "CONN_MAX_AGE": 0 if DB_POOL or SERVER_MODE == 'asgi' else 600,
+        # With a pool, connections are checked as they're handed out
         "CONN_HEALTH_CHECKS": True,
+        "DISABLE_SERVER_SIDE_CURSORS": DB_PGBOUNCER,
         "OPTIONS": {
             "application_name": "DjangoApp",
-            "sslmode": "require",
+            "sslmode": DB_SSLMODE,
             "connect_timeout": 5,
             "keepalives": 1,
             "keepalives_idle": 30,
@@ -164,6 +220,42 @@ DATABASES = {
     }
 }
 
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": max(DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE),
+        "timeout": DB_POOL_TIMEOUT,
+        "max_idle": DB_POOL_MAX_IDLE,
+        "max_lifetime": DB_POOL_MAX_LIFETIME,
+        "max_waiting": DB_POOL_MAX_WAITING,
+    }
+
+# Optional read replica for the reporting reads that opt in (api/routers.py).
+# Only the DB_REPLICA_* values that differ from the primary need setting;
+# without DB_REPLICA_HOST everything reads from the primary. Locally, a
+# second database on the same server stands in for one:
+#   DB_REPLICA_HOST=$DB_HOST DB_REPLICA_NAME=examsync_replica
+DB_REPLICA_HOST = config('DB_REPLICA_HOST', default='')
+if DB_REPLICA_HOST:
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": config("DB_REPLICA_NAME", default=DATABASES["default"]["NAME"]),
+        "USER": config("DB_REPLICA_USER", default=DATABASES["default"]["USER"]),
+        "PASSWORD": config("DB_REPLICA_PASSWORD", default=DATABASES["default"]["PASSWORD"]),
+        "HOST": DB_REPLICA_HOST,
+        "PORT": config("DB_REPLICA_PORT", default=DATABASES["default"]["PORT"], cast=int),
+        "OPTIONS": copy.deepcopy(DATABASES["default"]["OPTIONS"]),
+        # Tests read the primary's test database through this alias
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["api.routers.ReplicaRouter"]
+# A client's reads stay on the primary this long after it writes, so it
+# sees its own changes while the replica catches up
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=5, cast=int)
+# After the replica fails to connect, read from the primary for this long
+REPLICA_RETRY_SECONDS = config('REPLICA_RETRY_SECONDS', default=30, cast=int)
+
 # ──────────────────────────────────────────────
 # DJANGO REST FRAMEWORK SETTINGS
 # ──────────────────────────────────────────────
@@ -178,9 +270,9 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 30,
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "api.renderers.ORJSONRenderer",
     ] if not config('DEBUG', default=False, cast=bool) else [
-        "rest_framework.renderers.JSONRenderer",
+        "api.renderers.ORJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",
     ],
     "DEFAULT_THROTTLE_CLASSES": [
@@ -193,6 +285,10 @@ REST_FRAMEWORK = {
     },
 }
 
+# /api/ responses at least this large are gzip/brotli compressed
+API_COMPRESSION_MIN_BYTES = config('API_COMPRESSION_MIN_BYTES', default=1024, cast=int)
+API_BROTLI_QUALITY = config('API_BROTLI_QUALITY', default=5, cast=int)
+
 # ──────────────────────────────────────────────
 # STATIC FILES
 # ──────────────────────────────────────────────
@@ -201,11 +297,102 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 STATICFILES_DIRS = [BASE_DIR / "static"] if (BASE_DIR / "static").exists() else []
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
+# ──────────────────────────────────────────────
+# MEDIA FILES (avatars, schedule logos)
+# ──────────────────────────────────────────────
+# Uploaded images live in MEDIA_ROOT by default. Point MEDIA_STORAGE_BACKEND
+# at an object storage backend (e.g. storages.backends.s3.S3Storage) to move
+# them off the web service; the database only ever holds the file URL.
+# Render's filesystem is wiped on every deploy, so with DEBUG off local
+# storage is refused unless MEDIA_ROOT is on a persistent disk.
+# MEDIA_BASE_URL is the API's public origin (e.g. https://exam-sync-v2-0-mwnp.onrender.com);
+# relative media URLs are prefixed with it before they are stored, since the
+# frontend is served from another host.
+MEDIA_URL = config('MEDIA_URL', default="/media/")
+MEDIA_BASE_URL = config('MEDIA_BASE_URL', default="")
+MEDIA_ROOT = config('MEDIA_ROOT', default=str(BASE_DIR / "media"))
+MEDIA_CACHE_MAX_AGE = config('MEDIA_CACHE_MAX_AGE', default=60 * 60 * 24 * 365, cast=int)
+MEDIA_STORAGE_BACKEND = config('MEDIA_STORAGE_BACKEND', default="django.core.files.storage.FileSystemStorage")
+MEDIA_PERSISTENT_DISK = config('MEDIA_PERSISTENT_DISK', default=False, cast=bool)
+
+if not DEBUG and not MEDIA_PERSISTENT_DISK and MEDIA_STORAGE_BACKEND.endswith(".FileSystemStorage"):
+    from django.core.exceptions import ImproperlyConfigured
+    raise ImproperlyConfigured(
+        "Uploaded media would be stored on the web service's ephemeral disk. Set "
+        "MEDIA_STORAGE_BACKEND (and the AWS_* settings) or, with MEDIA_ROOT on a "
+        "persistent disk, MEDIA_PERSISTENT_DISK=True."
+    )
+
+if not DEBUG and not MEDIA_BASE_URL:
+    from django.core.exceptions import ImproperlyConfigured
+    raise ImproperlyConfigured(
+        "Set MEDIA_BASE_URL to the API's public origin; stored avatar and logo "
+        "URLs are built from it."
+    )
+
+# S3-compatible object storage (django-storages); AWS_ACCESS_KEY_ID and
+# AWS_SECRET_ACCESS_KEY are read from the environment by boto3. URLs are
+# unsigned because they are stored in the database and must not expire.
+AWS_STORAGE_BUCKET_NAME = config('AWS_STORAGE_BUCKET_NAME', default='')
+AWS_S3_ENDPOINT_URL = config('AWS_S3_ENDPOINT_URL', default='') or None
+AWS_S3_REGION_NAME = config('AWS_S3_REGION_NAME', default='') or None
+AWS_S3_CUSTOM_DOMAIN = config('AWS_S3_CUSTOM_DOMAIN', default='') or None
+AWS_QUERYSTRING_AUTH = False
+AWS_S3_OBJECT_PARAMETERS = {"CacheControl": f"public, max-age={MEDIA_CACHE_MAX_AGE}, immutable"}
+
+STORAGES = {
+    "default": {
+        "BACKEND": MEDIA_STORAGE_BACKEND,
+    },
+    # Django 5.1+ ignores STATICFILES_STORAGE; keep the backend it already falls back to
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# ──────────────────────────────────────────────
+# WORKER POOLS (api/workers.py)
+# ──────────────────────────────────────────────
+# Per-process pools for CPU-heavy work: (worker processes, extra jobs allowed
+# to queue before callers do the work themselves)
+IMAGE_POOL = (
+    config('IMAGE_POOL_WORKERS', default=2, cast=int),
+    config('IMAGE_POOL_QUEUE', default=16, cast=int),
+)
+PASSWORD_POOL = (
+    config('PASSWORD_POOL_WORKERS', default=2, cast=int),
+    config('PASSWORD_POOL_QUEUE', default=64, cast=int),
+)
+
+# ──────────────────────────────────────────────
+# REQUEST METRICS (api/metrics.py)
+# ──────────────────────────────────────────────
+REQUEST_METRICS_ENABLED = config('REQUEST_METRICS_ENABLED', default=True, cast=bool)
+# Requests slower than this are logged with their query count
+REQUEST_SLOW_MS = config('REQUEST_SLOW_MS', default=1000, cast=int)
+# /debug/metrics needs this token (X-Metrics-Token header or ?token=); with
+# no token set it is only served when DEBUG is on
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Per-request cProfile (api/profiling.py): X-Profile: 1 or ?_profile=1 from a
+# staff session or a METRICS_TOKEN holder; reports are kept PROFILE_TTL seconds
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILE_TOP = config('PROFILE_TOP', default=40, cast=int)
+PROFILE_MAX_QUERIES = config('PROFILE_MAX_QUERIES', default=500, cast=int)
+PROFILE_TTL = config('PROFILE_TTL', default=60 * 60, cast=int)
+
 # ──────────────────────────────────────────────
 # EMAIL SETTINGS (Resend)
 # ──────────────────────────────────────────────
 RESEND_API_KEY = os.environ.get('RESEND_API_KEY', '')
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'onboarding@resend.dev')
+RESEND_API_URL = config('RESEND_API_URL', default='https://api.resend.com')
+# api/mailer.py: messages per /emails/batch call (Resend allows 100), batches
+# in flight at once, seconds per call, and retries after a 429
+MAIL_BATCH_SIZE = config('MAIL_BATCH_SIZE', default=100, cast=int)
+MAIL_CONCURRENCY = config('MAIL_CONCURRENCY', default=2, cast=int)
+MAIL_TIMEOUT = config('MAIL_TIMEOUT', default=10.0, cast=float)
+MAIL_RETRIES = config('MAIL_RETRIES', default=2, cast=int)
 
 # ──────────────────────────────────────────────
 # SMS SETTINGS
@@ -18,8 +18,10 @@ urlpatterns = [
     path('api/login/', views.login_faculty, name='login_faculty'),
     path('api/users/', views.users_list, name='users_list'),
     path('api/create-account/', views.create_account_with_password, name='create_account_with_password'),
+    path('api/create-account/bulk/', views.create_accounts_bulk, name='create_accounts_bulk'),
     path('api/users/<int:user_id>/', views.user_detail, name='user_detail'),
     path('api/tbl_users/<int:user_id>/', views.user_detail, name='tbl_user_detail'),  # ✅ NEW: Alias for compatibility
+    path('api/user-roles/bulk/', views.user_roles_bulk, name='user_roles_bulk'),
     path('api/user-roles/<int:user_id>/roles/', views.user_roles, name='user_roles'),
     path('api/auth/request-password-change/', views.request_password_change, name='request_password_change'),
     path('api/auth/confirm-password-change/', views.confirm_password_change, name='confirm_password_change'),
@@ -70,6 +72,8 @@ urlpatterns = [
     path('api/user-role-history/create/', views.user_role_history_create, name='user_role_history_create'),
 
     path('api/tbl_sectioncourse/page-data/', views.tbl_sectioncourse_page_data, name='tbl_sectioncourse_page_data'),
+    path('api/scheduler/bootstrap/', views.scheduler_bootstrap, name='scheduler_bootstrap'),
+    path('api/scheduler/viewer/', views.scheduler_viewer, name='scheduler_viewer'),
     path('api/tbl_sectioncourse/', views.tbl_sectioncourse_list, name='tbl_sectioncourse_list'),
     path('api/tbl_sectioncourse/<int:pk>/', views.tbl_sectioncourse_detail, name='tbl_sectioncourse_detail'),
 
@@ -77,6 +81,7 @@ urlpatterns = [
     path('api/tbl_course_users/<str:course_id>/<int:user_id>/', views.tbl_course_users_detail, name='tbl_course_users_detail'),
 
     path('api/tbl_availability/', views.tbl_availability_list, name='tbl_availability_list'),
+    path('api/tbl_availability/bulk/', views.tbl_availability_bulk, name='tbl_availability_bulk'),
     path('api/tbl_availability/<int:availability_id>/', views.tbl_availability_detail, name='tbl_availability_detail'),
 
     path('api/tbl_modality/', views.tbl_modality_list, name='tbl_modality_list'),
@@ -88,6 +93,7 @@ urlpatterns = [
 
     path('api/tbl_scheduleapproval/', views.tbl_scheduleapproval_list, name='tbl_scheduleapproval_list'),
     path('api/tbl_scheduleapproval/<uuid:pk>/', views.tbl_scheduleapproval_detail, name='tbl_scheduleapproval_detail'),
+    path('api/schedule-export/<str:fmt>/', views.schedule_export, name='schedule_export'),
 
     path('api/send_schedule_to_dean/', views.send_schedule_to_dean, name='send_schedule_to_dean'),
 
@@ -115,9 +121,19 @@ urlpatterns = [
     path('api/tbl_schedule_footer/<int:pk>/', views.tbl_schedule_footer_detail, name='tbl_schedule_footer_detail'),
     path('api/upload-schedule-logo/', views.upload_schedule_logo, name='upload_schedule_logo'),
 
+    # Uploaded images (served locally or redirected to object storage)
+    re_path(r'^media/(?P<path>.+)$', views.media_file, name='media_file'),
+
     path('api/users/bulk/', views.users_bulk),
 
+    # Spreadsheet import (rooms, courses, section_courses, users)
+    path('api/import/<str:resource>/', views.bulk_import, name='bulk_import'),
+
+    # Request metrics (RequestMetricsMiddleware)
+    re_path(r'^debug/metrics/?$', views.debug_metrics, name='debug_metrics'),
+    re_path(r'^debug/profile/(?P<profile_id>[0-9a-f]{32})/?$', views.debug_profile, name='debug_profile'),
+
     # ── Redirect all non-API, non-utility routes to the React frontend ──
-    # Fixed: also excludes health/ and debug/ from being redirected
-    re_path(r'^(?!api/|health/|debug/).*$', RedirectView.as_view(url='https://exam-sync-frontend.onrender.com/', permanent=False)),
+    # Fixed: also excludes health/, debug/ and media/ from being redirected
+    re_path(r'^(?!api/|health/|debug/|media/).*$', RedirectView.as_view(url='https://exam-sync-frontend.onrender.com/', permanent=False)),
 ]
\ No newline at end of file
@@ -0,0 +1,137 @@
+# exam-sync-v2/backend/gunicorn.conf.py
+
+import os
+
+# Not imported as `config`: gunicorn would read that name as its -c setting
+from decouple import config as env
+
+# Gunicorn reads this file from the working directory (see render.yaml),
+# which starts it without an app argument so SERVER_MODE can choose one.
+# Every value can be overridden with an environment variable, so the same
+# file fits the free instance and a larger plan.
+
+
+def _cpu_count():
+    # Affinity reflects CPUs actually given to this container where supported
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# ──────────────────────────────────────────────
+# SERVER SOCKET
+# ──────────────────────────────────────────────
+bind = f"0.0.0.0:{env('PORT', default='8000')}"
+
+# Render terminates TLS in front of us and is the only thing that can reach
+# the port, so trust its X-Forwarded-* headers
+forwarded_allow_ips = env('FORWARDED_ALLOW_IPS', default='*')
+
+# ──────────────────────────────────────────────
+# WORKERS
+# ──────────────────────────────────────────────
+# SERVER_MODE picks how requests reach Django; both serve every endpoint.
+#
+#   wsgi  gthread: each process serves `threads` requests at once, so a
+#         request waiting on Resend or Postgres blocks one thread rather
+#         than the whole process. Async views still run, each in its own
+#         short-lived event loop.
+#   asgi  uvicorn workers on backend.asgi: async views (mail delivery, see
+#         api/mailer.py) wait on the event loop without holding a thread;
+#         sync views run on asgiref's thread pool, sized by ASGI_THREADS.
+#
+# CPU-heavy work already goes to the process pools in api/workers.py.
+server_mode = env('SERVER_MODE', default='wsgi').lower()
+if server_mode not in ('wsgi', 'asgi'):
+    raise ValueError(f"SERVER_MODE must be 'wsgi' or 'asgi', not {server_mode!r}")
+
+if server_mode == 'asgi':
+    wsgi_app = 'backend.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'backend.wsgi:application'
+    worker_class = 'gthread'
+
+# (2 x CPUs) + 1 processes, capped because each one holds a full Django app
+# in memory along with the api/workers.py pool processes it forks. The CPU
+# count is the host's on most containers, not the instance's share, so the
+# cap is what usually applies; render.yaml sets WEB_CONCURRENCY and the pool
+# sizes for the 512 MB free instance. Each process has its own DB pool, so
+# workers x DB_POOL_MAX_SIZE is the most Postgres connections one instance
+# opens (see settings.py).
+workers = env(
+    'WEB_CONCURRENCY',
+    default=min(2 * _cpu_count() + 1, env('GUNICORN_MAX_WORKERS', default=2, cast=int)),
+    cast=int,
+)
+# Ignored by uvicorn workers
+threads = env('GUNICORN_THREADS', default=4, cast=int)
+
+# Import Django once in the master and fork: workers share the code and
+# startup objects copy-on-write instead of each loading them again
+preload_app = env('GUNICORN_PRELOAD', default=True, cast=bool)
+
+# Recycle a worker after this many requests (± jitter, so they don't all
+# restart together) to hand back memory the process has grown into
+max_requests = env('GUNICORN_MAX_REQUESTS', default=1000, cast=int)
+max_requests_jitter = env('GUNICORN_MAX_REQUESTS_JITTER', default=100, cast=int)
+
+# ──────────────────────────────────────────────
+# TIMEOUTS
+# ──────────────────────────────────────────────
+# A gthread worker's main thread keeps sending heartbeats while requests
+# run, so this only restarts a wedged process; a slow email or approval
+# fan-out no longer gets its worker killed at 30s as under sync workers.
+timeout = env('GUNICORN_TIMEOUT', default=60, cast=int)
+graceful_timeout = env('GUNICORN_GRACEFUL_TIMEOUT', default=30, cast=int)
+# Reuse connections from Render's proxy between requests
+keepalive = env('GUNICORN_KEEPALIVE', default=5, cast=int)
+
+# Heartbeat files on tmpfs; a slow container disk can stall them and look like a hung worker
+worker_tmp_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# ──────────────────────────────────────────────
+# LOGGING
+# ──────────────────────────────────────────────
+errorlog = '-'
+loglevel = env('GUNICORN_LOG_LEVEL', default='info')
+# RequestMetricsMiddleware already logs slow requests; set to "-" for every request
+accesslog = env('GUNICORN_ACCESS_LOG', default=None)
+
+
+# ──────────────────────────────────────────────
+# HOOKS
+# ──────────────────────────────────────────────
+def pre_fork(server, worker):
+    # A psycopg pool fills and checks connections from its own threads,
+    # which a forked child doesn't get: close any pool the master opened
+    # while preloading so every worker starts its own.
+    if not server.cfg.preload_app:
+        return
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close_pool()
+
+
+def post_fork(server, worker):
+    # Anything the master opened while preloading must not be shared with
+    # the children: each worker opens its own DB and Redis connections.
+    if not server.cfg.preload_app:
+        return
+    from django.core.cache import caches
+    from django.db import connections
+
+    connections.close_all()
+    for cache in caches.all(initialized_only=True):
+        cache.close()
+
+
+def when_ready(server):
+    server.log.info(
+        "gunicorn ready (%s): %s %s worker(s)%s, preload=%s, max_requests=%s±%s",
+        server_mode, workers, worker_class,
+        f" x {threads} thread(s)" if server_mode == 'wsgi' else '',
+        preload_app, max_requests, max_requests_jitter,
+    )
@@ -2,6 +2,7 @@
 import React, { useState, useEffect, useMemo, useCallback, useRef } from "react";
 import { FaTrash, FaEdit, FaSearch, FaDownload, FaPlus, FaFileImport, FaChevronLeft, FaChevronRight, FaSort, FaChevronDown } from "react-icons/fa";
 import { api } from "../lib/apiClient.ts";
+import { importSpreadsheet, importMessages } from '../lib/importFile.ts';
 import { ToastContainer, toast } from "react-toastify";
 import * as XLSX from "xlsx";
 import "react-toastify/dist/ReactToastify.css";
@@ -514,118 +515,31 @@ const Courses: React.FC = () => {
     setShowModal(true);
   };
 
-  const clean = (str: string) =>
-    String(str)
-      .replace(/\u00A0/g, " ")     
-      .replace(/\t/g, " ")         
-      .trim()
-      .toLowerCase();
-
-
-  const handleImport = (e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleImport = async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) {
       toast.error("No file selected.");
       return;
     }
 
-    const reader = new FileReader();
-    reader.onload = async (evt) => {
-      setIsImporting(true);
-
-      try {
-        const bstr = evt.target?.result;
-        const wb = XLSX.read(bstr, { type: "binary" });
-        const ws = wb.Sheets[wb.SheetNames[0]];
-        const data = XLSX.utils.sheet_to_json(ws);
-
-        if (!data.length) {
-          toast.error("The Excel file is empty.");
-          setIsImporting(false);
-          return;
-        }
-
-        let successCount = 0;
-        let errorCount = 0;
-
-        for (const row of data as any[]) {
-          const rawCourseId = String(row["Course ID"] || "").trim();
-          const course_id = rawCourseId
-            .replace(/\u00A0/g, " ")
-            .replace(/\t/g, " ")
-            .trim();
-          const course_name = row["Course Name"]?.trim();
-          const term_full = clean(row["Term Name"]);
-          const instructors_raw = row["Instructor Full Names"]?.trim();
-
-          if (!course_id || !course_name || !term_full) {
-            toast.error(`Row skipped (${row["Course ID"]}): Missing required fields.`);
-            errorCount++;
-            continue;
-          }
-
-          const term = terms.find(
-            (t) => clean(t.term_name) === term_full
-          );
-
-          if (!term) {
-            toast.error(`Row skipped (${row["Course ID"]}): Term not found.`);
-            errorCount++;
-            continue;
-          }
-
-          let instructorIds: number[] = [];
-
-          if (instructors_raw && instructors_raw.trim() !== "") {
-            const instructorNames = instructors_raw
-              .split(",")
-              .map((n: string) => clean(n));
-
-            instructorIds = users
-              .filter((u) =>
-                instructorNames.includes(
-                  clean(formatName(u))
-                )
-              )
-              .map((u) => u.user_id);
-
-            if (instructorIds.length === 0) {
-              toast.warn(
-                `No matching instructors for ${row["Course ID"]}. Importing with none.`
-              );
-            }
-          } else {
-            instructorIds = [];
-          }
-
-          try {
-            await api.post("/courses/", {
-              course_id,
-              course_name,
-              term_id: term.term_id,
-              user_ids: instructorIds,
-              leaders: [],    
-            });
-
-            successCount++;
-          } catch (err) {
-            errorCount++;
-            toast.error(`API error importing ${row["Course ID"]}.`);
-          }
-        }
-
-        toast.success(`Import complete: ${successCount} added, ${errorCount} errors.`);
-        await fetchCourses();
-        setShowImport(false);
-
-      } catch (error) {
-        toast.error("Error reading file.");
-      } finally {
-        setIsImporting(false);
-      }
-    };
-
-    reader.readAsBinaryString(file);
+    setIsImporting(true);
+    try {
+      // Terms and instructor names are matched on the server, in one request
+      const result = await importSpreadsheet("courses", file);
+      const { errors, warnings } = importMessages(result);
+      errors.forEach((msg) => toast.error(`Row skipped - ${msg}`));
+      warnings.forEach((msg) => toast.warn(msg));
+
+      toast.success(
+        `Import complete: ${result.created} added, ${result.updated} updated, ${errors.length} errors.`
+      );
+      await fetchCourses();
+      setShowImport(false);
+    } catch (err: any) {
+      toast.error(err?.response?.data?.error || "Error reading file.");
+    } finally {
+      setIsImporting(false);
+    }
   };
 
   const downloadTemplate = useCallback(() => {
@@ -922,7 +836,7 @@ const Courses: React.FC = () => {
             </div>
             <div className="cl-modal-body">
               <p className="cl-import-hint">Each course must have a unique Course ID.</p>
-              <input type="file" accept=".xlsx,.xls" onChange={handleImport} disabled={isImporting} className="cl-file-input" />
+              <input type="file" accept=".xlsx,.xls,.csv" onChange={handleImport} disabled={isImporting} className="cl-file-input" />
               <button type="button" className="cl-btn" onClick={downloadTemplate} disabled={isImporting} style={{ width: '100%', justifyContent: 'center', marginTop: '8px' }}>
                 <FaDownload style={{ fontSize: '11px' }} /> Download Template
               </button>
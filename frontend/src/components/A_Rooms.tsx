@@ -2,6 +2,7 @@
 import React, { useState, useEffect, useRef, useMemo } from 'react';
 import { FaTrash, FaEdit, FaSearch, FaDownload, FaPlus, FaFileImport, FaChevronLeft, FaChevronRight, FaSort, FaChevronDown } from 'react-icons/fa';
 import { api } from '../lib/apiClient.ts';
+import { importSpreadsheet, importMessages } from '../lib/importFile.ts';
 import { ToastContainer, toast } from 'react-toastify';
 import * as XLSX from 'xlsx';
 import 'react-toastify/dist/ReactToastify.css';
@@ -271,54 +272,27 @@ const Rooms: React.FC = () => {
   };
 
   // Import Excel
-  const handleImportFile = (e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleImportFile = async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) return;
 
-    const reader = new FileReader();
-    reader.onload = async (evt: any) => {
-      setIsImporting(true);
-      try {
-        const data = new Uint8Array(evt.target.result);
-        const wb = XLSX.read(data, { type: 'array' });
-        const sheet = wb.Sheets[wb.SheetNames[0]];
-        const rows: any[] = XLSX.utils.sheet_to_json(sheet);
-
-        let added = 0;
-        for (const row of rows) {
-          const room_id = row['Room ID']?.trim();
-          const room_name = row['Room Name']?.trim();
-          const room_type = row['Room Type']?.trim();
-          const room_capacity = parseInt(row['Room Capacity'] || 0);
-          const building_id = row['Building ID']?.trim();
-
-          if (!room_id || !room_name || !room_type || !room_capacity || !building_id) continue;
-
-          try {
-            await api.post('/tbl_rooms', {
-              room_id,
-              room_name,
-              room_type,
-              room_capacity,
-              building: building_id,
-            });
-            added++;
-          } catch {
-            continue;
-          }
-        }
-
-        toast.success(`Import completed: ${added} room(s) added`);
-        setTimeout(() => fetchAll(), 300);
-      } catch {
-        toast.error('Error reading or importing file');
-      } finally {
-        setIsImporting(false);
-        setShowImport(false);
-      }
-    };
-
-    reader.readAsArrayBuffer(file);
+    setIsImporting(true);
+    try {
+      // The server validates and saves every row in one request
+      const result = await importSpreadsheet('rooms', file);
+      const { errors, warnings } = importMessages(result);
+      if (errors.length > 0) console.error('Import errors:', errors);
+      if (warnings.length > 0) console.warn('Import warnings:', warnings);
+
+      toast.success(`Import completed: ${result.created} room(s) added`);
+      if (errors.length > 0) toast.warning(`${errors.length} row(s) skipped. Check console for details.`);
+      setTimeout(() => fetchAll(), 300);
+    } catch (err: any) {
+      toast.error(err?.response?.data?.error || 'Error reading or importing file');
+    } finally {
+      setIsImporting(false);
+      setShowImport(false);
+    }
   };
 
   // Download Template
@@ -1123,7 +1097,7 @@ const Rooms: React.FC = () => {
             <p style={{ fontSize: '12px', color: '#666', marginBottom: '10px' }}>
               Each room must have a unique Room ID and valid Building ID.
             </p>
-            <input type="file" accept=".xlsx,.xls" onChange={handleImportFile} disabled={isImporting} />
+            <input type="file" accept=".xlsx,.xls,.csv" onChange={handleImportFile} disabled={isImporting} />
             <div className="modal-actions">
               <button
                 type="button"
@@ -2,6 +2,7 @@
 import React, { useState, useEffect, useMemo, useCallback, useRef } from 'react';
 import { FaTrash, FaEdit, FaSearch, FaDownload, FaPlus, FaFileImport, FaChevronLeft, FaChevronRight, FaSort, FaChevronDown } from 'react-icons/fa';
 import { api } from '../lib/apiClient.ts';
+import { importSpreadsheet, importMessages } from '../lib/importFile.ts';
 import { ToastContainer, toast } from 'react-toastify';
 import * as XLSX from 'xlsx';
 import 'react-toastify/dist/ReactToastify.css';
@@ -334,236 +335,41 @@ const SectionCourses: React.FC = () => {
     }
   };
 
-  const handleImportFile = (e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleImportFile = async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) return;
 
-    const reader = new FileReader();
-    reader.onload = async (evt: ProgressEvent<FileReader>) => {
-      setIsImporting(true);
-      try {
-        const data = new Uint8Array(evt.target?.result as ArrayBuffer);
-        const wb = XLSX.read(data, { type: 'array' });
-        const sheet = wb.Sheets[wb.SheetNames[0]];
-        const rows: Record<string, string | number>[] = XLSX.utils.sheet_to_json(sheet);
-
-        const validRows: SectionCourse[] = [];
-        const errors: string[] = [];
-        const warnings: string[] = [];
-
-        const importMap = new Map<string, number>();
-
-        for (let idx = 0; idx < rows.length; idx++) {
-          const row = rows[idx];
-          const rowNum = idx + 2; 
-
-          const section_name = String(row['Section Name'] || '').trim();
-          const number_of_students = parseInt(String(row['Number of Students'] || '0'));
-          const year_level = String(row['Year Level'] || '').trim();
-          const is_night_class = String(row['Night Class'] || '').trim().toUpperCase() === "YES" ? "YES" : "";
-          const term_name = String(row['Term Name'] || '').trim();
-          const course_id = String(row['Course ID'] || '').trim();
-          const program_id = String(row['Program ID'] || '').trim();
-          const instructor_names_raw = String(row['Instructor Name'] || '').trim();
-
-          if (!section_name) {
-            errors.push(`Row ${rowNum}: Missing Section Name`);
-            continue;
-          }
-          if (!number_of_students || isNaN(number_of_students)) {
-            errors.push(`Row ${rowNum}: Missing or invalid Number of Students`);
-            continue;
-          }
-          if (!year_level) {
-            errors.push(`Row ${rowNum}: Missing Year Level`);
-            continue;
-          }
-          if (!term_name) {
-            errors.push(`Row ${rowNum}: Missing Term Name`);
-            continue;
-          }
-          if (!course_id) {
-            errors.push(`Row ${rowNum}: Missing Course ID`);
-            continue;
-          }
-          if (!program_id) {
-            errors.push(`Row ${rowNum}: Missing Program ID`);
-            continue;
-          }
-
-          // Validate course exists
-          const courseExists = courses.find(c => c.course_id === course_id);
-          if (!courseExists) {
-            errors.push(`Row ${rowNum}: Course ID "${course_id}" not found`);
-            continue;
-          }
-
-          // Validate program exists
-          const programExists = programs.find(p => p.program_id === program_id);
-          if (!programExists) {
-            errors.push(`Row ${rowNum}: Program ID "${program_id}" not found`);
-            continue;
-          }
-
-          // Validate term exists
-          const term = terms.find(t => t.term_name === term_name);
-          if (!term) {
-            errors.push(`Row ${rowNum}: Term "${term_name}" not found`);
-            continue;
-          }
-
-          if (!instructor_names_raw) {
-            errors.push(`Row ${rowNum}: Instructor Name is required`);
-            continue;
-          }
-
-          const availableInstructors = courseInstructorsMap[course_id] || [];
-
-          const instructorNames = instructor_names_raw.split(',').map(name => name.trim()).filter(name => name);
-
-          if (instructorNames.length === 0) {
-            errors.push(`Row ${rowNum}: Instructor Name is required`);
-            continue;
-          }
-
-          let foundAtLeastOne = false;
-          for (const instructor_name of instructorNames) {
-            const user = availableInstructors.find(u =>
-              u.full_name.toLowerCase() === instructor_name.toLowerCase()
-            );
-
-            if (!user) {
-              if (availableInstructors.length > 0) {
-                const availableNames = availableInstructors.map(i => i.full_name).join(', ');
-                errors.push(`Row ${rowNum}: Instructor "${instructor_name}" not found for course "${course_id}". Available: ${availableNames}`);
-              } else {
-                errors.push(`Row ${rowNum}: Instructor "${instructor_name}" not found - no instructors assigned to course "${course_id}"`);
-              }
-              continue;
-            }
-
-            const uniqueKey = `${course_id}|${program_id}|${section_name}|${term.term_id}|${user.user_id}`;
-
-            const existingDuplicate = sectionCourses.find(sc =>
-              sc.course_id === course_id &&
-              sc.program_id === program_id &&
-              sc.section_name === section_name &&
-              sc.term_id === term.term_id &&
-              sc.user_id === user.user_id
-            );
-
-            if (existingDuplicate) {
-              warnings.push(`Row ${rowNum}: Section "${section_name}" already exists in database - skipping`);
-              continue;
-            }
-
-            if (importMap.has(uniqueKey)) {
-              const firstRow = importMap.get(uniqueKey);
-              warnings.push(`Row ${rowNum}: Duplicate of row ${firstRow} - skipping`);
-              continue;
-            }
-
-            const existingSection = sectionCourses.find(sc =>
-              sc.course_id === course_id &&
-              sc.program_id === program_id &&
-              sc.section_name === section_name &&
-              sc.term_id === term.term_id
-            );
-
-            if (existingSection) {
-              warnings.push(`Row ${rowNum}: Section "${section_name}" already exists with instructor "${existingSection.user?.full_name}" - skipping`);
-              continue;
-            }
-
-            foundAtLeastOne = true;
-            importMap.set(uniqueKey, rowNum);
-
-            validRows.push({
-              course_id,
-              program_id,
-              section_name,
-              number_of_students,
-              year_level,
-              term_id: term.term_id,
-              user_id: user.user_id,
-              is_night_class
-            } as SectionCourse);
-          }
-
-          if (!foundAtLeastOne && instructorNames.length > 0) {
-            errors.push(`Row ${rowNum}: None of the specified instructors were found or all entries were duplicates`);
-          }
-        }
-
-        // Show errors and warnings
-        if (errors.length > 0) {
-          console.error('Import errors:', errors);
-          toast.error(`❌ ${errors.length} error(s) found. Check console for details.`, { autoClose: 5000 });
-        }
-
-        if (warnings.length > 0) {
-          console.warn('Import warnings:', warnings);
-          toast.warning(`⚠️ ${warnings.length} duplicate(s) skipped. Check console for details.`, { autoClose: 5000 });
-        }
-
-        if (validRows.length === 0) {
-          if (errors.length === 0 && warnings.length > 0) {
-            toast.info('ℹ️ All rows were duplicates - nothing to import');
-          } else {
-            toast.warning('⚠️ No valid rows to import');
-          }
-          setShowImport(false);
-          setIsImporting(false);
-          return;
-        }
-
-        // Import valid rows in batches
-        let added = 0;
-        let failed = 0;
-        const batchSize = 10;
-
-        for (let i = 0; i < validRows.length; i += batchSize) {
-          const batch = validRows.slice(i, i + batchSize);
-
-          const results = await Promise.allSettled(
-            batch.map(payload => api.post('/tbl_sectioncourse/', payload))
-          );
-
-          results.forEach((result, index) => {
-            if (result.status === 'fulfilled' && (result.value.status === 200 || result.value.status === 201)) {
-              added++;
-            } else {
-              failed++;
-              if (result.status === 'rejected') {
-                console.error(`Failed to import row:`, batch[index], result.reason);
-              }
-            }
-          });
-        }
-
-        // Show final summary
-        const messages = [];
-        if (added > 0) messages.push(`${added} section(s) added`);
-        if (failed > 0) messages.push(`${failed} failed`);
-        if (warnings.length > 0) messages.push(`⚠️ ${warnings.length} skipped`);
+    setIsImporting(true);
+    try {
+      // Courses, programs, terms and instructors are checked on the server in one request
+      const result = await importSpreadsheet('section_courses', file);
+      const { errors, warnings } = importMessages(result);
 
-        if (added > 0) {
-          toast.success(`Import completed: ${messages.join(', ')}`, { autoClose: 5000 });
-        } else if (failed > 0 || warnings.length > 0) {
-          toast.info(`Import completed: ${messages.join(', ')}`, { autoClose: 5000 });
-        }
+      if (errors.length > 0) {
+        console.error('Import errors:', errors);
+        toast.error(`❌ ${errors.length} error(s) found. Check console for details.`, { autoClose: 5000 });
+      }
+      if (warnings.length > 0) {
+        console.warn('Import warnings:', warnings);
+        toast.warning(`⚠️ ${warnings.length} duplicate(s) skipped. Check console for details.`, { autoClose: 5000 });
+      }
 
-        fetchAll();
-      } catch (error) {
-        console.error('Import error:', error);
-        toast.error('❌ Import failed. Check console for details.');
-      } finally {
-        setShowImport(false);
-        setIsImporting(false);
+      if (result.created > 0) {
+        toast.success(`Import completed: ${result.created} section(s) added`, { autoClose: 5000 });
+      } else if (errors.length === 0 && warnings.length > 0) {
+        toast.info('ℹ️ All rows were duplicates - nothing to import');
+      } else {
+        toast.warning('⚠️ No valid rows to import');
       }
-    };
 
-    reader.readAsArrayBuffer(file);
+      fetchAll();
+    } catch (error: any) {
+      console.error('Import error:', error);
+      toast.error(`❌ Import failed: ${error?.response?.data?.error || 'Check console for details.'}`);
+    } finally {
+      setShowImport(false);
+      setIsImporting(false);
+    }
   };
 
   const downloadTemplate = () => {
@@ -1693,7 +1499,7 @@ const SectionCourses: React.FC = () => {
               Each section must belong to an existing course, program, term, and have an assigned instructor.
             </p>
 
-            <input type="file" accept=".xlsx,.xls" onChange={handleImportFile} disabled={isImporting} />
+            <input type="file" accept=".xlsx,.xls,.csv" onChange={handleImportFile} disabled={isImporting} />
 
             <button
               type="button"
@@ -5,6 +5,7 @@ import {
   FaChevronDown, FaEye,
 } from 'react-icons/fa';
 import { api } from '../lib/apiClient.ts';
+import { importSpreadsheet, importMessages } from '../lib/importFile.ts';
 import { ToastContainer, toast } from 'react-toastify';
 import * as XLSX from 'xlsx';
 import 'react-toastify/dist/ReactToastify.css';
@@ -367,74 +368,30 @@ export const UserManagement: React.FC<UserManagementProps> = () => {
 
   // ── Import ────────────────────────────────────────────────────────────────
 
-  const handleImportAccounts = (e: React.ChangeEvent<HTMLInputElement>) => {
+  const handleImportAccounts = async (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (!file) return;
-    const reader = new FileReader();
-    reader.onload = async evt => {
-      setImportLoading(true);
-      toast.info('Importing accounts...', { autoClose: false, toastId: 'import-progress' });
-      const data = new Uint8Array(evt.target?.result as ArrayBuffer);
-      const wb = XLSX.read(data, { type: 'array' });
-      const json: any[] = XLSX.utils.sheet_to_json(wb.Sheets[wb.SheetNames[0]], { defval: '' });
-      let successCount = 0, updatedCount = 0, errorCount = 0;
-      const errors: string[] = [];
-      for (let i = 0; i < json.length; i++) {
-        const row = json[i];
-        const rowNum = i + 2;
-        try {
-          const user_id = Number(row.user_id ?? row.id);
-          const first_name = String(row.first_name ?? '').trim();
-          const last_name = String(row.last_name ?? '').trim();
-          const middle_name = String(row.middle_name ?? '').trim();
-          const email_address = String(row.email_address ?? '').trim();
-          const contact_number = String(row.contact_number ?? '').trim();
-          const status = String(row.status ?? 'Active');
-          if (!user_id || !first_name || !last_name || !email_address || !contact_number) {
-            errors.push(`Row ${rowNum}: Missing required fields`); errorCount++; continue;
-          }
-          const existing = accounts.find(a => a.user_id === user_id);
-          if (existing) {
-            await api.put(`/accounts/${user_id}/`, { first_name, last_name, middle_name, email_address, contact_number, status });
-            updatedCount++;
-          } else {
-            await api.post('/create-account/', { user_id, first_name, last_name, middle_name, email_address, contact_number, status, password: `${last_name}@${user_id}`, created_at: new Date().toISOString() });
-            successCount++;
-          }
-          const rolesStr = String(row.roles ?? '').trim();
-          if (rolesStr) {
-            const roleIds = rolesStr.split(';').map((r: string) => Number(r.trim())).filter((r: number) => r > 0);
-            const collegeIds = String(row.colleges ?? '').trim().split(';').map((c: string) => c.trim());
-            const deptIds = String(row.departments ?? '').trim().split(';').map((d: string) => d.trim());
-            const dateStarts = String(row.date_starts ?? '').trim().split(';').map((d: string) => excelSerialToDate(d.trim()));
-            const dateEndeds = String(row.date_endeds ?? '').trim().split(';').map((d: string) => excelSerialToDate(d.trim()));
-            for (let j = 0; j < roleIds.length; j++) {
-              const existingRole = userRoles.find(ur => ur.user === user_id && ur.role === roleIds[j] && ur.college === (collegeIds[j] || null) && ur.department === (deptIds[j] || null));
-              if (existingRole) continue;
-              try {
-                await api.post('/tbl_user_role/CRUD/', { user: user_id, role: roleIds[j], college: collegeIds[j] || null, department: deptIds[j] || null, date_start: dateStarts[j] || null, date_ended: dateEndeds[j] || null, status: 'Active' });
-              } catch (err: any) {
-                errors.push(`Row ${rowNum}: Role ${roleIds[j]} - ${err.response?.data?.detail || err.message}`);
-              }
-            }
-          }
-        } catch (err: any) {
-          errors.push(`Row ${rowNum}: ${err.response?.data?.detail || err.message}`);
-          errorCount++;
-        }
-      }
+    setImportLoading(true);
+    toast.info('Importing accounts...', { autoClose: false, toastId: 'import-progress' });
+    try {
+      // Accounts and their roles are created or updated on the server in one request
+      const result = await importSpreadsheet('users', file);
+      const { errors } = importMessages(result);
       toast.dismiss('import-progress');
-      const msgs = [successCount > 0 && `${successCount} created`, updatedCount > 0 && `${updatedCount} updated`, errorCount > 0 && `${errorCount} failed`].filter(Boolean).join(', ');
+      const msgs = [result.created > 0 && `${result.created} created`, result.updated > 0 && `${result.updated} updated`, errors.length > 0 && `${errors.length} failed`].filter(Boolean).join(', ');
       if (msgs) toast.success(msgs);
       if (errors.length > 0) {
         console.error('Import errors:', errors);
         toast.error(<div style={{ maxHeight: '200px', overflowY: 'auto', fontSize: '12px' }}><strong>Errors:</strong><ul style={{ paddingLeft: '16px', marginTop: '6px' }}>{errors.slice(0, 10).map((e, i) => <li key={i}>{e}</li>)}</ul></div>, { autoClose: 10000 });
       }
       await fetchData(true);
+    } catch (err: any) {
+      toast.dismiss('import-progress');
+      toast.error(err?.response?.data?.error || err.message);
+    } finally {
       setImportLoading(false);
       setShowImportAccountsModal(false);
-    };
-    reader.readAsArrayBuffer(file);
+    }
   };
 
   const handleImportRoles = (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -1290,7 +1247,7 @@ export const UserManagement: React.FC<UserManagementProps> = () => {
               <p className="cl-import-hint">
                 Columns: <strong>user_id, first_name, last_name, middle_name, email_address, contact_number, status, roles, colleges, departments, date_starts, date_endeds</strong>. Separate multiple values with semicolons.
               </p>
-              <input type="file" accept=".xlsx,.xls" onChange={handleImportAccounts} disabled={importLoading} className="cl-file-input" />
+              <input type="file" accept=".xlsx,.xls,.csv" onChange={handleImportAccounts} disabled={importLoading} className="cl-file-input" />
               <p style={{ fontSize: '11.5px', color: 'var(--cl-text-muted)', marginTop: '6px', fontFamily: 'var(--cl-mono)' }}>
                 Default password format: <strong>LastName@UserID</strong>
               </p>
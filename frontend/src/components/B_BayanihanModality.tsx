@@ -163,25 +163,23 @@ const BayanihanModality: React.FC<UserProps> = ({ user }) => {
         console.log('[BL] Total users:', allUsers?.length);
 
         const blUsersFromRoles: any[] = [];
-        // Check first 50 users to find BL ones (limit to avoid too many requests)
-        const usersToCheck = (allUsers || []).slice(0, 50);
-        await Promise.all(
-          usersToCheck.map(async (u: any) => {
-            try {
-              const { data: userRoles } = await api.get(`/user-roles/${u.user_id}/roles/`);
-              const hasBL = userRoles.some((r: any) =>
-                r.status?.toLowerCase() === 'active' &&
-                String(r.role_name || '').toLowerCase().includes('bayanihan')
-              );
-              if (hasBL) {
-                const blRole = userRoles.find((r: any) =>
-                  String(r.role_name || '').toLowerCase().includes('bayanihan')
-                );
-                blUsersFromRoles.push({ user: u, role: blRole });
-              }
-            } catch { /* skip */ }
-          })
-        );
+        // One bulk lookup for everyone's roles
+        const { data: rolesByUser } = await api.post('/user-roles/bulk/', {
+          user_ids: (allUsers || []).map((u: any) => u.user_id),
+        });
+        (allUsers || []).forEach((u: any) => {
+          const userRoles: any[] = rolesByUser?.[u.user_id] || [];
+          const hasBL = userRoles.some((r: any) =>
+            r.status?.toLowerCase() === 'active' &&
+            String(r.role_name || '').toLowerCase().includes('bayanihan')
+          );
+          if (hasBL) {
+            const blRole = userRoles.find((r: any) =>
+              String(r.role_name || '').toLowerCase().includes('bayanihan')
+            );
+            blUsersFromRoles.push({ user: u, role: blRole });
+          }
+        });
         console.log('[BL] BL users found via roles endpoint:', blUsersFromRoles.length);
 
         // Filter by college/department match
@@ -232,13 +230,13 @@ const BayanihanModality: React.FC<UserProps> = ({ user }) => {
 
       // Normal path: we found BL users from tbl_user_role
       // Now fetch their details and filter by college/department
+      const { data: rolesByUser } = await api.post('/user-roles/bulk/', { user_ids: blUserIds });
       const leaderDetails = await Promise.all(
         blUserIds.map(async (userId: any) => {
           try {
-            // Get this user's roles using the known-working endpoint
-            const [{ data: userData }, { data: userRoles }, { data: modalities }] = await Promise.all([
+            const userRoles: any[] = rolesByUser?.[userId] || [];
+            const [{ data: userData }, { data: modalities }] = await Promise.all([
               api.get(`/users/${userId}/`),
-              api.get(`/user-roles/${userId}/roles/`),
               api.get('/tbl_modality/', { params: { user_id: userId } }),
             ]);
 
@@ -899,26 +897,25 @@ const BayanihanModality: React.FC<UserProps> = ({ user }) => {
 
         const senderFullName = [user?.first_name, user?.last_name].filter(Boolean).join(' ') || 'A Bayanihan Leader';
 
-        const { data: allUsers } = await api.get('/users/');
+        const { data: allUsers } = await api.get('/users/', { params: { fields: 'user_id' } });
         const schedulerUserIds: number[] = [];
 
-        await Promise.all(
-          (allUsers || []).map(async (u: any) => {
-            try {
-              const { data: uRoles } = await api.get(`/user-roles/${u.user_id}/roles/`);
-              const isMatch = (uRoles || []).some((r: any) => {
-                const roleName = String(r.role_name || '').toLowerCase();
-                const roleCollege = String(r.college?.college_id || r.college_id || '');
-                return (
-                  roleName === 'scheduler' &&
-                  r.status?.toLowerCase() === 'active' &&
-                  (!myCollegeId || roleCollege === myCollegeId)
-                );
-              });
-              if (isMatch) schedulerUserIds.push(u.user_id);
-            } catch { /* skip */ }
-          })
-        );
+        const { data: rolesByUser } = await api.post('/user-roles/bulk/', {
+          user_ids: (allUsers || []).map((u: any) => u.user_id),
+        });
+        (allUsers || []).forEach((u: any) => {
+          const uRoles: any[] = rolesByUser?.[u.user_id] || [];
+          const isMatch = uRoles.some((r: any) => {
+            const roleName = String(r.role_name || '').toLowerCase();
+            const roleCollege = String(r.college?.college_id || r.college_id || '');
+            return (
+              roleName === 'scheduler' &&
+              r.status?.toLowerCase() === 'active' &&
+              (!myCollegeId || roleCollege === myCollegeId)
+            );
+          });
+          if (isMatch) schedulerUserIds.push(u.user_id);
+        });
 
         await Promise.all(
           schedulerUserIds.map((schedulerId: number) =>
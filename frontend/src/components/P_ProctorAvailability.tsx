@@ -267,18 +267,17 @@ const ProctorSetAvailability: React.FC<ProctorSetAvailabilityProps> = ({ user })
     const userId = user?.user_id;
     if (!userId) { toast.info('User is not logged in.'); setIsSubmitting(false); return; }
     try {
-      const postPromises = selectedDates.flatMap(day =>
-        selectedTimeSlots.map(slot =>
-          api.post('/tbl_availability/', {
-            days: [day], time_slots: [slot],
-            status: availabilityStatus || 'available',
-            remarks: remarks || null, user_id: userId,
-          })
-        )
+      const items = selectedDates.flatMap(day =>
+        selectedTimeSlots.map(slot => ({
+          days: [day], time_slots: [slot],
+          status: availabilityStatus || 'available',
+          remarks: remarks || null, user_id: userId,
+        }))
       );
-      const results = await Promise.allSettled(postPromises);
-      const succeeded = results.filter(r => r.status === 'fulfilled').length;
-      const failed = results.length - succeeded;
+      // One request for every day/slot pair; the server saves them all or none
+      const { data: bulkResult } = await api.post('/tbl_availability/bulk/', { items });
+      const succeeded: number = bulkResult?.created ?? 0;
+      const failed = items.length - succeeded;
       if (succeeded > 0) {
         toast.success('Availability set successfully!');
         const newEntries = selectedDates.flatMap(day =>
@@ -47,8 +47,10 @@ const SchedulerPlottingSchedule: React.FC<SchedulerProps> = ({ user, onScheduleC
 
   const [examPeriods, setExamPeriods] = useState<any[]>([]);
   const [modalities, setModalities] = useState<any[]>([]);
+  const [bootstrapModalities, setBootstrapModalities] = useState<any[]>([]);
   const [programs, setPrograms] = useState<any[]>([]);
   const [courses, setCourses] = useState<any[]>([]);
+  const [bootstrapCourses, setBootstrapCourses] = useState<any[]>([]);
   const [terms, setTerms] = useState<any[]>([]);
   const [sectionCourses, setSectionCourses] = useState<any[]>([]);
   const [userCollegeIds, setUserCollegeIds] = useState<string[]>([]);
@@ -90,6 +92,9 @@ const SchedulerPlottingSchedule: React.FC<SchedulerProps> = ({ user, onScheduleC
   const minutes = String(duration.minutes).padStart(2, '0');
   const formattedDuration = `${hours}:${minutes}:00`;
 
+  // Loads the screen's data in one /scheduler/bootstrap/ request per college
+  // the scheduler is assigned to; courses and modalities are then narrowed
+  // to the selection locally instead of being fetched again
   useEffect(() => {
     const fetchAll = async () => {
       if (!user?.user_id) {
@@ -97,10 +102,6 @@ const SchedulerPlottingSchedule: React.FC<SchedulerProps> = ({ user, onScheduleC
       }
 
       try {
-        const collegesResponse = await api.get('/tbl_college/');
-        const allColleges = collegesResponse.data;
-        setCollegesCache(allColleges || []);
-
         const userRolesResponse = await api.get('/tbl_user_role', {
           params: {
             user_id: user.user_id,
@@ -125,107 +126,34 @@ const SchedulerPlottingSchedule: React.FC<SchedulerProps> = ({ user, onScheduleC
           return;
         }
 
-        let schedulerCollegeName = "";
-        if (collegeIds.length > 0) {
-          const schedulerCollege = allColleges.find(
-            (c: any) => String(c.college_id) === collegeIds[0]
-          );
-          schedulerCollegeName = schedulerCollege?.college_name || "";
-          setSchedulerCollegeName(schedulerCollegeName);
-        }
-
-        const [
-          examPeriodsResponse,
-          departmentsResponse,
-          programsResponse,
-          termsResponse,
-          sectionCoursesResponse,
-          roomsResponse,
-          buildingsResponse,
-        ] = await Promise.all([
-          api.get('/tbl_examperiod'),
-          api.get('/departments/'),
-          api.get('/programs/'),
-          api.get('/tbl_term'),
-          api.get('/tbl_sectioncourse/'),
-          api.get('/tbl_rooms'),
-          api.get('/tbl_buildings'),
-        ]);
-
-        const allExamPeriods = examPeriodsResponse.data;
-        const allDepartments = departmentsResponse.data;
-        const allPrograms = programsResponse.data;
-        const trms = termsResponse.data;
-        const sectCourses = sectionCoursesResponse.data;
-        const rooms = roomsResponse.data;
-        const buildings = buildingsResponse.data;
-
-        const filteredDepartments = (allDepartments || []).filter((d: any) =>
-          collegeIds.includes(String(d.college_id))
-        );
-
-        const allowedDeptIds = filteredDepartments.map((d: any) =>
-          String(d.department_id)
-        );
-
-        const filteredPrograms = (allPrograms || []).filter((p: any) =>
-          allowedDeptIds.includes(String(p.department_id))
-        );
-
-        const filteredExamPeriods = (allExamPeriods || []).filter((p: any) =>
-          collegeIds.includes(String(p.college_id))
-        );
-
-        const filteredSectCourses = (sectCourses || []).filter((sc: any) => {
-          const program = filteredPrograms.find((p: any) => p.program_id === sc.program_id);
-          return program !== undefined;
-        });
-
-        setExamPeriods(filteredExamPeriods);
-        setDepartments(filteredDepartments);
-        setPrograms(filteredPrograms);
-        setTerms(trms || []);
-        setSectionCourses(filteredSectCourses);
-        setRoomsCache(rooms || []);
-        setBuildingsCache(buildings || []);
-
-        const proctorRolesResponse = await api.get('/tbl_user_role', {
-          params: {
-            role_id: 5,
-          },
-        });
+        const bootstraps: any[] = (await Promise.all(
+          collegeIds.map(collegeId => api.get('/scheduler/bootstrap/', { params: { college_id: collegeId } }))
+        )).map(response => response.data);
 
-        const allProctorRoles = proctorRolesResponse.data || [];
-
-        const filteredProctorRoles = allProctorRoles.filter((p: any) => {
-          if (p.college_id && collegeIds.includes(String(p.college_id))) {
-            return true;
-          }
-          if (p.department_id) {
-            const dept = allDepartments?.find(
-              (d: any) =>
-                String(d.department_id) === String(p.department_id)
-            );
-            if (dept && collegeIds.includes(String(dept.college_id))) {
-              return true;
-            }
-          }
-          return false;
-        });
-
-        const proctorUserIds = Array.from(
-          new Set(filteredProctorRoles.map((p: any) => p.user_id).filter(Boolean))
-        );
+        // Rooms, buildings and terms aren't college-scoped: the same in every payload
+        const [first] = bootstraps;
+        const merged = (key: string, id: string) => {
+          const rows = new Map<any, any>();
+          bootstraps.forEach(b => (b[key] || []).forEach((row: any) => rows.set(row[id], row)));
+          return Array.from(rows.values());
+        };
 
-        const usersResponse = await api.get('/users/');
-        const allUsers = usersResponse.data;
+        setCollegesCache(bootstraps.map(b => b.college));
+        setSchedulerCollegeName(first.college?.college_name || "");
 
-        const userDetails = allUsers.filter((u: any) =>
-          proctorUserIds.includes(u.user_id)
-        );
+        setExamPeriods(merged('exam_periods', 'examperiod_id'));
+        setDepartments(merged('departments', 'department_id'));
+        setPrograms(merged('programs', 'program_id'));
+        setTerms(first.terms || []);
+        setSectionCourses(merged('section_courses', 'id'));
+        setRoomsCache(first.rooms || []);
+        setBuildingsCache(first.buildings || []);
+        setBootstrapCourses(merged('courses', 'course_id'));
+        setBootstrapModalities(merged('modalities', 'modality_id'));
 
-        setAllCollegeUsers(userDetails || []);
-        setProctors(userDetails || []);
+        const proctors = merged('proctors', 'user_id');
+        setAllCollegeUsers(proctors);
+        setProctors(proctors);
 
       } catch (err: any) {
         alert("Failed to fetch data");
@@ -236,67 +164,29 @@ const SchedulerPlottingSchedule: React.FC<SchedulerProps> = ({ user, onScheduleC
   }, [user]);
 
   useEffect(() => {
-    const fetchCoursesLazy = async () => {
-      if (formData.selectedPrograms.length === 0) {
-        setCourses([]);
-        return;
-      }
-
-      try {
-        const relevantSections = sectionCourses.filter(sc =>
-          formData.selectedPrograms.includes(sc.program_id)
-        );
-
-        const courseIds = Array.from(new Set(relevantSections.map(sc => sc.course_id)));
-
-        if (courseIds.length === 0) {
-          setCourses([]);
-          return;
-        }
-
-        const coursesResponse = await api.get('/courses/');
-        const allCourses = coursesResponse.data || [];
-
-        const filteredCourses = allCourses.filter((c: any) => courseIds.includes(c.course_id));
-
-        setCourses(filteredCourses);
-      } catch (error) {
-        setCourses([]);
-      }
-    };
+    if (formData.selectedPrograms.length === 0) {
+      setCourses([]);
+      return;
+    }
 
-    fetchCoursesLazy();
-  }, [formData.selectedPrograms, sectionCourses]);
+    const courseIds = new Set(
+      sectionCourses
+        .filter(sc => formData.selectedPrograms.includes(sc.program_id))
+        .map(sc => sc.course_id)
+    );
+    setCourses(bootstrapCourses.filter((c: any) => courseIds.has(c.course_id)));
+  }, [formData.selectedPrograms, sectionCourses, bootstrapCourses]);
 
   useEffect(() => {
-    const fetchModalitiesLazy = async () => {
-      if (formData.selectedPrograms.length === 0 || formData.selectedCourses.length === 0) {
-        setModalities([]);
-        return;
-      }
-
-      try {
-        const params = {
-          program_id: formData.selectedPrograms.join(','),
-          course_id: formData.selectedCourses.join(',')
-        };
-
-        const modalitiesResponse = await api.get('/tbl_modality/', { params });
-        const mods = modalitiesResponse.data || [];
-
-        const filteredMods = mods.filter((m: any) => {
-          const isAllowedProgram = formData.selectedPrograms.includes(m.program_id);
-          return isAllowedProgram;
-        });
-
-        setModalities(filteredMods);
-      } catch (error) {
-        setModalities([]);
-      }
-    };
+    if (formData.selectedPrograms.length === 0 || formData.selectedCourses.length === 0) {
+      setModalities([]);
+      return;
+    }
 
-    fetchModalitiesLazy();
-  }, [formData.selectedPrograms, formData.selectedCourses, programs, departments, collegesCache, schedulerCollegeName]);
+    setModalities(bootstrapModalities.filter((m: any) =>
+      formData.selectedPrograms.includes(m.program_id) && formData.selectedCourses.includes(m.course_id)
+    ));
+  }, [formData.selectedPrograms, formData.selectedCourses, bootstrapModalities]);
 
   useEffect(() => {
     const checkExistingSchedules = async () => {
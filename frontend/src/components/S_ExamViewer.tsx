@@ -246,6 +246,7 @@ const SchedulerView: React.FC<SchedulerViewProps> = ({ user }) => {
   const [collegeDataReady, setCollegeDataReady] = useState(false);
   const exportRef = useRef<HTMLDivElement>(null);
   const [schedulerCollegeId, setSchedulerCollegeId] = useState<string>("");
+  const viewerVersionRef = useRef<number | null>(null);
   const [showFooterSettings, setShowFooterSettings] = useState(false);
   const [showManualEditor, setShowManualEditor] = useState(false);
   const [manualEditorSections, setManualEditorSections] = useState<any[]>([]);
@@ -638,85 +639,26 @@ const SchedulerView: React.FC<SchedulerViewProps> = ({ user }) => {
 
         setSchedulerCollegeId(schedulerCollegeId);
 
-        const collegeResponse = await api.get(`/tbl_college/${schedulerCollegeId}/`);
-        const collegeName = collegeResponse.data?.college_name;
-        setSchedulerCollegeName(collegeName || "");
-
-        const departmentsResponse = await api.get('/departments/', {
-          params: {
-            college_id: schedulerCollegeId
-          }
+        const viewerResponse = await api.get('/scheduler/viewer/', {
+          params: { college_id: schedulerCollegeId }
         });
+        const viewer = viewerResponse.data;
+        viewerVersionRef.current = viewer.version;
 
-        const departments = departmentsResponse.data;
-        const departmentIds = departments?.map((d: any) => d.department_id) || [];
+        setSchedulerCollegeName(viewer.college?.college_name || "");
 
-        const proctorRolesResponse = await api.get('/tbl_user_role', {
-          params: {
-            role_id: 5
-          }
-        });
+        const proctorIds = new Set<number>(viewer.proctor_ids || []);
+        const collegeProctors = (viewer.users || []).filter((u: any) => proctorIds.has(u.user_id));
+        setAllCollegeUsers(collegeProctors);
+        setProctors(collegeProctors);
+        setUsers(viewer.users || []);
 
-        const proctorRoles = proctorRolesResponse.data;
-        if (!proctorRoles || proctorRoles.length === 0) {
-          setAllCollegeUsers([]);
-          setIsLoadingData(false);
-          return;
+        if (viewer.dean) {
+          setDeanInfo(viewer.dean);
         }
 
-        const matchingUserIds = new Set<number>();
-
-        proctorRoles.forEach((p: any) => {
-          let matches = false;
-
-          if (p.college_id && String(p.college_id) === String(schedulerCollegeId)) {
-            matches = true;
-          }
-          else if (p.department_id && departmentIds.includes(p.department_id)) {
-            matches = true;
-          }
-
-          if (!matches) {
-          }
-
-          if (matches) {
-            matchingUserIds.add(p.user_id);
-          }
-        });
-
-        const usersResponse = await api.get('/users/');
-        const allUsers = usersResponse.data;
-        const userDetails = allUsers.filter((u: any) => matchingUserIds.has(u.user_id));
-
-        setAllCollegeUsers(userDetails || []);
-        setProctors(userDetails || []);
-
-        setUsers((prevUsers) => {
-          const existingUserIds = new Set(prevUsers.map(u => u.user_id));
-          const newUsers = (userDetails || []).filter((u: { user_id: number; }) => !existingUserIds.has(u.user_id));
-          return [...prevUsers, ...newUsers];
-        });
-
-        const deanRoleResponse = await api.get('/tbl_user_role', {
-          params: {
-            college_id: schedulerCollegeId,
-            role_id: 1
-          }
-        });
-
-        const deanRoles = deanRoleResponse.data;
-        if (deanRoles && deanRoles.length > 0) {
-          const deanRole = deanRoles[0];
-          const deanUserResponse = await api.get(`/users/`);
-          const deanUser = deanUserResponse.data.find((u: any) => u.user_id === deanRole.user_id);
-
-          if (deanUser) {
-            setDeanInfo({
-              name: `${deanUser.first_name} ${deanUser.last_name}`,
-              user_id: deanUser.user_id
-            });
-          }
-        }
+        setExamData(viewer.exams || []);
+        setIsScheduleLoading(false);
 
         setIsLoadingData(false);
         setCollegeDataReady(true);
@@ -728,45 +670,48 @@ const SchedulerView: React.FC<SchedulerViewProps> = ({ user }) => {
     fetchSchedulerData();
   }, [user]);
 
+  // After the full load above, polls /scheduler/viewer/ for exams changed
+  // since the last response and merges them in; ids missing from exam_ids
+  // were deleted
   useEffect(() => {
     if (!collegeDataReady) return;
 
-    const fetchData = async () => {
+    const fetchChanges = async () => {
       try {
-        const examParams: any = {};
-        if (schedulerCollegeName && schedulerCollegeName !== "Add schedule first") {
-          examParams.college_name = schedulerCollegeName;
-        }
-
-        const [examsResponse, usersResponse] = await Promise.all([
-          api.get('/tbl_examdetails', { params: examParams }),
-          api.get('/users/')
-        ]);
-
-        if (examsResponse.data) {
-
-          const invalidSchedules = examsResponse.data.filter((e: ExamDetail) =>
-            !e.room_id || !e.exam_start_time || !e.exam_end_time
-          );
-
-          if (invalidSchedules.length > 0) {
-          }
+        const response = await api.get('/scheduler/viewer/', {
+          params: { college_id: schedulerCollegeId, changed_since: viewerVersionRef.current }
+        });
+        const viewer = response.data;
+        viewerVersionRef.current = viewer.version;
 
-          setExamData(examsResponse.data);
-        }
+        const changed = new Map<number, ExamDetail>(
+          (viewer.exams || []).map((e: ExamDetail): [number, ExamDetail] => [e.examdetails_id!, e])
+        );
+        const current = new Set<number>(viewer.exam_ids || []);
+        setExamData(prev => {
+          const merged = prev
+            .filter(e => e.examdetails_id !== undefined && current.has(e.examdetails_id))
+            .map(e => changed.get(e.examdetails_id!) ?? e);
+          const known = new Set(merged.map(e => e.examdetails_id));
+          changed.forEach((exam, id) => {
+            if (!known.has(id)) merged.push(exam);
+          });
+          return merged;
+        });
 
-        if (usersResponse.data) {
-          setUsers(usersResponse.data);
+        if (viewer.users?.length) {
+          setUsers(prev => {
+            const fresh = new Map<number, any>(viewer.users.map((u: any) => [u.user_id, u]));
+            return [...prev.filter(u => !fresh.has(u.user_id)), ...fresh.values()];
+          });
         }
-        setIsScheduleLoading(false);
       } catch (error) {
       }
     };
 
-    fetchData();
-    const interval = setInterval(fetchData, 2000);
+    const interval = setInterval(fetchChanges, 2000);
     return () => clearInterval(interval);
-  }, [user, schedulerCollegeName, collegeDataReady]);
+  }, [schedulerCollegeId, collegeDataReady]);
 
   useEffect(() => {
     const checkApprovalStatus = async () => {
@@ -1878,7 +1823,7 @@ const SchedulerView: React.FC<SchedulerViewProps> = ({ user }) => {
             <button type="button" className="nav-panel-close" onClick={() => setActivePanel(null)}>✕</button>
           </div>
           <div className="nav-panel-body">
-            <ExportSchedule onClose={() => setActivePanel(null)} collegeName={collegeName} />
+            <ExportSchedule onClose={() => setActivePanel(null)} collegeName={collegeName} approvalStatus={approvalStatus} />
           </div>
         </div>
       </div>
@@ -2,7 +2,8 @@ import React, { useState, useEffect, useRef } from "react";
 import { toast } from "react-toastify";
 import jsPDF from "jspdf";
 import html2canvas from "html2canvas";
-import { FaRegStopCircle, FaFilePdf, FaCheckCircle, FaSync } from "react-icons/fa";
+import { FaRegStopCircle, FaFilePdf, FaFileExcel, FaFileCsv, FaCheckCircle, FaSync } from "react-icons/fa";
+import { api } from "../lib/apiClient.ts";
 
 interface ExportScheduleProps {
   onClose: () => void;
@@ -270,6 +271,7 @@ const ExportSchedule: React.FC<ExportScheduleProps> = ({
   }[]>([]);
   const [loadingPreviews, setLoadingPreviews] = useState(false);
   const [activeThumb,     setActiveThumb]     = useState<number | null>(null);
+  const [downloading,     setDownloading]     = useState<string | null>(null);
 
   const stopExport = useRef(false);
 
@@ -373,6 +375,30 @@ const ExportSchedule: React.FC<ExportScheduleProps> = ({
     pdf.restoreGraphicsState();
   };
 
+  /* ── approved schedule: rendered and cached on the server ── */
+  const downloadApproved = async (format: "pdf" | "xlsx" | "csv") => {
+    setDownloading(format);
+    try {
+      const response = await api.get(`/schedule-export/${format}/`, {
+        params:       { college_name: collegeName },
+        responseType: "blob",
+        timeout:      300000,
+      });
+      const safe = collegeName.replace(/[^a-zA-Z0-9_-]/g, "_");
+      const url  = URL.createObjectURL(response.data);
+      const link = document.createElement("a");
+      link.href     = url;
+      link.download = `${safe}_Schedule_APPROVED.${format}`;
+      link.click();
+      URL.revokeObjectURL(url);
+    } catch (err) {
+      console.error(err);
+      toast.error(`Could not download the ${format.toUpperCase()} export.`);
+    } finally {
+      setDownloading(null);
+    }
+  };
+
   /* ── export ── */
   const exportToPDF = async () => {
     const allCards = Array.from(
@@ -464,6 +490,39 @@ const ExportSchedule: React.FC<ExportScheduleProps> = ({
         </div>
       )}
 
+      {/* server-side downloads of the approved schedule */}
+      {approvalStatus === "approved" && (
+        <div style={S.sectionHeader}>
+          <p style={S.sectionTitle}>Download approved schedule</p>
+          <div style={S.btnRow}>
+            <button
+              type="button"
+              disabled={downloading !== null}
+              style={{ ...S.smallBtn("red"), display: "flex", alignItems: "center", gap: 4 }}
+              onClick={() => downloadApproved("pdf")}
+            >
+              <FaFilePdf style={{ fontSize: 10 }} /> {downloading === "pdf" ? "…" : "PDF"}
+            </button>
+            <button
+              type="button"
+              disabled={downloading !== null}
+              style={{ ...S.smallBtn("green"), display: "flex", alignItems: "center", gap: 4 }}
+              onClick={() => downloadApproved("xlsx")}
+            >
+              <FaFileExcel style={{ fontSize: 10 }} /> {downloading === "xlsx" ? "…" : "Excel"}
+            </button>
+            <button
+              type="button"
+              disabled={downloading !== null}
+              style={{ ...S.smallBtn("green"), background: "#0f4c8a", display: "flex", alignItems: "center", gap: 4 }}
+              onClick={() => downloadApproved("csv")}
+            >
+              <FaFileCsv style={{ fontSize: 10 }} /> {downloading === "csv" ? "…" : "CSV"}
+            </button>
+          </div>
+        </div>
+      )}
+
       {/* header row */}
       <div style={S.sectionHeader}>
         <p style={S.sectionTitle}>
@@ -391,9 +391,9 @@ const SchedulerAvailability: React.FC<ProctorSetAvailabilityProps> = ({ user })
                 toast.success('Updated!');
             } else {
                 if (!selectedInstructors.length) { toast.error('Select at least one instructor.'); setIsSubmitting(false); return; }
-                await Promise.all(selectedInstructors.map(inst =>
-                    api.post('/tbl_availability/', { days: selectedDate, time_slots: selectedTimeSlot, status: availabilityStatus, remarks: remarks || null, user_id: inst.value })
-                ));
+                await api.post('/tbl_availability/bulk/', {
+                    items: selectedInstructors.map(inst => ({ days: selectedDate, time_slots: selectedTimeSlot, status: availabilityStatus, remarks: remarks || null, user_id: inst.value })),
+                });
                 toast.success('Availability submitted!');
             }
             setShowModal(false);
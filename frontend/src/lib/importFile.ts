@@ -0,0 +1,34 @@
+// exam-sync-v2/frontend/src/lib/importFile.ts
+
+import { api } from './apiClient.ts';
+
+export type ImportResource = 'rooms' | 'courses' | 'section_courses' | 'users';
+
+export interface ImportResult {
+  resource: ImportResource;
+  created: number;
+  updated: number;
+  skipped: number;
+  errors: { row: number; error: string }[];
+  warnings: { row: number; warning: string }[];
+  dry_run: boolean;
+}
+
+// Send a CSV/XLSX template to the server-side importer in a single request.
+export async function importSpreadsheet(resource: ImportResource, file: File): Promise<ImportResult> {
+  const formData = new FormData();
+  formData.append('file', file);
+  const { data } = await api.post<ImportResult>(`/import/${resource}/`, formData, {
+    headers: { 'Content-Type': 'multipart/form-data' },
+    timeout: 300000,
+  });
+  return data;
+}
+
+// "Row N: ..." lines for the console / error toasts
+export function importMessages(result: ImportResult): { errors: string[]; warnings: string[] } {
+  return {
+    errors: result.errors.map(e => `Row ${e.row}: ${e.error}`),
+    warnings: result.warnings.map(w => `Row ${w.row}: ${w.warning}`),
+  };
+}